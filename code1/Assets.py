@@ -0,0 +1,31 @@
+import base64
+import functools
+import os
+
+# Images of the web app, kept as files under assets/ and turned into data URIs only when first asked for.
+
+_assetDirectory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+_assetFiles = {
+    "tent_1": "tent_1.jpg",
+    "tent_2": "tent_2.jpg",
+    "tent_3": "tent_3.jpg",
+    "tent_4": "tent_4.jpg",
+    "tent_5": "tent_5.png",
+    "grass": "grass.png",
+    "grass2": "grass2.png",
+    "grass3": "grass3.jpg",
+    "output_tree1": "output_tree1.jpg",
+    "output_tree2": "output_tree2.png",
+    "output_tree3": "output_tree3.jpg",
+    "input_tree": "input_tree.png",
+    "input_tree2": "input_tree2.png",
+}
+_mimeTypes = {".png": "image/png", ".jpg": "image/jpeg"}
+
+
+@functools.lru_cache(maxsize=None)
+def AssetUrl(name): # data URI of an asset, read and encoded the first time it is used
+    fileName = _assetFiles[name]
+    with open(os.path.join(_assetDirectory, fileName), 'rb') as file:
+        data = file.read()
+    return "data:" + _mimeTypes[os.path.splitext(fileName)[1]] + ";base64," + base64.b64encode(data).decode("ascii")
@@ -0,0 +1,141 @@
+import argparse
+import concurrent.futures
+import functools
+import glob
+import json
+import os
+import signal
+import sys
+import time
+
+from PuzzleCorpus import PuzzleCorpus, corpusSuffix
+from PuzzleParser import ReadPuzzleFile
+from SolveCache import IsFinal, PersistentSolveCache
+from Solver import solve, RuleProfile
+
+
+def FindPuzzles(patterns):
+    # A directory stands for the input*.txt files in it, anything else is a glob pattern.
+    # A corpus file expands to one (fileName, index) entry per puzzle, a text file stands for itself.
+    puzzles = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            fileNames = sorted(glob.glob(os.path.join(pattern, "input*.txt")))
+        else:
+            fileNames = sorted(glob.glob(pattern))
+        for fileName in fileNames:
+            if fileName.endswith(corpusSuffix):
+                puzzles.extend((fileName, index) for index in range(len(PuzzleCorpus(fileName))))
+            else:
+                puzzles.append(fileName)
+    return puzzles
+
+@functools.lru_cache(maxsize=8)
+def OpenCorpus(fileName):
+    # one memory map per corpus and worker process; the processes share the file pages
+    return PuzzleCorpus(fileName)
+
+@functools.lru_cache(maxsize=4)
+def OpenSolveCache(fileName):
+    # one connection per cache file and worker process; SQLite serializes their writes
+    return PersistentSolveCache(fileName)
+
+def ReadPuzzle(puzzle):
+    if isinstance(puzzle, tuple):
+        (fileName, index) = puzzle
+        return OpenCorpus(fileName)[index]
+    return ReadPuzzleFile(puzzle)
+
+class PuzzleTimeout(Exception):
+    pass
+
+def _raiseTimeout(signalNumber, frame):
+    raise PuzzleTimeout()
+
+searchTimeShare = 0.9 # share of the timeout given to the search or SAT run, which stop themselves at their timeLimit
+
+def SolveWithin(treeMap, topHints, leftHints, timeout=None, **options):
+    # solve() with timeLimit set to searchTimeShare of timeout. A process pool cannot cancel a running task, so the
+    # worker also interrupts itself with SIGALRM at timeout where it exists, raising PuzzleTimeout; the alarm
+    # is a backstop for the rules, which do not watch the clock, and is off again when this returns.
+    if timeout is None:
+        return solve(treeMap, topHints, leftHints, **options)
+    hasAlarm = hasattr(signal, "SIGALRM")
+    if hasAlarm:
+        signal.signal(signal.SIGALRM, _raiseTimeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return solve(treeMap, topHints, leftHints, timeLimit=searchTimeShare * timeout, **options)
+    finally:
+        if hasAlarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+def SolvePuzzle(puzzle, timeout=None, search=False, engine="rules", isProfiled=False, cacheFile=None):
+    # Solve one puzzle file or corpus entry and return its JSON record. Whether the alarm or the time limit of
+    # the search stops it, a puzzle out of time gets the status "timeout".
+    record = {"file": puzzle[0], "index": puzzle[1]} if isinstance(puzzle, tuple) else {"file": puzzle}
+    startTime = time.perf_counter()
+    try:
+        (treeMap, topHints, leftHints) = ReadPuzzle(puzzle)
+        profile = RuleProfile() if isProfiled else None
+        # a cached answer has no rule counters; the cache is read and written outside the alarm, so it never
+        # interrupts an SQLite write
+        cache = None if cacheFile is None or isProfiled else OpenSolveCache(cacheFile)
+        results = None if cache is None else cache.get(treeMap, topHints, leftHints, search=search, engine=engine)
+        if results is None:
+            results = SolveWithin(treeMap, topHints, leftHints, timeout, search=search, engine=engine, profile=profile)
+            if cache is not None:
+                cache.put(treeMap, topHints, leftHints, results, search=search, engine=engine)
+        last = results[-1]
+        if isinstance(last, str): # the input failed checkIsValid
+            record.update(status="invalid", steps=0, message=last.replace("<br>: ", ""))
+        elif not IsFinal(results): # the search or SAT run hit its limit
+            record.update(status="timeout", steps=len(results), message=last.message)
+        else:
+            record.update(status="solved" if last.isSolved else "unsolved", steps=len(results), message=last.message)
+        if isProfiled:
+            record["rules"] = profile.summary()
+    except PuzzleTimeout:
+        record.update(status="timeout", steps=None, message="stopped after " + str(timeout) + " seconds")
+    except Exception as error:
+        record.update(status="error", steps=None, message=type(error).__name__ + ": " + str(error))
+    record["time"] = round(time.perf_counter() - startTime, 6)
+    return record
+
+def SolveChunk(puzzles, timeout=None, search=False, engine="rules", isProfiled=False, cacheFile=None):
+    return [SolvePuzzle(puzzle, timeout, search, engine, isProfiled, cacheFile) for puzzle in puzzles]
+
+def SolvePuzzles(puzzles, workers=None, chunkSize=4, timeout=None, search=False, engine="rules", isProfiled=False, cacheFile=None):
+    # Yield one record per puzzle as its chunk finishes, in completion order
+    chunks = [puzzles[i:i + chunkSize] for i in range(0, len(puzzles), chunkSize)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(SolveChunk, chunk, timeout, search, engine, isProfiled, cacheFile) for chunk in chunks]
+        for future in concurrent.futures.as_completed(futures):
+            yield from future.result()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve many Tents and Trees puzzle files in parallel, one JSON line per puzzle.")
+    parser.add_argument("paths", nargs="+", help="puzzle files, " + corpusSuffix + " corpora, glob patterns, or directories of input*.txt files")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=4, help="puzzles sent to a worker at a time")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds allowed per puzzle")
+    parser.add_argument("--search", action="store_true", help="finish stalled puzzles with the backtracking search")
+    parser.add_argument("--engine", choices=("rules", "sat", "bitboard"), default="rules")
+    parser.add_argument("--profile", action="store_true", help="add the per-rule counters of solve() to every record")
+    parser.add_argument("--cache", default=None, help="SQLite file of solve results shared across runs, keyed up to rotation and reflection")
+    parser.add_argument("-o", "--output", default=None, help="JSON lines file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    puzzles = FindPuzzles(args.paths)
+    output = sys.stdout if args.output is None else open(args.output, 'w', encoding="utf-8")
+    try:
+        for record in SolvePuzzles(puzzles, args.workers, max(1, args.chunk_size), args.timeout, args.search, args.engine, args.profile, args.cache):
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+import argparse
+import datetime
+import glob
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+import Solver
+from Generator import PlantSolution
+from PuzzleParser import ReadPuzzleFile
+
+defaultSizes = [10, 25, 50, 75, 100]
+
+
+def RandomPuzzle(size, seed=0, density=0.2):
+    # a square board with a planted solution; unlike GeneratePuzzle, its solution need not be unique,
+    # which keeps boards up to 100x100 cheap to make
+    (tentMask, treeMask, _) = PlantSolution(size, size, np.random.default_rng(seed), density)
+    return (treeMask.view(np.uint8), tentMask.sum(axis=0), tentMask.sum(axis=1))
+
+def Workloads(inputPattern="input*.txt", sizes=defaultSizes, seed=0):
+    # (name, (treeMap, topHints, leftHints)) for the bundled inputs, then one generated board per size
+    for fileName in sorted(glob.glob(inputPattern)):
+        yield (fileName, ReadPuzzleFile(fileName))
+    for size in sizes:
+        yield ("random" + str(size) + "x" + str(size), RandomPuzzle(size, seed))
+
+def RunSolve(puzzle, search, profile=None, engine="rules"):
+    (treeMap, topHints, leftHints) = puzzle
+    return Solver.solve(treeMap, topHints, leftHints, search=search, engine=engine, profile=profile)
+
+def BenchmarkPuzzle(puzzle, repeat=3, search=False, engine="rules"):
+    # end-to-end times, the rule profile of the fastest run, and peak traced memory of one more run
+    totalTimes = []
+    ruleTimes = None
+    for _ in range(repeat):
+        profile = Solver.RuleProfile()
+        startTime = time.perf_counter()
+        results = RunSolve(puzzle, search, profile, engine)
+        totalTimes.append(time.perf_counter() - startTime)
+        if totalTimes[-1] == min(totalTimes):
+            ruleTimes = profile.summary()
+
+    tracemalloc.start()
+    try:
+        RunSolve(puzzle, search, engine=engine)
+        (_, peakMemory) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    last = results[-1]
+    return {
+        "shape": list(puzzle[0].shape),
+        "steps": len(results),
+        "solved": not isinstance(last, str) and last.isSolved,
+        "time": {"min": min(totalTimes), "median": statistics.median(totalTimes), "runs": totalTimes},
+        "rules": ruleTimes,
+        "peakMemory": peakMemory,
+    }
+
+def GitCommit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def RunBenchmarks(inputPattern="input*.txt", sizes=defaultSizes, seed=0, repeat=3, search=False, progress=None, engine="rules"):
+    report = {
+        "commit": GitCommit(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "search": search,
+        "engine": engine,
+        "seed": seed,
+        "puzzles": {},
+    }
+    for (name, puzzle) in Workloads(inputPattern, sizes, seed):
+        report["puzzles"][name] = BenchmarkPuzzle(puzzle, repeat, search, engine)
+        if progress is not None:
+            progress(name, report["puzzles"][name])
+    return report
+
+def CompareReports(oldReport, newReport):
+    # (name, old median, new median, new / old) for the puzzles in both reports
+    rows = []
+    for (name, new) in newReport["puzzles"].items():
+        old = oldReport["puzzles"].get(name)
+        if old is not None:
+            rows.append((name, old["time"]["median"], new["time"]["median"], new["time"]["median"] / old["time"]["median"]))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time solve() and its rule passes on the bundled and generated puzzles.")
+    parser.add_argument("--inputs", default="input*.txt", help="glob of text puzzles to include")
+    parser.add_argument("--sizes", type=int, nargs="*", default=defaultSizes, help="sizes of the generated square boards")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per puzzle")
+    parser.add_argument("--search", action="store_true", help="let solve() finish stalled boards by search")
+    parser.add_argument("--engine", choices=("rules", "sat", "bitboard"), default="rules", help="the engine of solve() to time")
+    parser.add_argument("-o", "--output", default=None, help="JSON file for the results")
+    parser.add_argument("--compare", default=None, help="JSON results of an earlier run to compare with")
+    args = parser.parse_args(argv)
+
+    def progress(name, result):
+        print(f"{name:>16} {result['time']['median'] * 1000:10.2f} ms {result['peakMemory'] / 1024:10.1f} KiB", file=sys.stderr)
+
+    report = RunBenchmarks(args.inputs, args.sizes, args.seed, max(1, args.repeat), args.search, progress, args.engine)
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=1)
+        print()
+    else:
+        with open(args.output, 'w', encoding="utf-8") as file:
+            json.dump(report, file, indent=1)
+
+    if args.compare is not None:
+        with open(args.compare, 'r', encoding="utf-8") as file:
+            oldReport = json.load(file)
+        print(f"{'puzzle':>16} {'old ms':>10} {'new ms':>10} {'ratio':>7}", file=sys.stderr)
+        for (name, oldTime, newTime, ratio) in CompareReports(oldReport, report):
+            print(f"{name:>16} {oldTime * 1000:10.2f} {newTime * 1000:10.2f} {ratio:7.2f}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,596 @@
+import functools
+import time
+import numpy as np
+
+from Solver import (CellType, MapHistory, MapSnapshot, RunRule, checkIsValid, checkIsSolved, logStatus, seePresentState,
+                    DeepCopyArray, LinePlacements, LineTentRange, MatchedCellTypes, PairTreeGraph)
+
+# The rules of Solver.py on a board kept as bitsets: one Python int per row and per column for each of trees,
+# tents and grass, a cell in none of them being notSet. A neighbour rule shifts and ORs whole rows, line counts
+# are popcounts (int.bit_count), and copying a board copies a few lists of ints, so the search keeps a copy
+# per node instead of an undo trail. solve(engine="bitboard") runs the whole pipeline on it, step for step
+# like the rules engine; rules always sweep the whole board, since the sweeps are cheap here.
+
+_planeOfType = {CellType.tree: 0, CellType.tent: 1, CellType.grass: 2} # index of a type in BitBoard lines
+_typeOfPlane = [CellType.tree, CellType.tent, CellType.grass]
+
+
+def _maskLines(mask): # one int per row of a boolean mask, bit c standing for column c
+    packed = np.packbits(mask, axis=1, bitorder="little")
+    return [int.from_bytes(line.tobytes(), "little") for line in packed]
+
+def _lineMask(lines, length): # the boolean mask of one int per row, inverse of _maskLines
+    byteCount = (length + 7) // 8
+    data = b"".join(line.to_bytes(byteCount, "little") for line in lines)
+    packed = np.frombuffer(data, dtype=np.uint8).reshape(len(lines), byteCount)
+    return np.unpackbits(packed, axis=1, count=length, bitorder="little").view(bool)
+
+def LineBits(bits): # the set bit positions of an int, lowest first
+    return [position for (position, digit) in enumerate(bin(bits)[:1:-1]) if digit == "1"]
+
+class BitBoard:
+    # Read like a TentMap by checkIsValid, checkIsSolved, logStatus, RunRule and MapSnapshot (shape, cells,
+    # version, changedCellCount and the line counts), and changed through the methods below. Every change is
+    # written to the row and the column bitsets, so line rules can work on rows and columns alike.
+    def __init__(self, rowCount, columnCount):
+        self._shape = (rowCount, columnCount)
+        self._fulls = ((1 << columnCount) - 1, (1 << rowCount) - 1) # every cell of a row, of a column
+        # _lines[orientation][plane][line], orientation 0 for rows and 1 for columns, plane as in _planeOfType
+        self._lines = ([[0] * rowCount for _ in _typeOfPlane], [[0] * columnCount for _ in _typeOfPlane])
+        self._version = 0 # incremented whenever a cell changes, as in TentMap
+        self._changedCellCount = 0
+
+    @classmethod
+    def fromCells(cls, cells):
+        (rowCount, columnCount) = cells.shape
+        board = cls(rowCount, columnCount)
+        for (plane, type) in enumerate(_typeOfPlane):
+            board._lines[0][plane] = _maskLines(cells == type)
+            board._lines[1][plane] = _maskLines((cells == type).T)
+        return board
+
+    @classmethod
+    def fromTreeMap(cls, treeMap):
+        treeMask = np.asarray(treeMap) != 0
+        board = cls(*treeMask.shape)
+        board._lines[0][0] = _maskLines(treeMask)
+        board._lines[1][0] = _maskLines(treeMask.T)
+        return board
+
+    def copy(self):
+        board = BitBoard.__new__(BitBoard)
+        board._shape = self._shape
+        board._fulls = self._fulls
+        board._lines = tuple([list(lines) for lines in planes] for planes in self._lines)
+        board._version = self._version
+        board._changedCellCount = self._changedCellCount
+        return board
+
+    @property
+    def shape(self):
+        return self._shape
+
+    @property
+    def cells(self): # the board as a const_cellType_* array, notSet cells being notTested
+        (rowCount, columnCount) = self._shape
+        cells = np.full(self._shape, CellType.notTested, dtype=np.uint8)
+        for (plane, type) in enumerate(_typeOfPlane):
+            cells[_lineMask(self._lines[0][plane], columnCount)] = type
+        return cells
+
+    @property
+    def version(self):
+        return self._version
+
+    @property
+    def changedCellCount(self):
+        return self._changedCellCount
+
+    def full(self, orientation):
+        return self._fulls[orientation]
+
+    def trees(self, orientation=0):
+        return self._lines[orientation][0]
+
+    def tents(self, orientation=0):
+        return self._lines[orientation][1]
+
+    def grass(self, orientation=0):
+        return self._lines[orientation][2]
+
+    def notSet(self, orientation=0): # the notSet cells of every line
+        full = self._fulls[orientation]
+        return [full & ~(tree | tent | grass) for (tree, tent, grass) in zip(*self._lines[orientation])]
+
+    def blocked(self, orientation=0): # the cells of every line that cannot take a tent, trees and grass
+        return [tree | grass for (tree, grass) in zip(self._lines[orientation][0], self._lines[orientation][2])]
+
+    @property
+    def rowTentCounts(self):
+        return np.array([line.bit_count() for line in self._lines[0][1]], dtype=np.int64)
+
+    @property
+    def columnTentCounts(self):
+        return np.array([line.bit_count() for line in self._lines[1][1]], dtype=np.int64)
+
+    @property
+    def rowNotSetCounts(self):
+        return np.array([line.bit_count() for line in self.notSet(0)], dtype=np.int64)
+
+    @property
+    def columnNotSetCounts(self):
+        return np.array([line.bit_count() for line in self.notSet(1)], dtype=np.int64)
+
+    def type(self, row, column):
+        for (plane, type) in enumerate(_typeOfPlane):
+            if self._lines[0][plane][row] >> column & 1:
+                return type
+        return CellType.notTested
+
+    def isNotSet(self, row, column):
+        (trees, tents, grass) = self._lines[0]
+        return not ((trees[row] | tents[row] | grass[row]) >> column & 1)
+
+    def trySetBits(self, orientation, line, bits, type): # set the notSet cells of bits on a line to type, True if there were any
+        (trees, tents, grass) = self._lines[orientation]
+        bits &= self._fulls[orientation] & ~(trees[line] | tents[line] | grass[line])
+        if not bits:
+            return False
+        plane = _planeOfType[type]
+        self._lines[orientation][plane][line] |= bits
+        crossLines = self._lines[1 - orientation][plane]
+        lineBit = 1 << line
+        for crossLine in LineBits(bits):
+            crossLines[crossLine] |= lineBit
+        self._version += 1
+        self._changedCellCount += bits.bit_count()
+        return True
+
+    def trySetLines(self, orientation, masks, type): # trySetBits on every line, masks holding the bits of each
+        isChanged = False
+        for (line, bits) in enumerate(masks):
+            if bits:
+                isChanged |= self.trySetBits(orientation, line, bits, type)
+        return isChanged
+
+    def trySetType(self, row, column, type):
+        return self.trySetBits(0, row, 1 << column, type)
+
+    def forceSetType(self, row, column, type):
+        oldType = self.type(row, column)
+        if oldType == type:
+            return
+        for (orientation, line, bit) in ((0, row, 1 << column), (1, column, 1 << row)):
+            planes = self._lines[orientation]
+            if oldType in _planeOfType:
+                planes[_planeOfType[oldType]][line] &= ~bit
+            if type in _planeOfType:
+                planes[_planeOfType[type]][line] |= bit
+        self._version += 1
+        self._changedCellCount += 1
+
+    def forceSetCells(self, cells): # change every cell that differs from cells
+        changedCellCount = int(np.count_nonzero(self.cells != cells))
+        if changedCellCount:
+            self._lines = BitBoard.fromCells(cells)._lines
+            self._version += 1
+            self._changedCellCount += changedCellCount
+
+    def copySetCells(self, copyFrom): # copy the set cells of copyFrom into the cells that are not set here
+        notSet = self.notSet(0)
+        otherNotSet = copyFrom.notSet(0)
+        for (plane, type) in enumerate(_typeOfPlane):
+            for (row, bits) in enumerate(copyFrom._lines[0][plane]):
+                bits &= notSet[row] & ~otherNotSet[row]
+                if bits:
+                    self.trySetBits(0, row, bits, type)
+
+def OrthogonalLines(lines, full): # cells with a set cell in up, down, left or right
+    above = [0] + lines[:-1]
+    below = lines[1:] + [0]
+    return [up | down | ((line << 1) & full) | (line >> 1) for (up, line, down) in zip(above, lines, below)]
+
+def DilateLines(lines, full): # cells with a set cell among their 8 neighbours
+    sides = [((line << 1) & full) | (line >> 1) for line in lines]
+    bands = [line | side for (line, side) in zip(lines, sides)]
+    above = [0] + bands[:-1]
+    below = bands[1:] + [0]
+    return [up | side | down for (up, side, down) in zip(above, sides, below)]
+
+def AtLeastTwoNeighbourLines(lines, full): # cells with set cells at two or more of their 8 neighbours
+    (ones, twos) = ([0] * len(lines), [0] * len(lines))
+    for shifted in _neighbourLines(lines, full):
+        twos = [two | (one & line) for (two, one, line) in zip(twos, ones, shifted)]
+        ones = [one | line for (one, line) in zip(ones, shifted)]
+    return twos
+
+def _neighbourLines(lines, full): # lines moved by each of the 8 neighbour offsets
+    for rowOffset in (-1, 0, 1):
+        if rowOffset < 0:
+            moved = [0] + lines[:-1]
+        elif rowOffset > 0:
+            moved = lines[1:] + [0]
+        else:
+            moved = lines
+        for columnOffset in (-1, 0, 1):
+            if rowOffset == 0 and columnOffset == 0:
+                continue
+            if columnOffset < 0:
+                yield [(line << 1) & full for line in moved]
+            elif columnOffset > 0:
+                yield [line >> 1 for line in moved]
+            else:
+                yield moved
+
+@functools.lru_cache(maxsize=1 << 16)
+def BitLinePattern(length, tents, blocked): # LinePattern of a line given as bitsets
+    return bytes(1 if tents >> cell & 1 else 2 if blocked >> cell & 1 else 0 for cell in range(length))
+
+@functools.lru_cache(maxsize=1 << 16)
+def BitLinePlacements(length, tents, blocked, hint): # LinePlacements of a line given as bitsets, its cell tuples as bitsets
+    placements = LinePlacements(BitLinePattern(length, tents, blocked), hint)
+    if placements is None:
+        return None
+    return tuple(sum(1 << cell for (cell, isSet) in enumerate(cells) if isSet) for cells in placements)
+
+def SolvedLines(board, topHints, leftHints):
+    # (orientation, line, BitLinePlacements of the line) for the rows and then the columns, each read when it
+    # is reached, so a rule sees the changes it made on the lines before
+    (rowCount, columnCount) = board.shape
+    for (orientation, hints, length) in ((0, leftHints, columnCount), (1, topHints, rowCount)):
+        tents = board.tents(orientation)
+        trees = board.trees(orientation)
+        grass = board.grass(orientation)
+        for line in range(len(tents)):
+            yield (orientation, line, BitLinePlacements(length, tents[line], trees[line] | grass[line], int(hints[line])))
+
+def RemoveZeroColumnRow(board, topHints, leftHints):
+    full = board.full(0)
+    zeroColumns = sum(1 << column for (column, hint) in enumerate(np.asarray(topHints).tolist()) if hint == 0)
+    masks = [full if hint == 0 else zeroColumns for hint in np.asarray(leftHints).tolist()]
+    return board.trySetLines(0, masks, CellType.grass)
+
+def SetGrassAroundTent(board):
+    return board.trySetLines(0, DilateLines(board.tents(), board.full(0)), CellType.grass)
+
+def excludeLand(board): # Remove any cells that don't have a tree around them.
+    full = board.full(0)
+    return board.trySetLines(0, [full & ~line for line in OrthogonalLines(board.trees(), full)], CellType.grass)
+
+def PlaceExplicitTents(board, topHints, leftHints): # cells that are a tent in every placement of their line hints
+    isChanged = False
+    for (orientation, line, placements) in SolvedLines(board, topHints, leftHints):
+        if placements is not None:
+            isChanged |= board.trySetBits(orientation, line, placements[0], CellType.tent)
+    return isChanged
+
+def ExcludeLineCells(board, topHints, leftHints): # cells that are a tent in no placement of their line hints
+    isChanged = False
+    for (orientation, line, placements) in SolvedLines(board, topHints, leftHints):
+        if placements is not None:
+            isChanged |= board.trySetBits(orientation, line, placements[1], CellType.grass)
+    return isChanged
+
+def ExcludeDiagonallyJointCell(board, topHints, leftHints): # the guarded cells of a line are grass on the lines beside it
+    isChanged = False
+    for (orientation, line, placements) in SolvedLines(board, topHints, leftHints):
+        if placements is None:
+            continue
+        for neighbour in (line - 1, line + 1):
+            if 0 <= neighbour < len(board.tents(orientation)):
+                isChanged |= board.trySetBits(orientation, neighbour, placements[2], CellType.grass)
+    return isChanged
+
+def PlaceTentNextToIsolatedsTree(board): # a tree with one tent or notSet cell next to it has its tent there
+    full = board.full(0)
+    trees = board.trees()
+    candidates = [full & ~line for line in board.blocked()] # tent or notSet
+    above = [0] + candidates[:-1]
+    below = candidates[1:] + [0]
+    (upTargets, downTargets, sideTargets) = ([], [], [])
+    for (tree, up, candidate, down) in zip(trees, above, candidates, below):
+        (up, down, left, right) = (tree & up, tree & down, tree & ((candidate << 1) & full), tree & (candidate >> 1))
+        single = (up | down | left | right) & ~((up & down) | (up & left) | (up & right) | (down & left) | (down & right) | (left & right))
+        upTargets.append(up & single)
+        downTargets.append(down & single)
+        sideTargets.append(((left & single) >> 1) | ((right & single) << 1))
+    targets = [side | up | down for (side, up, down) in zip(sideTargets, upTargets[1:] + [0], [0] + downTargets[:-1])]
+    return board.trySetLines(0, targets, CellType.tent)
+
+def ExcludeCornerCell(board):
+    # T 0
+    # 0 0 <- impossible
+    # As in Solver.ExcludeCornerCell: trees are handled in bulk, restarting at the first row whose tree sees
+    # grass set below an earlier tree.
+    isChanged = False
+    full = board.full(0)
+    trees = board.trees()
+    startRow = 0
+    while True:
+        notSet = board.notSet()
+        activeTrees = [0] * startRow + trees[startRow:]
+        (topCorners, bottomCorners) = CornerCellLines(activeTrees, notSet, full)
+        seen = OrthogonalLines([corner & cell for (corner, cell) in zip(bottomCorners, notSet)], full)
+        affectedRows = [row for (row, (tree, line)) in enumerate(zip(trees, seen)) if tree & line]
+        if not affectedRows:
+            return board.trySetLines(0, [top | bottom for (top, bottom) in zip(topCorners, bottomCorners)], CellType.grass) or isChanged
+        startRow = affectedRows[0]
+        activeTrees[startRow:] = [0] * (len(trees) - startRow)
+        (topCorners, bottomCorners) = CornerCellLines(activeTrees, notSet, full)
+        isChanged |= board.trySetLines(0, [top | bottom for (top, bottom) in zip(topCorners, bottomCorners)], CellType.grass)
+
+def CornerCellLines(trees, notSet, full): # CornerCellMask on rows of bits
+    above = [0] + notSet[:-1]
+    below = notSet[1:] + [0]
+    (topLeft, topRight, bottomRight, bottomLeft) = ([], [], [], [])
+    for (tree, up, line, down) in zip(trees, above, notSet, below):
+        (up, down, left, right) = (tree & up, tree & down, tree & ((line << 1) & full), tree & (line >> 1))
+        topLeft.append(up & left & ~down & ~right)
+        topRight.append(up & ~left & ~down & right)
+        bottomRight.append(~up & ~left & down & right)
+        bottomLeft.append(~up & left & down & ~right)
+    topCorners = [(upLeft >> 1) | ((upRight << 1) & full) for (upLeft, upRight) in zip(topLeft[1:] + [0], topRight[1:] + [0])]
+    bottomCorners = [((downRight << 1) & full) | (downLeft >> 1) for (downRight, downLeft) in zip([0] + bottomRight[:-1], [0] + bottomLeft[:-1])]
+    return (topCorners, bottomCorners)
+
+def ExcludeImpossibleCell(board):
+    # A cell is impossible if placing a tent there leaves more than one neighbouring tree without any cell for
+    # its tent; as in Solver.ExcludeImpossibleCell the cells are visited row by row, each found one taking its
+    # cell from the free cells of the next.
+    isChanged = False
+    (rowCount, columnCount) = board.shape
+    full = board.full(0)
+    trees = board.trees()
+    tents = list(board.tents())
+    notSet = board.notSet()
+    freeCells = [cell & ~dilated for (cell, dilated) in zip(notSet, DilateLines(tents, full))] # stay notSet after SetGrassAroundTent
+    candidates = [cell & twoTrees for (cell, twoTrees) in zip(notSet, AtLeastTwoNeighbourLines(trees, full))]
+    for (row, bits) in enumerate(candidates):
+        for column in LineBits(bits):
+            if CountTreesLeftWithoutTent(row, column, trees, tents, freeCells, rowCount, full) > 1: # an impossible cell, must be grass
+                board.trySetType(row, column, CellType.grass)
+                freeCells[row] &= ~(1 << column)
+                isChanged = True
+    return isChanged
+
+def CountTreesLeftWithoutTent(row, column, trees, tents, freeCells, rowCount, full): # trees around (row, column) with no tent cell left if (row, column) were a tent
+    block = ((7 << column) >> 1) & full # columns column - 1 to column + 1
+    # cells that could still take a tent: tents, and free cells outside the 3x3 block of (row, column)
+    available = {}
+    for line in range(row - 2, row + 3):
+        if 0 <= line < rowCount:
+            available[line] = tents[line] | (freeCells[line] & ~block if abs(line - row) <= 1 else freeCells[line])
+    treeCount = 0
+    for treeRow in range(max(0, row - 1), min(rowCount, row + 2)):
+        neighbourTrees = trees[treeRow] & block & ~((1 << column) if treeRow == row else 0)
+        for treeColumn in LineBits(neighbourTrees):
+            treeBit = 1 << treeColumn
+            hasTentCell = ((available.get(treeRow - 1, 0) | available.get(treeRow + 1, 0)) & treeBit
+                           or available[treeRow] & ((treeBit << 1) | (treeBit >> 1)))
+            treeCount += not hasTentCell
+    return treeCount
+
+def TreeCellGraph(board, cellLines):
+    # (cells as (row, column), indices into them of the cells next to every tree), with cells the cells of
+    # cellLines next to a tree in row-major order and the neighbours of a tree up, down, left, right
+    full = board.full(0)
+    trees = board.trees()
+    cells = [(row, column) for (row, bits) in enumerate(cell & line for (cell, line) in zip(cellLines, OrthogonalLines(trees, full)))
+             for column in LineBits(bits)]
+    cellIndices = {cell: index for (index, cell) in enumerate(cells)}
+    cellsOfTrees = []
+    for (row, bits) in enumerate(trees):
+        for column in LineBits(bits):
+            neighbours = ((row - 1, column), (row + 1, column), (row, column - 1), (row, column + 1))
+            cellsOfTrees.append([cellIndices[neighbour] for neighbour in neighbours if neighbour in cellIndices])
+    return (cells, cellsOfTrees)
+
+def PairTreesWithCells(board): # Solver.PairTreesWithCells with cells as (row, column)
+    tents = board.tents()
+    (cells, cellsOfTrees) = TreeCellGraph(board, [tent | cell for (tent, cell) in zip(tents, board.notSet())])
+    pairing = PairTreeGraph(cellsOfTrees, [bool(tents[row] >> column & 1) for (row, column) in cells], int(board.rowTentCounts.sum()))
+    return None if pairing is None else (cells, ) + pairing
+
+def MatchTreesAndTents(board): # see Solver.MatchTreesAndTents
+    pairing = PairTreesWithCells(board)
+    if pairing is None:
+        return False
+    (cells, cellsOfTrees, cellOfTree, treeOfCell) = pairing
+    (rowCount, columnCount) = board.shape
+    notSet = board.notSet()
+    (isGrass, isTent) = MatchedCellTypes(cellsOfTrees, cellOfTree, treeOfCell, [bool(notSet[row] >> column & 1) for (row, column) in cells])
+    (grassLines, tentLines) = ([0] * rowCount, [0] * rowCount)
+    for ((row, column), grass, tent) in zip(cells, isGrass, isTent):
+        grassLines[row] |= grass << column
+        tentLines[row] |= tent << column
+    isChanged = board.trySetLines(0, grassLines, CellType.grass)
+    isChanged |= board.trySetLines(0, tentLines, CellType.tent)
+    return isChanged
+
+def RemoveAssociatedTreesAndTents(board, topHints, leftHints):
+    # A tree whose only tent or notSet neighbour is a tent, or a tent with one tree next to it, is paired:
+    # both become grass and the tent leaves the hints. Row by row like Solver.RemoveAssociatedTreesAndTents,
+    # since every pair removed changes what the cells after it see.
+    isRemoved = False
+    (rowCount, columnCount) = board.shape
+    (trees, tents, grass) = (board.trees(), board.tents(), board.grass())
+    startCells = [(row, column) for (row, bits) in enumerate(tree | tent for (tree, tent) in zip(trees, tents)) for column in LineBits(bits)]
+    for (row, column) in startCells:
+        neighbours = [cell for cell in ((row - 1, column), (row, column - 1), (row, column + 1), (row + 1, column))
+                      if 0 <= cell[0] < rowCount and 0 <= cell[1] < columnCount]
+        if trees[row] >> column & 1:
+            tentCells = [cell for cell in neighbours if not ((trees[cell[0]] | grass[cell[0]]) >> cell[1] & 1)] # tent or notSet
+            if len(tentCells) == 1 and tents[tentCells[0][0]] >> tentCells[0][1] & 1:
+                (tentRow, tentColumn) = tentCells[0]
+                board.forceSetType(row, column, CellType.grass)
+                board.forceSetType(tentRow, tentColumn, CellType.grass)
+                topHints[tentColumn] -= 1
+                leftHints[tentRow] -= 1
+                isRemoved = True
+        elif tents[row] >> column & 1:
+            treeCells = [cell for cell in neighbours if trees[cell[0]] >> cell[1] & 1]
+            if len(treeCells) == 1:
+                board.forceSetType(row, column, CellType.grass)
+                board.forceSetType(*treeCells[0], CellType.grass)
+                topHints[column] -= 1
+                leftHints[row] -= 1
+                isRemoved = True
+    return isRemoved
+
+def checkIsConsistent(board, topHints, leftHints): # False once the board can no longer lead to a solution
+    topHints = np.asarray(topHints)
+    leftHints = np.asarray(leftHints)
+    (isValid, errorMessage) = checkIsValid(board, topHints - board.columnTentCounts, leftHints - board.rowTentCounts)
+    if not isValid:
+        return False
+    full = board.full(0)
+    (trees, tents) = (board.trees(), board.tents())
+    if any(tent & dilated for (tent, dilated) in zip(tents, DilateLines(tents, full))): # touching tents
+        return False
+    if any(tent & ~line for (tent, line) in zip(tents, OrthogonalLines(trees, full))): # tent without a tree
+        return False
+    tentCells = [tent | cell for (tent, cell) in zip(tents, board.notSet())]
+    if any(tree & ~line for (tree, line) in zip(trees, OrthogonalLines(tentCells, full))): # tree without a cell for its tent
+        return False
+    if any(placements is None for (orientation, line, placements) in SolvedLines(board, topHints, leftHints)):
+        return False # no placement of the hint fits in a line
+    return int(leftHints.sum()) == sum(tree.bit_count() for tree in trees)
+
+def PropagateSearchNode(board, topHints, leftHints): # apply the deduction rules until nothing changes, False on a contradiction
+    rules = [
+        lambda: SetGrassAroundTent(board),
+        lambda: excludeLand(board),
+        lambda: ExcludeLineCells(board, topHints, leftHints),
+        lambda: PlaceExplicitTents(board, topHints, leftHints),
+        lambda: ExcludeDiagonallyJointCell(board, topHints, leftHints),
+        lambda: ExcludeCornerCell(board),
+        lambda: PlaceTentNextToIsolatedsTree(board),
+        lambda: MatchTreesAndTents(board),
+        lambda: ExcludeImpossibleCell(board),
+    ]
+    isChanged = True
+    while isChanged:
+        if not checkIsConsistent(board, topHints, leftHints):
+            return False
+        isChanged = any(rule() for rule in rules) # restart from the cheapest rule after every change
+    return PairTreesWithCells(board) is not None
+
+def ChooseSearchBranches(board, topHints, leftHints): # see Solver.ChooseSearchBranches
+    (rowCount, columnCount) = board.shape
+    slacks = []
+    for (orientation, hints, length) in ((0, leftHints, columnCount), (1, topHints, rowCount)):
+        (tents, blocked, notSet) = (board.tents(orientation), board.blocked(orientation), board.notSet(orientation))
+        slacks.append([LineTentRange(BitLinePattern(length, tents[line], blocked[line]))[1] - hints[line] if notSet[line] else length
+                       for line in range(len(tents))])
+    (rowSlacks, columnSlacks) = slacks
+    if min(rowSlacks) <= min(columnSlacks):
+        row = int(np.argmin(rowSlacks))
+        column = LineBits(board.notSet(0)[row])[0]
+    else:
+        column = int(np.argmin(columnSlacks))
+        row = LineBits(board.notSet(1)[column])[0]
+    return [[(row, column, CellType.grass)], [(row, column, CellType.tent)]]
+
+def SearchSolutions(board, topHints, leftHints, maxSolutions=1, nodeLimit=100000, timeLimit=None):
+    # Solver.SearchSolutions on a copy of the board per node; returns (solutions, isExhausted, nodeCount) and
+    # leaves the board unchanged
+    deadline = None if timeLimit is None else time.perf_counter() + timeLimit
+    solutions = []
+    nodeCount = 0
+    isExhausted = True
+    stack = [(board, iter([[]]))]
+    while stack:
+        (parent, branches) = stack[-1]
+        branch = next(branches, None)
+        if branch is None:
+            stack.pop()
+            continue
+        if nodeCount >= nodeLimit or (deadline is not None and time.perf_counter() > deadline):
+            isExhausted = False
+            break
+        nodeCount += 1
+        node = parent.copy()
+        if not all(node.trySetType(row, column, type) for (row, column, type) in branch):
+            continue
+        if not PropagateSearchNode(node, topHints, leftHints):
+            continue
+        if not any(node.notSet()): # consistent and fully paired, so solved
+            solutions.append(node.cells)
+            if len(solutions) >= maxSolutions:
+                isExhausted = False
+                break
+            continue
+        stack.append((node, iter(ChooseSearchBranches(node, topHints, leftHints))))
+    return (solutions, isExhausted, nodeCount)
+
+def SearchAndLogStatus(treeMap, board, topHints, leftHints, result, history, nodeLimit, timeLimit): # see Solver.SearchAndLogStatus
+    startTime = time.perf_counter()
+    (solutions, isExhausted, nodeCount) = SearchSolutions(board, topHints, leftHints, 1, nodeLimit, timeLimit)
+    if not solutions and isExhausted:
+        timeLeft = None if timeLimit is None else max(0, timeLimit - (time.perf_counter() - startTime))
+        (solutions, isExhausted, moreNodeCount) = SearchSolutions(BitBoard.fromTreeMap(treeMap), topHints, leftHints, 1, nodeLimit - nodeCount, timeLeft)
+        nodeCount += moreNodeCount
+    if solutions:
+        board.forceSetCells(solutions[0])
+        result.append(MapSnapshot(None, board, False, checkIsSolved(board, topHints, leftHints), "complete the map by backtracking search (" + str(nodeCount) + " nodes)", history))
+    elif isExhausted:
+        result.append(MapSnapshot(None, None, False, False, "backtracking search found no solution"))
+    else:
+        result.append(MapSnapshot(None, None, False, False, "backtracking search stopped after " + str(nodeCount) + " nodes"))
+
+def solve(treeMap, topHints, leftHints, search=False, nodeLimit=100000, timeLimit=None, profile=None):
+    # Solver.solve with the rules engine, on a BitBoard; gives the same steps
+    result = []
+    board = BitBoard.fromTreeMap(treeMap)
+    (isValid, errorMessage) = checkIsValid(board, topHints, leftHints)
+    if not isValid:
+        result.append("<br>: " + errorMessage)
+        return result
+
+    history = MapHistory()
+    result.append(MapSnapshot([], board, isValid, False, "input", history))
+    stepCount = 1
+    prevState = board.version
+
+    RunRule(profile, "ignore zero columns and rows", board, RemoveZeroColumnRow, board, topHints, leftHints)
+    (prevState, stepCount, canContinue, canReturn) = logStatus(board, topHints, leftHints, prevState, result, stepCount, "ignore zero columns and rows", history)
+    seePresentState(board)
+    if canReturn:
+        return result
+
+    simplifiedBoard = board.copy()
+    simplifiedTopHints = DeepCopyArray(topHints)
+    simplifiedLeftHints = DeepCopyArray(leftHints)
+    rules = [
+        (lambda: excludeLand(simplifiedBoard), "exclude open land (no adjacent tree)", False),
+        (lambda: PlaceExplicitTents(simplifiedBoard, simplifiedTopHints, simplifiedLeftHints), "fill in tents based on hints", True),
+        (lambda: MatchTreesAndTents(simplifiedBoard), "pair trees with tents", True),
+        (lambda: PlaceTentNextToIsolatedsTree(simplifiedBoard), "fill in tents next to isolated trees", True),
+        (lambda: ExcludeLineCells(simplifiedBoard, simplifiedTopHints, simplifiedLeftHints), "exclude cells the hints leave no tent for", True),
+        (lambda: ExcludeDiagonallyJointCell(simplifiedBoard, simplifiedTopHints, simplifiedLeftHints), "exclude diagonally joint cells", True),
+        (lambda: ExcludeCornerCell(simplifiedBoard), "exclude corner cell", True),
+        (lambda: ExcludeImpossibleCell(simplifiedBoard), "exclude impossible cells", True),
+    ]
+    while isValid:
+        simplifiedBoard.copySetCells(board)
+        if RunRule(profile, "Remove associated trees and tents", simplifiedBoard, RemoveAssociatedTreesAndTents, simplifiedBoard, simplifiedTopHints, simplifiedLeftHints):
+            result.append(MapSnapshot(None, None, False, False, "Remove associated trees and tents"))
+
+        canContinue = False
+        canReturn = False
+        for (rule, description, setGrassAroundTent) in rules:
+            if not RunRule(profile, description, simplifiedBoard, rule):
+                continue
+            board.copySetCells(simplifiedBoard)
+            if setGrassAroundTent:
+                RunRule(profile, "set grass around tents", board, SetGrassAroundTent, board)
+            seePresentState(board)
+            (prevState, stepCount, canContinue, canReturn) = logStatus(board, topHints, leftHints, prevState, result, stepCount, description, history)
+            if canReturn or canContinue:
+                break
+        if not canContinue:
+            break
+
+    if search and not result[-1].isSolved:
+        RunRule(profile, "backtracking search", board, SearchAndLogStatus, treeMap, board, topHints, leftHints, result, history, nodeLimit, timeLimit)
+    return result
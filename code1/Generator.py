@@ -0,0 +1,179 @@
+import argparse
+import concurrent.futures
+import os
+import sys
+import numpy as np
+
+from BitboardSolver import BitBoard, PropagateSearchNode, SearchSolutions
+from Solver import const_cellType_notTested, const_cellType_tent
+
+# Puzzles are made by planting a solution: non-touching tents, each given a tree on a free orthogonal neighbour,
+# with the hints counted from the tents. A planted board is rarely uniquely solvable, so it is then repaired in
+# rounds: the search rules run once on a BitBoard, and every cell they leave undecided is changed, until they
+# decide the whole board. Once few cells are left undecided, a short search from the ruled board looks for a
+# second solution; a board it proves unique is a hard puzzle, and otherwise only the cells where the two
+# solutions disagree are changed.
+
+difficulties = ("any", "easy", "hard") # easy: the search rules alone finish it, hard: it needs backtracking
+
+_directions = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def _freeNeighbours(tentMask, treeMask, row, column):
+    (rowCount, columnCount) = tentMask.shape
+    return [(row + dRow, column + dColumn) for (dRow, dColumn) in _directions
+            if 0 <= row + dRow < rowCount and 0 <= column + dColumn < columnCount
+            and not treeMask[row + dRow, column + dColumn] and not tentMask[row + dRow, column + dColumn]]
+
+def _addPair(tentMask, treeMask, treeOfTent, row, column, rng):
+    # a tent at (row, column) with a tree on a random free neighbour, if no tent touches the cell
+    if treeMask[row, column] or tentMask[max(0, row - 1):row + 2, max(0, column - 1):column + 2].any():
+        return False
+    neighbours = _freeNeighbours(tentMask, treeMask, row, column)
+    if not neighbours:
+        return False
+    tree = neighbours[rng.integers(len(neighbours))]
+    tentMask[row, column] = True
+    treeMask[tree] = True
+    treeOfTent[(row, column)] = tree
+    return True
+
+def PlantSolution(rowCount, columnCount, rng, density=0.2):
+    # (tentMask, treeMask, treeOfTent) with about density * cells tents, placed in random order while they fit
+    tentMask = np.zeros((rowCount, columnCount), dtype=bool)
+    treeMask = np.zeros((rowCount, columnCount), dtype=bool)
+    treeOfTent = {}
+    tentLimit = int(density * rowCount * columnCount)
+    for cell in rng.permutation(rowCount * columnCount):
+        if len(treeOfTent) >= tentLimit:
+            break
+        _addPair(tentMask, treeMask, treeOfTent, int(cell) // columnCount, int(cell) % columnCount, rng)
+    return (tentMask, treeMask, treeOfTent)
+
+def _repair(tentMask, treeMask, treeOfTent, row, column, rng):
+    # change the planted solution at an undecided cell: a grass cell gets a tent if one fits, a tent gets its
+    # tree moved to the free neighbour with the fewest free cells around it, where the rules pair the two soonest,
+    # or is removed with it
+    if not tentMask[row, column]:
+        _addPair(tentMask, treeMask, treeOfTent, row, column, rng)
+        return
+    treeMask[treeOfTent[(row, column)]] = False
+    neighbours = _freeNeighbours(tentMask, treeMask, row, column)
+    if neighbours and rng.random() < 0.7:
+        freeCounts = [len(_freeNeighbours(tentMask, treeMask, *neighbour)) for neighbour in neighbours]
+        neighbours = [neighbour for (neighbour, freeCount) in zip(neighbours, freeCounts) if freeCount == min(freeCounts)]
+        tree = neighbours[rng.integers(len(neighbours))]
+        treeMask[tree] = True
+        treeOfTent[(row, column)] = tree
+    else:
+        tentMask[row, column] = False
+        del treeOfTent[(row, column)]
+
+def UndecidedCells(treeMap, topHints, leftHints):
+    # (board, mask): the BitBoard after the search rules and the cells they leave notSet, (None, None) on a contradiction
+    board = BitBoard.fromTreeMap(treeMap)
+    if not PropagateSearchNode(board, topHints, leftHints):
+        return (None, None)
+    return (board, board.cells == const_cellType_notTested)
+
+def CountSolutions(board, topHints, leftHints, nodeLimit=200):
+    # (solutions, isExhausted, nodeCount) of a search from the board that stops at the second solution
+    return SearchSolutions(board, topHints, leftHints, 2, nodeLimit)
+
+def GeneratePuzzle(rowCount, columnCount, seed=None, difficulty="any", density=0.2, maxAttempts=20, maxRounds=100, searchCells=None, nodeLimit=200):
+    # A uniquely solvable puzzle as (treeMap, topHints, leftHints, tentMask); the same seed gives the same puzzle.
+    # A board on which the rules leave at most searchCells cells undecided (default: rowCount + columnCount) is
+    # searched for a second solution within nodeLimit nodes. Raises RuntimeError when maxAttempts planted boards could not be
+    # repaired within maxRounds rounds each.
+    if difficulty not in difficulties:
+        raise ValueError("difficulty must be one of " + ", ".join(difficulties))
+    rng = np.random.default_rng(seed)
+    searchCells = rowCount + columnCount if searchCells is None else searchCells
+    for attempt in range(maxAttempts):
+        (tentMask, treeMask, treeOfTent) = PlantSolution(rowCount, columnCount, rng, density)
+        for repair in range(maxRounds):
+            treeMap = treeMask.view(np.uint8)
+            (topHints, leftHints) = (tentMask.sum(axis=0), tentMask.sum(axis=1))
+            (board, undecided) = UndecidedCells(treeMap, topHints, leftHints)
+            if board is None: # the rules contradict the planted solution, so the board cannot be trusted; start over
+                break
+            if not undecided.any(): # the rules alone solve it, so it is unique and easy
+                if difficulty != "hard":
+                    return (treeMap.copy(), topHints, leftHints, tentMask.copy())
+                break # repairs only add constraints, so start over
+            cells = np.argwhere(undecided)
+            if len(cells) <= searchCells: # close to unique: search it, and make single changes so a hard board is not skipped
+                if difficulty != "easy":
+                    (solutions, isExhausted, nodeCount) = CountSolutions(board, topHints, leftHints, nodeLimit)
+                    if isExhausted and len(solutions) == 1:
+                        return (treeMap.copy(), topHints, leftHints, tentMask.copy())
+                    if len(solutions) == 2:
+                        cells = np.argwhere((solutions[0] == const_cellType_tent) != (solutions[1] == const_cellType_tent))
+                cells = cells[rng.integers(len(cells))][np.newaxis]
+            for (row, column) in rng.permutation(cells).tolist():
+                _repair(tentMask, treeMask, treeOfTent, row, column, rng)
+    raise RuntimeError("no uniquely solvable " + difficulty + " " + str(rowCount) + "x" + str(columnCount) + " puzzle found")
+
+def FormatPuzzle(treeMap, topHints, leftHints):
+    # the input*.txt text layout
+    lines = [str(treeMap.shape[0]) + " " + str(treeMap.shape[1])]
+    cells = np.where(treeMap != 0, ord('T'), ord('.')).astype(np.uint8)
+    for (row, hint) in zip(cells, leftHints):
+        lines.append(row.tobytes().decode("ascii") + " " + str(int(hint)))
+    lines.append(" ".join(str(int(hint)) for hint in topHints))
+    return "\n".join(lines) + "\n"
+
+def _generateText(arguments):
+    # a seed with no puzzle is followed by seed + [1], seed + [2], ... up to maxSeeds seeds, so one unlucky seed
+    # (hard boards are rare on small sizes) does not stop a whole run
+    (rowCount, columnCount, seed, difficulty, density, maxSeeds) = arguments
+    for retry in range(maxSeeds):
+        try:
+            (treeMap, topHints, leftHints, _) = GeneratePuzzle(rowCount, columnCount, seed + [retry] if retry else seed, difficulty, density)
+        except RuntimeError:
+            continue
+        return FormatPuzzle(treeMap, topHints, leftHints)
+    raise RuntimeError("no uniquely solvable " + difficulty + " " + str(rowCount) + "x" + str(columnCount) + " puzzle found in " + str(maxSeeds) + " seeds")
+
+def GeneratePuzzleTexts(count, rowCount, columnCount, seed=0, difficulty="any", density=0.2, workers=1, maxSeeds=200):
+    # the text of count puzzles, in order; puzzle k is seeded with (seed, k), so the output does not depend on workers
+    arguments = [(rowCount, columnCount, [seed, k], difficulty, density, maxSeeds) for k in range(count)]
+    if workers == 1:
+        yield from map(_generateText, arguments)
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_generateText, arguments)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate uniquely solvable Tents and Trees puzzles in the input*.txt format.")
+    parser.add_argument("rowCount", type=int)
+    parser.add_argument("columnCount", type=int, nargs="?", default=None, help="default: rowCount")
+    parser.add_argument("-n", "--count", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--difficulty", choices=difficulties, default="any")
+    parser.add_argument("--density", type=float, default=0.2, help="share of cells planted with tents")
+    parser.add_argument("-j", "--workers", type=int, default=1)
+    parser.add_argument("--max-seeds", type=int, default=200, help="seeds tried per puzzle before giving up")
+    parser.add_argument("-o", "--output", default=None, help="file for all puzzles, one after another (default: stdout)")
+    parser.add_argument("--output-dir", default=None, help="directory for one input<k>.txt file per puzzle")
+    args = parser.parse_args(argv)
+
+    columnCount = args.rowCount if args.columnCount is None else args.columnCount
+    texts = GeneratePuzzleTexts(args.count, args.rowCount, columnCount, args.seed, args.difficulty, args.density, args.workers, args.max_seeds)
+    if args.output_dir is not None:
+        os.makedirs(args.output_dir, exist_ok=True)
+        for (k, text) in enumerate(texts):
+            with open(os.path.join(args.output_dir, "input" + str(k) + ".txt"), 'w', encoding="utf-8") as file:
+                file.write(text)
+        return
+    output = sys.stdout if args.output is None else open(args.output, 'w', encoding="utf-8")
+    try:
+        for text in texts:
+            output.write(text + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == '__main__':
+    main()
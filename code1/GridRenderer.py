@@ -0,0 +1,162 @@
+import json
+import numpy as np
+
+from Assets import AssetUrl
+from Solver import const_cellType_notTested, const_cellType_tent, const_cellType_uncertain, const_cellType_grass, const_cellType_tree
+
+# A whole board as one HTML string: a CSS grid of <i> elements whose class gives the cell type,
+# so a page sends every image once in GridStyle() and a cell costs a few bytes whatever its image.
+
+_solutionClasses = [None] * 5 # indexed by const_cellType_*
+_solutionClasses[const_cellType_notTested] = "n"
+_solutionClasses[const_cellType_tent] = "t"
+_solutionClasses[const_cellType_uncertain] = "n"
+_solutionClasses[const_cellType_grass] = "g"
+_solutionClasses[const_cellType_tree] = "r"
+_inputTags = np.array(['<i class="e"></i>', '<i class="r"></i>'], dtype=object) # indexed by treeMap != 0
+
+
+def _imageRule(selector, assetName, extra=""):
+    return selector + "{background-image:url(" + AssetUrl(assetName) + ");background-size:100% 100%;" + extra + "}"
+
+def GridStyle(): # the <style> block of every grid on a page, to be sent once
+    rules = [
+        ".tents-grid{display:grid;grid-template-columns:repeat(var(--columns),var(--cell));grid-auto-rows:var(--cell);}",
+        ".tents-grid>i{display:block;box-sizing:border-box;font-style:normal;}",
+        ".tents-grid>i.h{display:flex;align-items:center;justify-content:center;font-size:25px;}",
+        ".tents-input>i.e,.tents-input>i.r{border:1px solid black;}",
+        _imageRule(".tents-input>i.r", "input_tree"),
+        ".tents-solution{gap:8px;}",
+        ".tents-solution>i{border-radius:5px;overflow:hidden;}",
+        ".tents-solution>i.n{background-color:#5D6159;}",
+        _imageRule(".tents-solution>i.g", "grass2"),
+        _imageRule(".tents-solution>i.t", "tent_5", "background-color:#ECD279;"),
+        _imageRule(".tents-solution>i.r", "output_tree3", "border-radius:10px;"),
+    ]
+    return "<style>" + "".join(rules) + "</style>"
+
+def _gridHtml(kind, tags, columnCount, cellSize):
+    return ('<div class="tents-grid ' + kind + '" style="--columns:' + str(columnCount) + ';--cell:' + format(cellSize, ".2f") + 'px;">'
+            + "".join(tags.ravel().tolist()) + "</div>")
+
+def _hintTag(hint):
+    return '<i class="h">' + str(int(hint)) + "</i>"
+
+def InputGridHtml(treeMap, topHints, leftHints, width=704): # the trees with the left hints after every row and the top hints below
+    (rowCount, columnCount) = treeMap.shape
+    tags = np.empty((rowCount + 1, columnCount + 1), dtype=object)
+    tags[:rowCount, :columnCount] = _inputTags[(np.asarray(treeMap) != 0).view(np.uint8)]
+    tags[:rowCount, columnCount] = [_hintTag(hint) for hint in leftHints]
+    tags[rowCount, :columnCount] = [_hintTag(hint) for hint in topHints]
+    tags[rowCount, columnCount] = "<i></i>"
+    return _gridHtml("tents-input", tags, columnCount + 1, width / (columnCount + 1))
+
+def StepDeltas(stepResults):
+    # (cells of the first map, [change codes per step]) where a code packs a flat cell index with its old and
+    # new type as flat << 6 | old << 3 | new; a step without a map shows the previous one and changes nothing.
+    # Steps kept in a MapHistory reuse its stored changes, so this costs time per changed cell, not per cell.
+    firstCells = None
+    (lastHistory, lastIndex, lastCells) = (None, None, None)
+    deltas = []
+    for result in stepResults:
+        if result.history is not None and result.history is lastHistory:
+            changes = [lastHistory.changes(index) for index in range(lastIndex + 1, result.historyIndex + 1)]
+            (changed, oldTypes, newTypes) = (np.concatenate(parts) for parts in zip(*changes)) if changes else (np.empty(0, dtype=np.int32), ) * 3
+            lastIndex = result.historyIndex
+        else:
+            resultMap = result.map
+            if resultMap is None:
+                deltas.append([])
+                continue
+            cells = resultMap.cells
+            if firstCells is None:
+                firstCells = cells
+                (changed, oldTypes, newTypes) = (np.empty(0, dtype=np.int32), ) * 3
+            else:
+                previous = lastCells if lastCells is not None else lastHistory.cells(lastIndex)
+                changed = np.flatnonzero(cells != previous)
+                (oldTypes, newTypes) = (previous.ravel()[changed], cells.ravel()[changed])
+            (lastHistory, lastIndex) = (result.history, result.historyIndex)
+            lastCells = cells if lastHistory is None else None
+        codes = (changed.astype(np.int64) << 6) | (oldTypes.astype(np.int64) << 3) | newTypes.astype(np.int64)
+        deltas.append(codes.tolist())
+    if firstCells is None:
+        firstCells = np.empty((0, 0), dtype=np.uint8)
+    return (firstCells, deltas)
+
+_controlHeight = 110 # pixels of the player above its board
+
+def PlaybackHeight(shape, width=704): # pixels of the frame that shows PlaybackHtml for a board of shape
+    (rowCount, columnCount) = shape
+    return int(rowCount * width / max(columnCount, 1)) + _controlHeight
+
+def PlaybackHtml(stepResults, width=704, framesPerSecond=10):
+    # A page that receives every step at once and plays them on the client: moving to another step only
+    # changes the class of the cells that differ, and the play button steps forward framesPerSecond times a second
+    (firstCells, deltas) = StepDeltas(stepResults)
+    (rowCount, columnCount) = firstCells.shape
+    playback = {
+        "cells": (firstCells.ravel() + ord('0')).astype(np.uint8).tobytes().decode("ascii"),
+        "deltas": deltas,
+        "messages": ["Step " + str(index + 1) + " :  ->  " + result.message for (index, result) in enumerate(stepResults)],
+        "classes": _solutionClasses,
+        "interval": 1000 / framesPerSecond,
+    }
+    script = """
+const playback = JSON.parse(document.getElementById("tents-playback").textContent);
+const board = document.getElementById("tents-board");
+const slider = document.getElementById("tents-slider");
+const message = document.getElementById("tents-message");
+const playButton = document.getElementById("tents-play");
+const cells = [];
+for (const type of playback.cells) {
+  const cell = document.createElement("i");
+  cell.className = playback.classes[+type];
+  board.appendChild(cell);
+  cells.push(cell);
+}
+let step = 0;
+let timer = null;
+function show(target) {
+  target = Math.max(0, Math.min(playback.deltas.length - 1, target));
+  for (; step < target; ) {
+    const delta = playback.deltas[++step];
+    for (let k = 0; k < delta.length; k++) cells[Math.floor(delta[k] / 64)].className = playback.classes[delta[k] % 8];
+  }
+  for (; step > target; step--) {
+    const delta = playback.deltas[step];
+    for (let k = delta.length - 1; k >= 0; k--) cells[Math.floor(delta[k] / 64)].className = playback.classes[Math.floor(delta[k] / 8) % 8];
+  }
+  slider.value = step + 1;
+  message.textContent = playback.messages[step];
+}
+function stop() {
+  clearInterval(timer);
+  timer = null;
+  playButton.textContent = "\\u25B6";
+}
+function play() {
+  if (timer !== null) return stop();
+  if (step === playback.deltas.length - 1) show(0);
+  playButton.textContent = "\\u275A\\u275A";
+  timer = setInterval(function () {
+    show(step + 1);
+    if (step === playback.deltas.length - 1) stop();
+  }, playback.interval);
+}
+slider.addEventListener("input", function () { stop(); show(slider.value - 1); });
+document.getElementById("tents-previous").addEventListener("click", function () { stop(); show(step - 1); });
+document.getElementById("tents-next").addEventListener("click", function () { stop(); show(step + 1); });
+playButton.addEventListener("click", play);
+show(0);
+"""
+    cellSize = width / max(columnCount, 1) - 8
+    return (GridStyle()
+            + "<style>.tents-controls{display:flex;gap:8px;align-items:center;font-family:sans-serif;}"
+            + ".tents-controls input{flex:1;}#tents-message{font-family:sans-serif;height:48px;overflow:auto;margin:8px 0;}</style>"
+            + '<div class="tents-controls"><button id="tents-previous">&#9664;</button><button id="tents-play">&#9654;</button>'
+            + '<button id="tents-next">&#9654;&#9654;</button><input id="tents-slider" type="range" min="1" max="' + str(len(deltas)) + '" value="1"></div>'
+            + '<div id="tents-message"></div>'
+            + '<div id="tents-board" class="tents-grid tents-solution" style="--columns:' + str(columnCount) + ';--cell:' + format(cellSize, ".2f") + 'px;"></div>'
+            + '<script type="application/json" id="tents-playback">' + json.dumps(playback, separators=(",", ":")).replace("</", "<\\/") + "</script>"
+            + "<script>" + script + "</script>")
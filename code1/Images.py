@@ -1,14 +1,25 @@
-tent_1_url = "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQEBLAEsAAD/2wBDAAIBAQIBAQICAgICAgICAwUDAwMDAwYEBAMFBwYHBwcGBwcICQsJCAgKCAcHCg0KCgsMDAwMBwkODw0MDgsMDAz/2wBDAQICAgMDAwYDAwYMCAcIDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAz/wAARCABkAGQDASIAAhEBAxEB/8QAHQABAAIDAAMBAAAAAAAAAAAAAAIGAwUHAQQICf/EADsQAAEDAgMFBQQGCwAAAAAAAAEAAgMEBQYREgcTITFhFCJBUXEIMoGhFRYkUnKRIzNCRGKCg5KxssH/xAAcAQEAAgMBAQEAAAAAAAAAAAAABwgEBQYDCQL/xAAvEQABAgQFAgQHAAMAAAAAAAABAAIDBAURBhIhMWEHQRMycXIIFCJRUoGxkaHR/9oADAMBAAIRAxEAPwD9DERFtFwaIiIiIiIiIiIiIiIiIiIikzkiM5IiKKIiIiIiIiIOKrGNNq9sweXQ6u3VzeG4hcO4f43cm+nE9Fqa1XafSJUzlSjNhQx3cd+AN3HgAk9gs6nUyan4wl5OGXuPYf0nYDk2CsssjYYnSSObHHGNTnOOlrR5k+AVBxlt2pbdqp7OxtZNyNQ8EQs9Bzf8h6hUHF2PrnjSX7ZNppwc2U0Xdib8P2j1OZ9FpVVHHXxCzc1mlMONMJm3iOAzn2t1DBybu2IylThhrpTAgWj1c53fgPKPU7u9NB7guybFMXVWKLVcG11Q+pqoKgPL3fce3gABwABa7gOHFXRcZ2GXn6NxwKdzso7hC6Ljy1Dvt/wR/MuzKbOiuIolXwtCiR3l8WG5zHkkkkg5gSTqTkc25O5uo66iUlshWnthNDWPDXNAFgARY2tp5gdEREUsLhlJnJEZyREUURERERa/FeIThXDtVXxwtqaiINjpac/vVQ9wZDF6OkcwE+AJPIFYNSqECQlIk7MmzIbS4ngC/wDn7DudFkScrEmY7JeCLucQB6nRc52vbR7gy+VVro6lkNFCd26SnJEkrgS2Rrncxoka9hAy4sOeYXPQNIWaaWSokuUTpnVf0PcX27tDuc43bXbz1kkFRKesh6LCvmvi3EdQrVRfOVCIXEkloJuGtOoa0bADgC+51Vv6DSZWnSjZeVYGgAXIGriNLnuSef1oiIi5lblZrbcZLRcaesh/W0srZmdS0g/8X0dR1kdxo4aiF2qGojbLGfNrhmPkV81rsmwvEP0rhB1G52c1sk0f03Zuafz1D0aFZL4b8SCXqkejRTpHbmb72XuB6sJJ9gUQ9XKQYslDqDBrDNj7XbE+jgAPcroiIrlKvqkzkiM5IiKKIiIgGo5DiT4BVhj3Y2xe2ojcDasPyyR0r+bKuvyMckw82QNL4mnxe+c8Q1hWTFN/DmV1HLcIbLTw10dBLVh72zTB8UL93CSGhr3b7QZWOeGAHSd5mYfG0G50+zbZHdquCOKjbR0bqShhjaGNjIZlk0eAa3IZdVVn4gcYTfgQqJKtLYUW7nOOmcNI0A3yg2NyPqNi36QC6ZOmdBg+I6fikGI2wA/HMNydr27DYXvroOH7M2x4ujxy6mGqPtrp6Uc+60SyNPU7qF7R+NYwc17nsOw9ovuIKXg58VLBVsBGeoxOeHfm15HxWbF+H/qtieut/e3dPJ+iJ5mN3eYf7SPjmqtVOHljG22n8CnCViXu39rWoiLXLMRWTZRif6r4zp3SO001Z9mmJ5AOI0u+DsuPlmq2jhqGS2tDrEelVCDUpbzwnBw5sdjwRoeCVhVKQhT0rElI3leCD++45G45X0wRkUVU2PbQIcfYWdlNva61S9irRx1CRoBDj+JpBz8TqVrX00otWl6pIwqjKm7IjQ4fcX7HkHQjsQQqcVGQiyU1ElI/mYSD/wBHB3HCkzkiM5ItmsNRRERFpsa4Cte0C1upblTMmbkQ1+XeZ6Fc4254Jv14tVDRxQ0slnt1M2lZT0+cTTGPADjpJ4Znjw8uY7AhGYy8PJcviTBtIr4hirQvE8Mkt+p7bX38rhfYb7W0W6o+IZ+llxkn5c2+jT/QbLiHsx3als22C30bYeyCWmnp307m6HDPQ7l456DxGasvtDYTdSvp7g1vfpXmiqD5jMujd/sMz95gVlvmzSlrLzS3ah0UN1oZN7BLp1Nz4ghw8WkEgjPx4ZHIqrbRNo1+o7jXQYuskb7HcIRB2y1tL9wR7srmOJ1EHScsx7o97kqr456D1SVmXPoDDGgZcwu5ucG5u2xyl3YiwJI01dvM+HupEpHa01FwZE2NgbEdj3A7g3Oh1225qilNH2eodC50bpI8idDsw4Hk4ebXcwfELHCJq6cQ0lPLVTOOQaxuYHqVBtFw3U6tN/I06A6JE7gDblxNg0cuIHKk+oVaTkoHzM1EDWfcnf0tqTwLleXPDG5uIaBzJW5wdgurxfVtEcbo6fPvSOGXDorRgbYVUVAjqrw8Rn3hCOJaunWuzU9mp2x08Ya1vzVsMC/D3JSeWbxE4Rom/hi/hj3HQvPGjdwQ4aqEcTdVI8e8ClDw2/kfMfTs3/Z7ggr0cIYShwnQbmHU1rjqcM+BOQGfyC3CIrGwYEODDEKC0Na0WAAAAA2AA0A4CiGLFfEeYkQkk6knUk8lSZyRGckXqvNRREREREREUZI2zRuY9rXNcMi1wzBUkRFUbpsTsN0xE65mm3dRJTxUr2sOTHMjdI5vDpvCPIAAADjnYLNhyhsEIjpKeKEDhm1vEr3kWHJ06VlM5lobWZ3FzrADM47k23PJ9NlkzE5HjhojPLsoAFzewGwH2CIiLMWMiIiIpM5IjOSIinuB1TcDqiIvRNwOqbgdURETcDqm4HVERE3A6puB1RERNwOqbgdURETcDqm4HVERFNkAy8UREX5X/9k="
-tent_2_url = "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQEBLAEsAAD/2wBDAAIBAQIBAQICAgICAgICAwUDAwMDAwYEBAMFBwYHBwcGBwcICQsJCAgKCAcHCg0KCgsMDAwMBwkODw0MDgsMDAz/2wBDAQICAgMDAwYDAwYMCAcIDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAz/wAARCABkAGQDASIAAhEBAxEB/8QAHAABAAIDAQEBAAAAAAAAAAAAAAYIAwUHAgkE/8QANxAAAQMDAwIEBAMGBwAAAAAAAQIDBAAFEQYSIQcTCDFBURQiMkIVgaEJFmFicZEKI0NSgpKz/8QAHAEBAAEFAQEAAAAAAAAAAAAAAAYCBAUHCAMJ/8QANxEAAgAEBQEFBAgHAAAAAAAAAQIAAwQRBQYSITEHIkFRYXETFDKxCBZSYnKB0fAjJDNCssHh/9oADAMBAAIRAxEAPwDuFKUroCOO4UpSkIUpSkIUpSkIUpSkIUpSkIUpSkIUpSkIUpSkIUoo7EKUr5UpGST5AVHb51a03p7d8Rd4ilp+xgl9Wfb5M4/PFecyYiC7kD12hEipXJtR+La027cmBb5UpQ4Cn3Esp/sNxP54qBah8W+op6lCGYdvT6dpgLV+Zc3foBVhMxemXg39B+thHm05F5MWWpXKfDZ1yldSkzbZd3G3LpET32XQhLfxDOQDkJwNyVEeQGQoccEnq1XtPULOQTE4ipWDC4hSlK9oqhSlKQhSlKQhWC5T022Gt5XzbeEpzjeo+Qz/AB9/Qc+QrPW56N6MPUTW3xjrfdtNlWAhJ+mTIPCU/wARnz/lBzw4KjWbszU2X8JnYpVcINh3s3AUeZNh89oymB4LVYviErDKMfxJhsD3KOWY+Si5PpbkiONeIfpbdYulHpkiY3IukZDcp+ElxSnIbTqVKaDjZ4QpaG3FpAH0tOhRKkGq1ypjzxO5xVXP6Aajhdb/ABM+K+FMkNuMs6ssmnIklwbkxVx7UkNk/wApklwFI+rvFP3HNXOufTiR011zMguR3I7e9RbQrktkKKVNk+pQoKST67c+RFaa6c52m4/TzVriPeEIYgC3YmDWm33QdB5+EEm7RLOrXT9cr10r3TUaeYtgWJJExABMBP3j2xwO0QBZY57PuKIgUXHEpSPUmttp7Q1+1Xp2Rdrba3Z1vhoLry2nWy422DguFrd3O2D5rCdo965/rO63PTer7fcoz6mY7OW1EN9wtKK2ylwJ2qz9Km8Y4DpV9uD0jpZ1w/DOrovUG33R9m2/EOqjobWpUhK2nEJY2gKKQoqTkrAAAzycCpXmCuqaSjmT6MAzFFwpBOvb4RYggsdg1iF5IIBiG5Vw2ir6+VT111lObM4YL7PexZtSkEKO1oBDMNgQSL49J6pmdONW2+7Rkjvw3Q5tCwUuJPCmyR6KSSPzzV0LBfYuqLHDuUFzuw5zSXmlepSRnB9iPIj0IIqgunbndprMqNdoLNtcjyNoZbO7gD5VbsnzSrO04UnOFAEECw3hC6ofBSXNKTXP8t8qftylH6V+bjX5/WB7hfqoVM8ErgraCey3Hr/39IxKqZMwyW5/3FgKUpUsi4hSlKQhSla/Ud8Fht4c2lx55XbZQElW9Z8uByf6DkkgDkiqJkxZaF3NgNzFLOFFzGSS3Lv94i2O1p7tyuCggYO3tJOSVE/bwFHP2pSpXmADZDp9pOH0z0d24+FR7MwpanCnb33in5lkenHAHOAUgcJFQvoR0oV05sjt0uie5qC5py/khRioOCGQRxuJAKiOMhKRlKEmpn1Wm/u/0qkNhWHJCTuPv6muAus3VD6wVrSaJv5WnBK+DuNtXpfZfEXPBAHY/Rvpy+EU4rsQW1VUWFjzLlkg6PxHYv4Gy/23Pzz/AGSF2ndVLp4xnor226SOoDsmE8r/AE32S+Wl/wDFTaD+Vd78WPTuL1/6RWfX1ljlKrtFZkLbx8zLykJCQr+KgAyfZxpoea1Gqx/4b7VCb6/1nlOKC/x7VsqYc/eE9on/AN/1q7XQltnTmveo3Sy7N96JCmrukJpRx3rfPK3FYI8tskSUpI5SEpIwcGo3T49Pytmz32XcooRHXxTQgI9bi6+YHhGyM7ZRkZry9UYe9g/9WW32WuRq9L2B+6WtHzlulkRICm3G93oQRU803q2xxNMxBcFJalR8oSwhlbysp+5AKFbQRgnY4yAeM+0+8YXQOR0s1rIkISXI7ygsuhO0PBWdjuBwN+1QUBwHELA+XbniLiMmu0JcymxKml1MhtSMAykd4P73HIMfPLTVYVUzaWemmYpKsp7mHz8jwQbiNz1J1TbdXzoT0OHKS82kMvSH1hG5nkgbT3HCpKiSlPcQgdxZwonIj0R923S2n2HFsyGFhxp1BwptSTlKgfcEA16WjjNY1qARzxV5JkiWulYsKmoac/tGG/lFuui/VBrqro1uYrtt3GKQzOaTwEOY4UB/tWOR7cjnbUuqrPhmlX6F1Eaes8KROhOFLFyCeGktKPClKPAUMbk85OCB5mrTVNsLrDPldrkbH9/OL9Q2gMwteFKUrJQhS1J0fobWmmr/ACNM6i1ZquZclxi+ZhYtumY62wgSe2kK+IWFISoBzalBWVJ+ZOSpWBzJl+nxmjNFUkhb3uLeBBG/iCR5XuNxEmynmiowGsasp1DFlKkG9t7EHbvVgrDuNrEEExZLsKelMp+3dn+p9Khfil1Ai06HuTqlYZtsF15Z9glBUT+lcniT5FvI+HkSI5T5Fp1SMf2NZ7tqKdf4DsWdJcmR3kFtxD2FhaTwQfUgiuRcX+i5jPsWk4fWypmq1y4eXsPAKJvzjpDBfpEYSlQs+vpJi6e5Cj/5GXFKP2B79j6dQdGxrVIkGVq56WLo3ICkLEwwu+4lIUASjZFbIIyk84J9L/eKy2vdM+uHT3qRDbV8Op46bvQQPqjySnsuK99j6W0j2+IWa18TqdMaurEx+DZZkqPntvOQUJebBBB2uJwpOQSOPfHIrzqLqPI1ldYci8M/iDNvWHGIhdLcdCx5K2gfMoehVnHpVnm7opnPEKqbWJTSyzW2SapFxcXBcS+42FxyLxJMv9bspU4kpMnTFVEKtrRizA3+xqHf+Von/iE6ZweqXSycJKUd62x3ZLSzxub2hTjef5glJB9FobPkCDRGweEzVerbLfL4yzHi6fsCgqZJddQp5ho52uqZSrclBA5V5A5BPBq5WqOt37y6NnWsW9UVya0Ge6l4LCU7hu4wPNII/OoXpi9q0OuY7FtduvSJ0R2BMt9zeW3FuEZ0bXWlqbG5GU8hQCilQScHGDLMg5b6hYRSthk2lCyhchmZGKkg30aXa4vY6dJub7gm8QHNE3ppjdemLVdSxnNpUqodVcAixclAQQLjVqWwtcEACOBaA8OOnNRQUzE3Z69NBZaX2VdtKVjGUqSPmSoZBwSDgj3rpFk6F2PTqEqi2eGyseTrqRv/AOyuf1qRae05adFwFxNP2+RZ4Tzzkpxlyeqc8XnFFayuQpCFOcnaCUg7UpGOK/VjnPr71PZPSvHsSAmY1ijqp5SWLfkSCq3H4CIwc/qVlPBZrSstYQjaSQsyZuTbvAIZt+fjU+UYbwm3q6R3rSs68XGyx71s+GukC2P3BVslBxCkKU2yC8GXEpcacU2CQHQfQ1r9CaQmaB0jBs9xvadRToKCh+4oU4puQskqOwuALKE52JKgCUoBrbUrZuW8m0mClRSu7BU0DU19i2ok8AkniwFhtxxrzNXUKux+nMmslopaZ7QlVA3CaFUHdgoFyQWa5sdiDdSlKl0QKFKUpCFKUpCFKUpCFKUpCFKUpCFKUpCFKUpCFKUpCFKUpCFKUpCFKUpCFKUpCFKUpCFKUpCP/9k="
-tent_3_url = "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQEBLAEsAAD/2wBDAAIBAQIBAQICAgICAgICAwUDAwMDAwYEBAMFBwYHBwcGBwcICQsJCAgKCAcHCg0KCgsMDAwMBwkODw0MDgsMDAz/2wBDAQICAgMDAwYDAwYMCAcIDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAz/wAARCABkAGQDASIAAhEBAxEB/8QAHgABAAICAwEBAQAAAAAAAAAAAAYHBQkDBAgCCgH/xABDEAABAwIDBQQFCAYLAAAAAAABAgMEAAUGERIHCBMhMQkUQVEiYXGBoRUWIyQyUpGSQlNygsHCCjM0NXSisbKz0+H/xAAcAQACAgMBAQAAAAAAAAAAAAAACAYHAgMFBAn/xAA3EQABAgQEAwMKBgMAAAAAAAABAAIDBAURBhIhMQdBURNxgRQiM2FykaGxsvAVUpLC0fEyYuH/2gAMAwEAAhEDEQA/ALEpSlPQkrSlKUISlACpQABKlHIADmTWfY2X359IUYPCSeebr7aSPanVq+FcupVynU4B1QmGQgds72tvbe2Yi/gulT6PPz5LZGA+KRvka51r7Xyg28VgKVMrZsHv94jyXI/yeruqApSVSdGokhKUAkBOokgAEj21D32HIr7jLzbjLzKy2424kpW2oHIpUDzBBBBB5gitNHxJSqrnFNmGRcls2VwNr7Xt11sdjY9FtqtAqVMy/iEB0LNtmaRe29r9NLjcXHVfNKUrtLkJSlKEJSlKEJSlKEJXYtFolYguLcODHelynPstNJ1KPr9QHiTyHjWUwlhi24jaWmViK22ebxUpYjTCEd7HjpWVDI58uQUfVVj4h24WvdiwzHcvWH4FntcyU3DRIt0sSO8PKCigK4iUOKJSlRzOeQB51UuPOKkGgl8rKQDFjt3B81jdAQSdzvs0a2PnBWtgfhdMV0MmZiKIcF21rF7tSLAbDbcnS480rn2d7ClYVSmbcND1yIzSlPpNxfYfFXmroOg8zLWsGKkHU4eCz4rI6+oDxqIwt9LB8qGlxbzLDixmEuS4yin3cUDP251wyd7/AAa8vU5dEqV/i4v/AHUluJMRVatzrp6oEuedNrBo5NaOQHLxJuSSW8w/heSo8m2SkWBrB67knm5x5k/8AAAAnuI2WoGB7gzHRw20pZyHiTx2syfXWB2tbIWNpyO/Q1MxMQtpCdbh0M3FIGQS4eiXAAAlw8iMkqyGSkQ/EG9xgedYJUVN0Slx/hhJU6yUjS6hZzKXD4JPh1yrkXvoYAR1vCfyKP8AtBrRhut1ahT7ajTSWxG9dnA7tcObTzHcQQQCNmIMMyVaknSE+zMw7dWnk5p5EfyCCCQayvFnmYeuj0GfFfhzI5ycZeQUrR5cvIjmCORBBGYrrVYmKN77Zji22JiXWVFuDLYIZLjL4cj58/o3Et6kc+ZAOknqDVUubQMM3O+qjWe9MTUPOlMZoof4+nmRrKmUIzAHMg8/ADoHMwXxppVYDJafaZeYcQ0A+cxzibDK4ai55OAtfd2pSmYv4L1mkZ5mTHbwGguJGjmtAuczSdbDm0m9thsslSlKudU4lKUoQlKUoQpBsxtbd2xiw282lxlLbq3EKTqSoaCnIj2qFf3b1u1YV2iYBkxZrM+FDt6jc2WrfMcjNtPNIXpWlpJ4WeSlDPRmQo1k9ikfO8z5H6qOlv2alZ/yVJtoK+LhC5tj7UiOtge1Y0D4qpR+NU/2mIHQ7+jhtb77v/cmq4OyZg0JsUbxIjnX7rM/avMuG+yx2g3m0RZD2JmI/eGkrKC4olOYzy5JFZdrsksWEfTYzSn9lLh/mFe+4DXBhtNgfZQAK7Cm9SaWvy6KVfvaO6n3la7cb9ldesM4WVOONXipuZCaUNDnNDsxhpfVf3XFf+dalaeyC4TmmRjKcrwOlCv4rq4O1G2vnd33CNpWMkqSJFjjQnYiSebshVxioaSPP01A8ugBPQGr3wji607ZNmWHcb4alN3DDuLLczdLfJaOpLjTqQofvJzKVDqFJIPMGszMTHZiJyuR4i38rDtxnyZjfvP3yXjuF2PVmeH02K7orzyQP4k184h3OcP7rlxtbcFtq5SZbLj6LjIjo7y2rUULbSsDPTp0+v0yOlezo6i2cjVW74No73guy3HT6UGcuMSPAPN6ufqzYH4+urN4L1QQ8XSrJixa/M3UA2OUlpHrzBtjyVb8XJeNFwvMGE4gtyu0J1GYBwPqyk3C8/0pSn8SRpSlKEJSlKEKfbIkd3skx79c+Ee0JSD/ADGsxe/rwhx+veLhDby8wZLWfwzrD4HX3LC0cdFOFbh96jl8AKzFgV8o45w6x1C7klZ/cadcHxQKRPiVUPKK5PxujnN/QMg+lOtw9kfJ6JJQurWu/X5/7lfoVwwB7q7MeQ0w0px1SUpSMySQPieX48qie0baTaNmGHnLleJiIsdGegdXHlfdQnxPT1DqSBzrUv2z3amYgc2f/M/D8x6yfOhK2ktR3Sl5uGOTjy1DnqXnoT06rIyKTnTsjJxJqKIbOfNWjFa2HBMaJoB92Vb9v12p8Perxq1sjwHOblYDwfcjLutyjrCmb9c2wttIaV+lHjhbgSocnXFqVzSho1X/AGSvbgYw7OZ75mX6GvG2yOfILz1mcd0ybM4s+m9DcOejM81NkFCjmcgrnXhRchKU5Dw6ZDpXFxs3fGrKh0qXbLeSkXb8b9e/+tlCok890btv6t0++/dfrE3fd8DZfvg4YavGznFMS7cRpLz1ue+guUIEZ5OME55D76CpB8FGslt2tfy5sevzIGbkZpExHq4TiVqP5Ase+vzI7pe3y5bK8awW49wlQVJeC4Ulh5TTkV0+CVAgpCvUeR9prcZuxdqBiK74dZsuLoRxhEujJgB9nJu4kOpLenppdJ1ZZEBRJ5qNR+Rl30Wry9RhHSFEY/wa4G3jay7U9JtrFJjybd4jHNt63NI+BN1PKV9OMORXFNOJ0uNEoWPJQ5EfjXzX0k7l880pSlCEp3pyEeMzHZlOsniIYdOTb5HMIUfAKyyJ8jSla40MRIboZuAQRpodeh6rZBiGHEbEFrgg66jTqOi6uzPGCMLXlvDbkmRJtdwaXPw3LkqJeej6jxYjpPMvx16kkHmUgHwJM8hbQ4mAMQRbxO1Kj2xmRKIHmG9A/wCSqfxzh0zym3pkdx+UpaZVpm9Pkq7pGTaj5NyEjhrHTUEk81Gp1u2S07e7g9EukNUO4W+BIj3SC4kgxnwtpJGR/RORKT4j1g0gmPqDHos3Gk5jWx0P5gdj4j3G43BT0YMrUGsyUGel9LjUflI3HgfeLHYhULtf3gbjtq2t3KXMcfTFkNoVAYW4S2wlsBKkpHRIOYXkPFTh8a1T73FwxBtn294gvzlsuSrfxjDtv0KilMRrNDZHlr5uEebiq2xbxWzbBeEMVpZwziSPe5TL60yokMh9qF6KkqSp5J06vSy4YzUOeenkDB7XsXcxKPqmG5M4ebMNbg+AqGU6ebLHMxt9LKxpinOnZcMiHKAb9/3qtQL+FZUX+tivtfttlP8AqK4DZFK8K3Hu7qyXR9dw9a4OfhcJDEM/g6tJrF3Pc1wBOBF3+YbCvFJUuUfxYbcT8a7ja8ecMrjuwsB/jFHu/hahG4L0RQUnUMuY9Xsrbt/R6Nnit53aFKxTcCly37LWmJMto9XLk8XBEzH3RwXn8x0U0gdCawF13ENgTgPfu8KV4m1Qnkt+4rkNH/LUo3dML7J90bG7t42bs4+tt8ebDUh2Fi9+GmagEkIejI4iHUA8wlzUAeY5155+ebNwTCYCHHbY/I3+CylaRHlXF4eMvPceOoA+K9ibXbR8hbU8RRQNKE3B1xA8kLVxEj8qhUdqN4Y2tXna9iqfcrlabhCS42lS5UtLwXKWAhCObgSk5ITl9GkDkM+eVSSns4f1iNU6DLzExDdDeGhrg4EXLQAXC9jZxFxp1HK5RTHtEhUquR5WBFbEbfMC03sHahptfVux16HS9gpSlTJQ5KUpQhdS+2SPiSzSYEtJXHlILawDkoeRB8FA5EHwIBqjINx2nWTGt8j3W13C+OLkqEeeIiXmJTHLQc/sA5dUqyIPXzq/qVAcbcPKdicQzOOcxzNnNtcjobg7HUdLnqVP8D8Ralhd0QyTWvbE3a69geosRrbQ9bDoFUMVrahcD9DDRZs+WoSI0X8eBqV+IzrlkbIMcYn/AL4xNDT6+LInZe5fDq2aVG5LgZheBpFbEi+08j6AxSed48Yqjm8J0OF7LAfrL1VsLdhbV/bsR3J3z7pHaj5/n4lZaFu4YXjj6w3cp6h0L891PwbKAfeKnlKlknw3wvK+ikYZ9puf68yiM9xKxTN+ln4g9l2T6Mqjtv2RYVthSprDtnK09FuxUvOD95YKvjUgisNwGA0w2hhtPRDaQlI9w5V9UqVyshKyoyy0NrB/q0D5AKIzc9MzTs01Ec89XEu+ZKE50pSvWvKlKUoQlKUoQlKUoQlKUoQlKUoQlKUoQlKUoQlKUoQv/9k="
-tent_4_url = "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQEAYABgAAD/2wBDAAIBAQIBAQICAgICAgICAwUDAwMDAwYEBAMFBwYHBwcGBwcICQsJCAgKCAcHCg0KCgsMDAwMBwkODw0MDgsMDAz/2wBDAQICAgMDAwYDAwYMCAcIDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAz/wAARCABkAGQDASIAAhEBAxEB/8QAHgAAAQQDAQEBAAAAAAAAAAAABQAEBwgDBgkCAQr/xABAEAACAQMDAgQDBQYDBgcAAAABAgMEBREABhIHIQgTMUEiUWEUMnGBkQkjQlKhsRUzwRY0YoLh8CRTZJLC0dL/xAAcAQACAwEBAQEAAAAAAAAAAAADBQIEBgcBCAD/xAA3EQABAgQDBgMGBAcAAAAAAAABAgQAAxEhBRJRBhMxQWGRFHGhByIygbHRFlLB8DNCU4KS0vH/2gAMAwEAAhEDEQA/AOSlFTKIv4ueRgY7Ed8/6f10SpKfA+vy1io4DkY99XH/AGVPhc2p1R3bW7w33Tx3Kw7fmWGjtkv+TX1WAxMo/ijjUqePoxYZyAQehTVJQjOqJkUiq1Ft+sqaQ1EdFWSQL6yLCzIPzxjXqCEEDX6FNr+IWx2GyR22hhoKG2xp5a0dPCkVOq+nERqAoH0xjVDv2tXhV2JuLZk3U7Y1tobDeLfKgvdDRRrFTV0TsFE6xrhUkVivLiAGUknBBLUZL7OvIpNIhHOaKk5DWcUnH/prOlNw9/8AXWeOEn+FfyONMMkQUmGiJx9Ry168rA068lW9f7a9SQKVXioTiMEjPx9ycnJ+uO2OwHvknzIYEpMMWiD57Y+msU1MpjK+WuWIPL3Hr6fjn+g0QaJhGy8m4sQxUHsSM4OPpk/qdYHiKf8A1qBTrAymBM1v5A6H11uUn93yHYZ5d++O+j0v/Y0zrUVQvcMWGTjPw9z2P9+2fUfXUKCIZTGu1VvBnbip457ZOSB9TpaKSRKW9R+ulqOWPLw0oEUSL5isUz3CnB1P/hm6/S9N9lT2lJTHxq2qOxxy5Ko/+P8AbUD00KqqMrcmI+IYxxOf6+x0QpA0LBl5KfmNX1SwsUMOyiLeUvi+qUH+9N/7tC+rPism3L0zu1raZpP8Sh+z8c5zkjP6DJ1WtamoppWjkLrJGSrA+oI9Rp9Q0kl0dc8vpoSWqAaxAyxGOJMj56dRUEkkTSLGxRCFJ+ROcf2OtmsfT56jicBuw76n7o1+z43L1AtMN5u7QbP2zIAwud0jIepU9/8Aw9PkPMSO4JKI38+e2gYhijRhJLh4sIQOZNP++QvH6W3mTFZJYqekVd+xSAfdP6aTU3lxK3IBiSCmD2Axg/Lvk+nfsfTtm9m8v2ZNtv8AYKes2BfqmqqmTBob75cDV7AlS0MyqqRliO0UqgKPWY6rT1G6C3jp5fJrXe7XW2m5QDL09VCY3x7MM/eU+zLlT6gkaX4LtNhmLS94wmhfOnA01oaGnWlIk6YzpByzU0/esRI0ePp/bXySFR8m+vz1sF92jJa6h1KjkhIIBDD8iOx/LWt3GoWjfjj4/fBxjTzLXhC9YAFTGKsp1c5VRH2AwCe5x69/n6/nodV0px/NohHVipVsfFx9R7jWOSIy5Cqz9icKMkADJP5AZ/LQVSxA8ukA5qcmT0/ppafSovP+HS0PdCIwJoe7D4f00Yj/AHkrNxVeRzxX0X6DRKs6Z1lBtSxXSOpoao33zfKpoKhHmhCNx/eKG5R5OSOYXIwQSD2kHw0+CLqR4o3qKnbtnS37dt7YuG5L1N/h9mtwH3i87j4iPdYldhkEgDvok583kyzOmrCUp4kmlO/lbXlDBanKlZUJp6xHNDCJJFX+HVmfCv4E97df7It7paOCw7Mp2zNuS9y/YrVFnsfLdu8zHGOMQY5ABxqTOm3Sjof4Wa2FbfRHr1v9GVUrblSNFtqim9hBRgl6tge2ZWKn4WUD01ZrZnRXqj4p7xS3Xfl6ms1vhCimoyitPTxnsEhpUKx04wMEOY2wAeL+/GNpvbCgKLTZ+UZ0zhmNkjrf0J8iI0mH4BOCN7iCso059hGo9MulPTPw9tCu3aNt9bnjIH+OXil400D/ADpaIn4T7h5jyBHYEHGps2n4Zd9dcapbvepJrdT1A5CruILTuh7/ALqEYIB7EDCKc5BOp66HeFvaPSimjejtcc9Uqsr1NWRVzSg9slioC5GfhjVFwxDB8BtSlX74tFghmkkkjqmpVaWoPmqsUKKCS8kzHgijByWPbByBrkTjZ/EsbneM2mdFQ5ISSEjpXj8kgEcjDUP5bcbtkinU8Yr/AHHwNVlr2lT/AOzt2kmmjRvMprkoCTnkclXUfDn+Uj8X1B/VqlmssA2z1K2gt4tfcx01xBWSEHsXpapMsh7Y5IWXtjt31cLoD4ztp9erXdBZ+VUtnqWp5fLTjKqciEn8o/G0Uncq4wO2CitldGuoVs2/1FsctPLHQ3SjkVl4vEspjz78WBCnsDhh3KjIOMatu9mkoCXGCODJmJpSlSLdDceYNOhMClv5lSh0jMkxyR6t/s7YuodHUXDo9eF3JPxaU7Xurx016jA7nyGyIqoDufgIYDAwSdUL6mbTuGydy1tsu1DXWu6UMhjqqOtganqKd/5XjcBlP0I12c69eDGjSrmrto3CSyVSv5iU8jtNS5HcYPeSMg+mPN+fwD0r31s33/tFQQbY8QWwY99WuFfs9DfFl8q9W9f/AE1wjyXx94xSluRwGAHbW12a9rmJYaoNdpZWZPDeIv3H3oSb1gLjZ2S4G8Zm/wCU/pHLtbi1JMsi+q+o+Y+WjCzx1sCyxnIb9R9DqyfVL9lpU7ytlVuDoJuiPqlaYVMs+3apUot1WxPk0GRHVAenOEqWJwsbaqktsvG2rpV09Vb62hmoZvIraerhaGamcHBV42AdWB7EEZHoca+gMNxjDsVbhwwmpWOhuOhHEadeUZufhs2WcikkHSCEq8X9R+elozvzZkmyr/8AYWrLfX/uYplmpKhJoyroHA5IzLyAOGAJ4sCD3B0tSTMSoVEL1SSDQxq+x91Xbat+huVpuFTa6uhPKOrilaNoM5GVYdwT39O5/XUg2jxTbutfTyl2mt0qK6wUE/n0dNcGNStJnu6RBifJjdsM0cRVSUQnLLyMYUlquFyg5RUM6wxn4E4kZz79/vE47n8PYAA3R9PrjJCG48ZC2OPB+w+ecev0/rqWINcOdSjIfBK0niDQ/v8ASLaXG6WFIXlI0MdJv2bfVFt99I9wboktNrt9y/xuKzJPDCnIJDSxu/BuPJOXnKWAJLHuSSdXM2H1IFAFMjoOCrLmR+EbK3ILg+5yp7KD6fXVEvAbax058JlmjmkZmut9r7jgoUMjARU/pnPEeSMn1OMDHqJ13pV2++VtHS3asq6GOntLyS1FPMYWiMkiv3x2ZVEbgqQVxjAHbHydjktozxWe3w8ZZSFEJFSad6m5rxPpG+ZpU4bInTDUqFa66aRP2+vGJYNm0rQ1dfNcKhV4/YaIEFvo3fl9cSMo+WdQXv8A6rb28W0y2WNo9v7SEgMlLESIWwcgysMGZgcEIAFzxJ7jnqDdk7ihunlOsKpG2CFI7/n7f9++pz6cbiVaijjZxDD5iK2PuouRn+mhImLPxmAqSlP8MRXyPxIWzof4jb5bbTdqrbsm27pPbrfdOf8AmLE/lMZu2OEjIX7gphgCABnVwtgePajvtNTpuyjSjqpEBS6UBPkzgjs2VJZcjsPvL3J5AdtcQ774jqjdNBcHqKWlkqLtcGub1UgLzpzLsY1yeIUmTJwvIlV74GNEdl+MSv6SbqpjYp6+LbfCL7XbJ5fPjmk8tfOZQ2RHykDMCoVgCAScaM3ZuwCkxtcYwdiukxscqgACORIAuOYrz4jyju3ed/0m7rcs9tutJXRzAcCZAvID2Vl+Bu3yx3IydQzuPd0kl/p6eqjjmpKmYLNTVMQkjlQnHxKwIYHB+YPtnVPfAz4k6PxM7Q3bVVUM1lv1jEdPJRUdY60tcJ45PLlI7MV5RupjYsBxGWYNx1ZbqxueN9wUNUH40tfFDVwsF/yycDP4HjkgfzZHfsUuJbyWSibZQ+1fWEEluEmkc+uo/iev20OpUlLbaO22yTalxqKRW+zrNJOY5nRhJyHFlOCpBU/CeOSNR5vfrNuTqRc9wV1yvV0rqzc7rJdhUVckz13Ahk5MzEuqYGFJPDA49h8O8eK/pPJT+I/ezQtLEtVe6msZWKMuJ3M2VwR2PmAj2wfXUWXLp3Xw1A8ho2j5ZDNIqsnyPr/bX1RsqzwBiyllglEvMlJN7mwN1EkmnKptyjmz7EFzZ5E6YSUkjSl+lhGuAiIny5qhVPfCv20tP6ja9weU+db5Hk93hq4kD/Ugg9/qMfhnJK1qfGNTfeJ/yT94q5kn+b1ETHTVVhwvGHzST3Cs4I+vcjWwWm3bfkiM0yxrAp44Ezq0jevFe/1BJ9FBHqSobUaG2R1J8wSR09PFx54hVi3/AAgn3OP0yfbRIBqqbJkhSMLwjjWBeMQznt7+57nOSSfXXAPDuSkHxBH9y6/QjtGfIMW16b18J2r0+ssCxrA9K8/BGOFSWollOM5JAVj6nTjxS9S1F+kslPHGayvpoo3nDv5io7SK8eM8cFctkqWzjBAJBDdBhT3qj2zfIKhWitNpFtliYANFPCqozduwDLlvwcar71o8RdYviH3FXU1iku1LS1H2Smkat8lHESLEXUBH5I3EsrZGQ2R2I1zOQxdOn01KQVKCiTU9eZOveOxpfNmrCSZiwBlSB1sNLxYbYNC0XDHoMAaXi28SVL4YvDteLvJOi3q5wS22xU3LElTWOnEOB/JCG81z6YVVzydAa7Hxt7uoaBo7XtGz01RjCyVdTNVKv14r5eT+ePoR21Ce9dqbw8SnUSKu3LXV16u1Qpp6YGNBHAO5SKKIFUjj5kcuIGMs5DNnOiZ7PuDMEx3RKE3N6k08rAa3hVMxyQsiU0qtajQUHM2FuJOgpEHpuaZKTJoR5a4QFTxx2/D8NN5r2tT96KaP9CNW5vPgLrLJ0uqIVhatuACM7xqznIdQQgHfAUccYPbPbPpDO6PDbXbV3DWW6aFvNo5TGSp7N8iPxGD+etOzctHJO5IqOvlf1hxtGxxvA0oViKCkKCTUiwKs1E1HP3T2gl4B+rkfS3r5ErFaij3BSPQzU0pkjjmZCJ4wzIVYZMbJlWBHmnBBwR086w36O6dL7DeKfisPlxsgU4VY5Iwy/kAqj/m1ymtfSOusV4o6+mWRKigqI6mI/J0YMM/prof0a3qOrfhOhoV/d3Kjp5IHpncNJGYpT5X/AClVjAbAB7+ncayG2TBSSHKfhIofMcPS3yirgONIcq3ayAqthqIi7xObVrNz9XLhWQ1dBDFcKaknpmmDZjP2aJWViAfhZ1Y5/hJJ9CdRHc9jX6klZGal5RnDKCAQfzA1KvXi9NNvYUtHVxsLTRQ2+Z2TkHmj5FyO49OXDB90OtBaatrTwkufKYYERaJeLKBgRn5fQ+3oe2OG+2fxJ8lhJSpSLISAFJVWgAArQaRzfGCPHTshBGZX1jTqnbN+Ev8AlcvqHj//AFpa2SW5ujlWPFgcEYxj8tLTb8QPf6Uvsr/aF+ZUapRbuYp8NPUH6kdtGaDeclUqtDTrxj/hUx4/TWgWOO63efy4ZRI2MnDccD69gNGrdsi5TSOvlqjRnvkhQT69jnv+Wrk1qzScrlQBF7kWHUEwSiAfeiQqHqBdqWB4o/tEMUjcnjWdVVmAxkgds4H9NZG3TWVacZYmkU4OGmBGmez9oU0VEktxL1VVIoyrOVWIewwD3P1OdK+bDMldG1ulZYZAeSO+RER9Sc4Py7n/AEz8t1hhcmSBSlfeIABp1+mvLlUalJzUBtyh2twcL/uUfL17Mv8ArontfqFNsXcNDdqe1pUzUcvLhhWX07ggf9R+PprWYentwgR+Bj9fRZBl/wAO/wDfGh9RTPS1Hkzeckp7hHXDH8tOm7dm5qhJTMHMA8iOh4RZYvJjVwh03NFoIUk6EGoOljeLKW/xhWih29G0tjvD1DSMDAiK2FJyCWOPnjuB6HUO7/6pVHUDf1yvFVS8nuM7TyyTtykZicks5yWY98kjJJz20Dj2NUVloWqEy8mXzEiyQzD19vc/LTeTa9yiAzC/f5FT/rpdhuF4K1mTFN8oUag1UbXrYEjhreNrtV7TMb2iZymGJrSqXKplASBcDLUkXJp8ukFkv8MEgeNfLZTkMAARrLHv+somDw1tRDIp7FGww/A61iGkqauq8lFk5cwjFoyAhP8AN8tEbhsyaJofKq0lV2AkJTh5Y9yO5z/Q+n5WnchhKUEOSKnUVt2I8q8eUYAWNYyV+7MrmR435EnLIMknufbOhlz3D9o7t5a8vdRxzoxVbbtiU3lqsiv/AObzPIn549P6a1Ot2/WxrM3mQkKSFHLBkHzHsM/U6qMnWHTSSPdpqAK15jjHqcsfJbqof7x/XS0wNhlOC9TErEZIAzj89LV/fsRbP6H7RO0ZLfdZh8Xw8sAZ+mi1Pc5pV+9xPbuNLS0kMtObhHioKUlwk7fhohT3CRgPu/ppaWqMxKdIGeMPFucw/i19Lmol5t9/2b3Xt7aWlqMtIFwIjHpZnp0ZgzMf+LvphcJpOSsJZF8xu4HoO3t+mlpavM0pMy4/dokmMM10li+7xHt6aY1N7qM/eGlpaNLloNyB2j8IF1t9qBy+IaB3PcNUB94aWlpu1kS6/CO0ETAGo3FVGU/ENLS0tOQ3lflHYQSP/9k="
-tent_5_url = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEYAAABGCAIAAAD+THXTAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsIAAA7CARUoSoAAABdcSURBVGje3VtpkFxXdX73rf16nd3SSNZYsizLkmwLS5aMRdlgXGbHQIA4lCFVWSiWPxRFSKUqSaVMFakiCanggAlhM5BgMMHCZjG2ZWFL2JKtkSXNaDQjzWg007P3vr5+e757b/dTq2c0Gsk2UFy7Wt2v+913zj3nfOc7594hvu8Lf1xDFP7oxuurks9G80fP815vv5Bfj0lrtZrjOK7r4lVV1VgsFqiUzWZlWRZFEa+hUAhv/hBVgqCEECx/IJ9hGJZl8Y+LrWTbNv+NoijNKvF5/iAcD6YoFostFyVJWlI+0jSatTXY4FdepWfKr9I++Xweqw754vH4YtNdzKSLfwAvLZfL0CocDuu6/vtRCY+vVCrwHEQLPsLTAhF5qHA74JV7Gga8Ds7GbQUzwrzNGmqahvfVahVTRaNR/ODKBCNXYGVIVigUIHcikQjWPpVKcfmw3l1dXVx0DNM0AQmQD99Cz87OzmCeTCYDrbjm0CESiQSejFtwBRb7XVgJSwhnwxvgVbM78UBf7Gz8K65Sy7f8Ol+FxdAHP4RuQMvLxYzLgwcsOfTB4znErdQTlpHJP2/5llugLZIBHne5fiRfFlIjfgLXb5GAZ9UlVcWVFnyjmhA6iyd4xCMtGTmAe9wFp8Cby4qrlcYS7AP3aHl2S1YJIDiQgGvIhWvcQtiLJEiC64nENX3f9QWRw3rzKjT7Lb5aeVytyEqALOABZgceBCHEvSIIku7u7uD3uVyOp1p8hd8H+A6VF7IFSRTt7KhfngRYdl33RjkU55FTKpX4bHhtRpF0Os2JSEueuHKVMB1ExGMWe5TIBlepJfp53MN9uJ9Sd8DSWBUhPWjlxvENIargu9OH/ie+cU/72m3Ns7VABb+IFcQbwOBroBKYwWJqs4LgE3zi0RsIHkFso1CYHHSK065rSaIqyJrn2B4RNS1eGn1Ri7SLeo8gVM/DxSKAgQxIg8hdQXq4cpVg8WX0CUzXAmuIe1nQ8erWcnPnDvrFDOwFzBYJqKrqurbPbnQFWdaihZP7I9veTkTZ9Vyy6Fl+Y/AUApWWZ4PLwQMnKSAHwf1Qj+vAPR6pszneAnjQwlEiEGNhtJY945XygAJkWaCbLwC74G+e7dr1OX16UbBrJNrddeM9WAHMwaktBwy8bxYA12EuQMUyKsnLuxxWBckucG7O6AL+Eng2PpZKZXgaQRApITs/YcwP+dWa57uCqDqihLCh6ydpHqzjukQkvldfaRGmVEJecdZIjbf1bsJkqEsAFfyhUKlZADwdUuHRzau5UpUsNnhoLpk6W6oGgXiioKgayQ09mz16CNaM965KrNtASz4PrgtT0dtch/E9FmXQCqneF4mI1KRG8iMHw119qqpxSAhgvUUAeAe06ujouGz2wLPqxfS5wO5MPGCYEk+Ujj4xtu/pI88cmDg5VDK0+dERWY/RL138SvQciwEG/TlUwSz0XvoM+p8iSdmRA/whSxbFzeGN5b48lZBYAZpYj8D6vMBeDNk0zSNnekRNdBQOPfLMQ9/a/9Sv1u68wXHLJ5/4se11JvsPqPFuKrxjeQhdURI9JB+K78ixTFXiihTlPTFUS00UZ0cFUWKrdn4FAwEC9IN4lwcPAAae8jGQZIM1A1kOnBhujXkpVkOimCYvDD/35QcmZor3fuo+I5fRO9oPfuthqXNj3843RaPVjr6b7EpKIFggUcYaEJdcQGwxCZSVfJfO2r37flVTEG38S0AUFxIiQYAAxC9WZS5tJfwad0J6nmH54GguNwYjYA6yuotfFVKvfPvLk5OZD33mz8vpueL8ZK2Q2/7OtxXPHssvLBTmimY1L4hhGjPEo4Zp8iigAz4SWRVgP0JkSSiNHlIkUZJp0cUhmwvAGVmzACt1PHjdksGzeApKAiQ1pIfHn3hwbGDirR99XzY1ZRtGtVLxHaQcsuXO3Wef3UsiV0/1/1Zva3cBEh6/se5X1IFhO6LAMV3TgbUESXNy45XcFLlQtsW1/cXC6dIqBdlmsYsihShaJHPk0dMH+/tuu1lVPadi+IpfmcsgWKya3bl+XU9vYuLoAUtoT589pobjPteJAgBPqphTgk6Ow3MDvgbAi7nhF5bMts3Lio8toi6tEi+e8WqzgTccJDDgA9z9+HWEqx5pN+aPDj/6fT8av377xkqxSB/qivMTSXyPTGxWaze8ZU/m1CFVb584fsqyiiLRPCoN1lvEDCKRiSzbjsUyFK5BINGTFaeay4z1e5QW2rx24pk9kI3LuaSh5MVMFLkZdXKQ3dra2jhBxhUkhGq1ygKAhDQpHmsbeuQ/ziVzd91/bwkoAkpBsHLVdNVNZ0tdCZVGuOxv2rV9cO93bvmLz8wPvLx29z1ucYEZhxoKAWPBPj6vQ4IV9kUtXJ4e8mOrfFFvb4sHAiAFB7LhYnt7+6WtFKB2cx3GcZNfp+BLKFAqWtvI4/8y0j+++Y5dWGDHshHmjgC/846dTp2ZnFFFGb+zLLd3y7XReGiq/8V8iVTmTpNQHCtCqbkPfwNcIkeLFDFoguDtWBZdvmdMHgGg86zbQs+X4XHikgUsT978dQlWDGto0eLovuRvDgiJWO+1vZZpUKhA+QlqY1rHxxZyhq2gzqMI4kPXG95ya/LQvlhH3+jLLwFKBZrfKKRTHRA/ePF5bPJoYUspKUJpwc1PQCtf8BdDxWWoFJSiPLu1UmzYQlQVrzj0yFdPnUre9t67HKtWz2OSgkgvTp0bdYXk1IInQ3Bqbt924D1Xb77m1DOPdVyzc6x/vxxqA3egWZaDGGxGE7aIWAq4Hx5O1Ig1PeCDEwqkpYZfprfeqhJCBZGn67rGBt6YbNTYQICGdT3enpj81dcnBmfX37pVDcmu5VCZGL0xjVIlV0ZiPzaclLgpmBSWYfbtvNHOJtMTE7UiaGnGl0LUNrTtzH4D52P0iNRLM1bti7LvWqlTByzb5wJAWy4bimXAFVhb0CRcWiUsNrg27kRBHmcDLBiFF1ABcVksFqBSLBYtDT8/+tx+MOQNt2w2iiVG8NjtENCypnM5vB8YnlbFGtJWo4hA7Knrd2ydfGm/HO8bO7JPi8VdkSVdjzAxSKPJQuhCEFhMAbyCyNdSY8W5sWLFzBVQ5EvxxoBuKLc5XC2n0uJ+WjM8ILGC15x4+Euzc8bmN92kiJIDosYgAyGBaPIr1cFxSqDyCC8bCT7wDd8xnb5bd8Coc6+85Gt9MycPKVqMCU+NycokNg+dSAR3AOBw4wG9K2OHFVWWiOwJXguYLdE+WLJEbdWKwhNQStYUceRnX02OpWKrOtf1rbGqBqkHN/U6+IxrVM4slPldZ8anVAQdy0H4iahoTs3afMetUycOSqFQZnzK9auEYZ3n+QGn96mgEsgPShJO02FqzFubGQL2CCvoFYiLu2ctYUfTq+sAnqWwPn1k7+ATPzP90O533VnIF2jouxTSuTUgdyGfP5OqaOzGZ186HdNVKi9+IQP/iFEu6F1t171h6+DjP1au2px8Yb/S1u1R16izJOp/WHgXedxBWU99kaKi5yuqNTNglRckWWmBMXjWcqkWAYfEip8ieAKgQ+alYC6pvpUd+Ol3S1a4b9f1QDG6oYTiDUDFqApt0BE/ky7mLI/JIrw8lNQ1iQaGJGOBLaMoQz7HXXPjxuSpsVLyXM0xr8lMSXrcr1UoDWIrSWAfoYXOMVwH350dEFZfU0L0knqrlKfaFli+wEoU0MJhvCLmOMIAUnQ6wiFVPvGDB5Jjc0JE33LLFgPVFBYeEcxKAJrB4ECuMzm9YFg03rGYI7Npx/MlRVZk1TGrrGckAeyVcPi62246e/Cp3k27D/9qL4RxaUMC7oCgor1Xgcem7zWYHausRc0qTOcmB22PNn35RiOTTW9ttV8s1YqNWpmvVm7k2fF9Bxby1ps+cGeZIo+KGHLMMqXRPI3ASJaVTBWq7AZYv2JY52bmQ5puWSYK9EZNJyCiVm/eEGlTh598rPPaXdPHX1RDIejQACb6j0g4W6/zb8KysKjoVvIY8Uy6mkRcaSw1F+Feo91ulef7v/2veVPfsnuLKFN2Cbd37BqFWoYoFFdQaZaL0wXLa0RFpVobT2ZQnbOAq68OUioW37ScTbu3l2bPmCV7euycVzMQbKxF4fG6nWFKvb3OwAOYTvEJnNZIHhNEhebmlavE0ZzWW4xu4ePx//3n3FTRDpHrdm31arTWdkyDNlAaTkxR3heKuUIyU2ET0csArJFkOqT4nJSSutOLrGnpta9ZddUN68+98Ito746Bp34S0ttg8KBh53l1GKxrhWsurQihWW1uxCvOQD3f9y6tEp6bTqeRW7u7u9vZ6O7uzAz/5tyB/QOjs3d/8G4f1ESEPqbge817FnxBjFxhpmjSNhCpN45nc3nqkP4SfMyumVtuv6WcSotW0RBi86ePSGqcbmScH2KwXhRiVNV3KcCJqlYeP9TZ2RGORtKpNOLqEipxEOcVMoZdmTv00D+l09rOt96uxcKoV6EPI+MUdOp7MMy+nu2kM7kZ25cJjSvWAxcGT8/WTDcoYC/MDVgVcdd77j629wcdV206dehF16tKRGEZlw+PU0e8omRjqcSmiyMqxKzMDx3U1JBtW5fmeLzWD/ayhn76lfK8aaje9TuvM4o1mucFh/cOGsUmRVSsrWNbqXyRNWh43UARYnQq66JKEy8siqEiq1kkUY72RDvX9EwceT7UtWny8LNarNP3Xa/xyzrjxsK5nmDbNBDp5EhTujlz2qxkJdodkVeqEpZj+sQvRp9+anyuePs791A5XPYwRsSadsdYcY18Y5SGJnNE0eOJhEsxQJBEYS5XBNySRn+z3idjRyQUICEts8n1t91cSI6GFHV4YNxYGCNagvaGGnDCmhMIJCop5+OsXqNNmNkjT8qxdhjwEioFnRffrxz7xpfm5q3V11+zZv3VdtV06/5zvkBkxI8wNiQ4heJExY8oMhiuSCuhej1wdjYfkqRmIMUbRdGoz9iO6zrxNd29G9aMHnhm8667f7v3UVnhZPY8S/L8OgpyfXyGFiBNTnneT03Qgnd5lcDaY9FYvmL0f+8L+ekSSNjOO2/OZ4s+my6gS3VnZ1ain1zXNN2UQcrVEmHrGmS/wyfHI7rEJaoTLiy/Y3uoz6nqYEm1DTu2iV51auiE1rZ+ov95NdImMH7OiZbc0KUOhqwXirVwiVc++3K9bbaMSlQSVSkPPD302KOpirAJFVE4DFrgMoUCZwgGK3mgg5ivWBMLabkRYLw5h8kO9o+DetAtMlo8+pRa0SRRPxvgsa6KpGsbbt2WPXlEj/ccfnKfLMHPFAbjHjcXoxNUGRe5y0W9XKumFyw/9n8PPzo/3C9R7nsxlWhY+OAyv/7PzxUrUlX0N9+8EaRIoO0Bj8qA9WmAHEc8kfasQOLk8YnpGqgt1qSOvZQAQPrjE7NAT5H5Kr7xmWIXEDMKLU7vhj4loefPDidWXf/iYz+KJjqRoInHgBOZmtYQeOdqxNF884VDg3tfTPbuue++f/y3r3ziI4JrkvPNeV9s3raj+8ACOfPr7wpde9ZseUM8okoydRK6Qsi87H/QSr7+NHW61ANESakWc6eTcw5DQ2AI4wuey3KX6XhnJ6YJRZ3zrJk7MI9JetHzDMd5w5tvmx16ZVVXx3NPv7xw9rikhek0sAt+atuyVclMzT3x9OFPPfDD/3r8JRnpSRR616//7I+f+/j6Nb998LPVfIagxCKE7mQxkPWoS4hCfmL4yM9/fv8Xv/nwx94WiclefQ/LZTvhLFRJQ6ZGrAO+3Wp5rsQwgxVAQqP9wRdvYGxu15YNFYdSh+bd9QDWqZ86jhTTYKvp0eGQov/wez/8zOc/W6KUvqbZRjZrPvHC4Knx+Xy21BvXNyfaO3SFW6OzZ9XHv/P9B9/9zrdn1OP7D2x/3wdov4mmLyJaRjU/O/L0v3/+Hf/wlUp6vjCbUlSR6cPaPLyDUWdf9Yq6TttA50rVDO040FDmzWHmkHW3HhiZ1jTV8+vGCQC9+VwBTW62t/bGjUYpp1mln/z62IGnHi9NDCdPJb/xo5f//hu/HDw93yFKN6/p6utMtEcjoWhECWncuXa+9R2f/tleZ+S50YHDmEc2yqXUwNGZ+Wy3P374sUfu+Nv/buvpXRh+xaxVweUaru+z/MkzQ534cUCnUE6kYrGQKhuIHDk438BcEz4KsJvOVgmpJ+9gCyfY1GmwSl/VdVmtqZpcKZe33bz9p8+fvauoPHpsJqGJG7vaYihRJF+WZFVVq7YduWo131zji7rrnntnZhZ6jp5sU0156sSJr933gUIo/P737shE1l29dTv3L0WXiW27supLDiV2LnUql22TkzrAAMPq8lUKxWLZiYAxSJw60O0VqC6pshrShydmC4Ui52s8eIJdI948oBRMoxQOaKaHQjXLT0TDTkhPxCLXdiXiihABS5DZaSNfzHvi+lt2/8lffaKB0SJfLSJpz0/W/ubtHwa5NbbctC6x/uodf/mF995wE2JbJHJ0VV/kqnVuTfJn00SVKOJiTh8ch9BmGxSkGMjwDgEoOrPzJcvxVqskLBNZFFUKewKE6OjoqBZKXiFbLhmhWJh3S4LGrdjEKjzLomUeG5gqosEoqiz59+zYdGpsGkpXLFdta9u66/Y3v/s9nWxXk7Eu0miNCPd+9GP4nzp/qKcTGXXfvlN/+uBNtGUi0v2SaHvHlvs/+fU/+9jYyJmN27b2rF0bDkeIptJNBk1RVcWolD3fRHSIroP3bi776W0dugSCAZO6Iiu29XinSTOAVahaglkinQnfYhUR81gaoAJnv9x4VFE4lioJJiEJRYvoajpT3rbaGUB0rd34vg/f17fhuq6enkb4XbC5SprqI7l3wy13ffKBnsGjPEtRvVlz8K4PfnT3uz/85HceOnvs6PDAlGeVZMfWVBSgIdc0FFGUCQp1nyiiIoev3X6nGlEVUaU7cxL1D1nXXdR3lRIcq1ap5JOGLeUkuuEui8gMNOMw3kEdlArksq6Za3ilmpC3rLWaLGhKulh75vhhR+rc1NV95uCBnbftKZfL9DDRxfvH9BtkFpEXvUzxZU5yAinSmUwhkzKrFataMSslz6y6hunZVqWUy6fmjVLRKpetaqlWKjtOtYpiyTLpcRQiobBWREkFhqqgCqoW0rUQ/sEFBZ5KfddzjbI5P78wODy6YGlrb7xx2xv33P6e9/cqxi//7q+fOj6/8S33fPH7j6zkSK/MKeYFxmvYksU5qUMd8wxd15RVq0EZ8QXYoN509qVi8tIFa+TTXhc/A0ApjJfPZbEK+fR8pVxxioVSPlfOzpUyuVSxUM0VqpVytVKyqiaIOZJxuG/zBz/0kTve8a6r1603TVPSIrs+/jn7oS/3XNsGlqvIlz7FJjcpQ1rakY1r50/Xuo6DB9fB13X1trbApOVCjnZbwXgcR1dWKzJrcgsSyDY8K5xoj3R0wyhRXTu/PcemFhctJkY2m8tn8wCjkOtrnZu+ue90/5MnX+PzeACoXC6n63pwWg1YHBzR5YfU6tBDCFaXJ696gayqfqOPy7ciOXYDZhp3ELqPbde5LL7VNI0/BaNWA1tyOjo6V3iQfKWnJoOTO3hYcB4P8gXHzZqPularVX4IiAsRZUeUg3O+UJLvjWPCYMcfcc8XiK9C0xE+H0Uk9LnEgdIrO64LEy0+/3m+49HS8gy6ck37Bue3Cy4iXNBJab4Yb/x9w+tyXHepcwLkYntyFzlXQFr0XP40z/Ibfq/9aX5+lo3HVcvJ1MDx1IbXcfmCv8VopuTNR2Je/R8okCu+n6vBB95ns9kANsCDoElwaBnx03xoNSBBwJtAc8RVNBoNDtYs3m/+XVip+aBzc1A1v7/YleZs3szH+VdX/KcJr4HjLXmIZYVB1VxoLHbC379KcJLu7m4O6yZtx/qLz8oseb6dH3CC171Ky7wuVuJ/hUFJ7YVQwfc+mjd8g5FIJF5DTYLx/9HAK+PGPHJEAAAAAElFTkSuQmCC"
-grass_url = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAADIAAAAyCAIAAACRXR/mAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsIAAA7CARUoSoAAABhWSURBVBgZBcFnk13pgRDgN518zs25b+fcyhpJVpjxBMe1WXsDmKWg+ACfWAqqgN/Ad34BUOUiLEXhMRvsmmE9wSONkhVarZbU6Xa43ff2zemkN/I88NK/t4BEccDDgb10iXlpELCIMxjHQKd6b4KAFjk2Mm0WRrjfgoYusAZLeaUhNx4Kn1BXNwcjGUac6CJhYWxAFqAwiK0kqh9oxTW/u5mAhlZcGB8dgWSOTyUsHthd0BZUi8ZaIY2PT4SThLm0KGSN4/N4dhqi/BTz4wCb4k//MXz5NLAAbg35g0/hVAmmiqB1Fr19JG1ubD+SnVOuqLQNM2nrD5/JtwfjB0/8Ro0GcDwZxFoqlgOSdMx6J3x8P7r+Pgr7OBbh4VNy5X1Fkj3GuZeUkMn6ORuSLgvQwbYAmPXpRCGWzvDBRDZPZfsEff0owpX3DIq4QLJ5AC7dxC/f+sM2LC0oV7fenfgLc8DOgHRJlqa04xZfmiNByIppLVtQhZx1fsaWLxiODS/MZOv9SaqMDE2Mh2R2nR+9JtBlRgIcv1LQFQlE3JJK2bqjzNUFctoVpYQ1s8jzVcR8uDBjUaEsC+yfhvkcnFtT2H4PEKW5STkeiXxG01xZSGrNBn/vhk772vmA33rPfv6E5gxj9YoxHkvb0Lb3KWOilEeapR/uKqXJVFpgS/WPwICpuSrERE8jqx+GLjIry8BNokaTQ4nbXbpx2TpsB3NZb787eXMfaAT2Qq5poF8XigBPh14e9fY07KwpSRELwdw67PsyoRswFX18ufTwxcjUiYSAq9gw4eZJhAiYThk7tQDEKpHQOw2VKaKY0es3yNkeUpghgnoD2WvifEYdHIXFOQgUkhgOmjxdlldXMmMR7G+JVkfs7EYrU/rCBbh/wj65kzt6y5En/AZeuAqGA9U8ZyhZgDeum8mUPDtECgg7AXun+H//trtW8NrMdzDZmEuGSly7rG/eZ8pgnodCoRwADs/p/JT25ivYG8X3H4aGgZ4/YqOhcC0VkfjimrP3hBydR6SPB2OYdNDv7vdbTbC6rK+soUwRagb2PLg+44xonyHuIHPmmny9Ld6+5DOLEF7/S7dcRY9f+u9/bHz2q0hCdeWGBazAha6uAZ/4JsRkmNo+6i1cV/0mlAhaCBlZNpW0Q057AzSb15qTgEji6haIYJMN16cyu++igHEvAc76tJIypyrol/81uPdT3H2j55P66l21uRW2z3k2S7DNryzrz9/SrGb+/tvIMZHECq/+scpNGXEkam8iNkblVSCIdIVZmhH1btRoAjYk5YUomSOdYzI6QZGAKyUjHqF6I1ZDfb/GVqcSX34eQAOfN8PzjpzKag8ehUjCuSUQRHw0wAXT+s2jyQ9uZ47PqY3hg9/4t36o1w95TFW3L65NZ54cTK64U1u18fd/YEeADnoKX/ok/fR+EOti4RIa+sJUBsZy55UY+rJchgBBI8uFgDpCMWflVcWaJkzyUR+oACEkV64T31f1Orh8jYyH6Pp7kGjW119HZpaXyvhv/jNYe48/faT+5T91d099oiCx4Xe/Z5202cFrOezKShnlshbnfK8/3HknbBf0akbjlGF0Nbxz1wFIdvbId+8lJoHgVuzZxuo6ubykd8ZCDgkDAFNHt2Md4daADzsgnVVjzj3PnJ/Svnowshx06z3UOkO9IRiOo/UVbXU+8fAJ1W2RyWlTK/L+fcEjqGXYTFnvNtSzB/GFu9ApgEzWGLMo5QKkwXuLeehyaYUL8zq25/DvP4/mL2Fo04gpAuGYyoWqcb4n3+4IoAHPRlNFvP0m2Hqu6tviF/8wOxwqL0H6dXgyCLImCnWeM80wpo0u7zTE6mXjzVZ81IjLlmVkaetYfmctfdpl5zX6Zz/LfPNwkimSrWdsNZMqFuFxTfE2fPgN5bY0DLC/LyY+b+4DXL2trd2GNgG9Y9juy3RVLJZMk1u10Uj4WCCJPfnsc55fhIICZYJBl+c9fetdlC6K9XkncnzUSwTmRE6MQhkvLhvtOqKEIgGwBbTANCUSLtrZjj68kKmP4mgi+g34r/+D43eN+5uD2x+qgQ/mpxwtRR/9LbvxEXz+jVy5gvHiR1alAJ685BEH6YLstWCrG+/VYzwx8nMoVtwiBEroB7LfUT/+mWEI77DtL61oLx6DTjd0UnqrG927a7/Z46FgtW0aaVTnpqfrxYo43gMUKK8ozEDvGGNliuIUiPp41FcH4eBPPyj8l/8UL78Ht4/DquMBG0DE56f1x19IfO2fi6cv+MYlLRpplaRmpgDQVTiQThlokFZntbADzgZ05ZK684H+7HNtd29YXJXb23TjIr5wU9YPEEDSMeTmU7i0ira34MUVY3io3FkxasNRxBbWNKgxI60yeVjbERkNNzpS6nDBMV8fx85sfPBKXbwF//6/x5d/KHe/JdLmugexNqt//xM9YVuC0L4vCiW4knfMFBj2pGMSZYDTHTm7ATAw9vaYYOq0JlIZ/cPvGoapEQzMpNIi83yo/tH30yediZI4BdxzMGm+A9kUmV/Draa0kgDE2nlTpLJAaNBvYRiqhgiJIvuvVXZWdg7w5R8rY2yXZzC2WfsQo8NWzNqJN29jW5AkIbs1+lf/Z3h5xQt86VMUDOjsuhlMIARSRJh4auE9/d4tc9xDeUvfr7HBsXbSCWNIvQxsnKnliu3MTs63cRBCDqDUaKosRSQbvaiQRtNlkhducZHbKVDKaQYXa+tk2vP+7Oe2CBAyeLemB2N0+04C/8m/8Z7sDgmQt2469cak0YYqRi+2fcBgMIQ3b+pvd8TSIuoNaSwgImh2AYx9PgjE1m408sXsDLSTcCahd6lvWgYyo04PDnr8Zz8pVFei3/wVJBKBNDeYPY7E+7fcL7+ZhAIJKkIKumO+tGSHIDgdxkEXzc5aUGczJa3VALhwVw2HqjyjfflrrpeAkxYLxdR0CW2sJ3ebk8625U0HpaxZO4IV21RcRRGQBhNN3XVhIqlBAZ88Er2QT5Nsmw29pHZ8RG0Dvz2Izg7gBz+RxAKCorSHEhas94Jywe62ge3KsxpykNbpBm4RWn6SEt5rUier2j7rjxgGG/JCKcEMftqI7ZREvq1i4ZW5cvz6CaiUgJcmR/vMxXq/oRpDVqxqflvaBRUEOJ4A4rKNFZJW2bNJN1kA25simdJO9ngihR2Hv3mhmy6nStRrqtuFnMvN52xhDZs6Ki4zGqhLd1C7rkaMDhr82gX35EzdvmpxFOOFn4DGiXq9xX78cxxNYBSC0rzY3edf/1pd+45+NmHROehNhOHxQhlMzahmP56pmAbTxjw2lPb8W37e52s3WKsHT99Ip6zuXCePHqtEXvpdXF4SkRQwQIyojYtad8RvXPbOdsQw4sdbML8ucsSZK5tnp+zjH5pH7/ighZuR33hn4o0/0gOB8nl1vqtdvKBDUwVd4PdJybEWlwzNVsUybDXVv/qL0tZ+2DhTyxXvq88mAZFBJEIqr13W164iK8gaNnezgBDRbelRzMplUkzDQSAzyAKEr1bSmwdjA6FRFFueJutEq4pKEYwmeNBExASf/SqSwDCK8agNsC3x1X9gdEbRSt6TrjjvxJFQIyrO3onBQGzv0R99j3ROCXJlfTSmER7UueEilISQqVEfVmbA889xbpU+/iyqj6KopRXmAeEIaWJ2WXv4La2WcMyQZqunz/yZBXS8qzRMEGT5aYNBxjqJZIYPqAxbMJnQ3HyUcAiKNSeJcPaejCnAglhpVdsBlXkQhdCkZGYdcS4nUB5sKq/Ai0mHKGgUpCFNboe84V67pXptWLkgp7J2oIfFjHH9DiTSeHsQbX0BFldhfRsWluXmKzaXNdNF/PQbMZW2oU0PX4NUEeVzaMCDSl7zdIMbYi6vWRlcb/DXL+n8IsL5uySVBCGVr9/FRdPwsuLsEEWKnXcEiQiQ0prm5YJOlKp341d/D3IrrNuQOEerKQ/Z6sX9uB3RHyxMsUTw/D58/HtqG+jyR4LHGrZ4JZOgxzJ/ESY8cnYS27acX3SwF88sqNaphgT0PPluN1yY1SOd7uxF+Qy4dyt93J7ghZ+q0xM4aYNqWe0cy9l5TCegX8P/7Bf5sRdUXddM0+YeYEo9+pX4d//RPKnBnS05N4NePOMWQLfvOOfDaPdkHDT0wKfXP0DYgIvJxN5wUknbwyicu4pP34GxiCo5O5mD++3A07T6oSpmjRs3ce2QJyqo9lQ2+mzjonn0SmOJ0eYfIN742HZSIluCizOGSfQeDbdfAMsmu0dDBxkjPLFtUj+BSMJ/8ZfZTz+dLBSNSQTK03qvLo18XMiiGPBODabLXNOcVBI9fRFlqpoBgU7Nkxq/tupu7k/MFEjY2s7LKDuNM0jXXdZjMe8ay0vu6VnQ6EMQ43qDXZ6xj05ENoXw+nett8eRCFUM8OlZUJiB0QhUFqHpyfwMZG2jXNDKZXLWj466QcYiQQApU/GA3PsB+7v/pXqxWF/QMjm91VWSgkCoG9fN5gE9O+VHvQjpMFthpmFYJqccmDn18v+iW1cTI8mJJk1Mvn4ynJ81hhGdzjvpnMoVzeUVRRyI5QbTNZDM4jBiMQXX550Xv4eYEzMFswUwvQCpz+a94sF4aFLsN6xXr+LpJXnajo9q4NoHej6B3QyovYb1I/rHP8zutEcwhpGPymuSdmCeWCuXUEj50ZFcmjYHY/FHn3iBHUQh8yyjPWQrRff1a+Z5MJPE44nc/kPUqmtAE7jyIVxaxp5trM5aqYR+sINy66GeVokc7/YF7ZH2AAzx8OpC4g+P6dIV6GQkwdBLE+zwlaozVkECWVKXjqHPLsLzNmMar2Zt04UjTnNV8Ood7ft8umJJBhgTAeemgb/6nFcrTr0Re1khBeSIDzsqPc36bZKeipUu8fxPYXvHCGT0/34dQU+pEDs24joHIyLHJBagf0bWL2qf/XW4dlnTmfPqGTehZjpwtkoefBPmcqDvg5kpU0hR744hVp4LhhPV6cZQaUSR+SpIO0ZI6URQL40aDd7rwaSHU/PRoKsaLXnBTp5OeHtHXLlpv9mkrE+sksIDFwCLAZ/85EcZYknp+pfX3ckQQiUNqE9IaEvr4aO4tc1BiS9PYyvNF2fsQAWtgfRDibHmxk5I6aNX4cai297DyOVvX8qzYzBXNX1AL8xY2bQdcKpFzsEBTXmoN+I5F3/xS7nxsUpaZICCVB7e/cA6PY6ZxMBWOpH443+Lex2IEmIQx+OOml9AtRPWa/PTc7n3juYttH8aL14Wc8sOZdxNADBxtt/4hQUwHsrzHTA+hskS2t1nlQV1+Fb5Io4CWJwiG7N2TMHUHPrqkf/mkeq2lbcQubr17e/o9DpSXFt6Xxxugvmq2WrzlGN89pvw1j1HM+TlS3rG0rC2Al2ijl/DnGdm5vlyJWXEztbxuPtWl4YE0phZBTMF7+QkyNn2gMamAULBo4bb7dNbd8yDGs2X8ZUrmoKABjyKSD6Hb66kWsz3CiwcqXxaOz6PdFOUcsbbd2E6QQxHFavkeFvGFIaCIUjaHXrzKl5esP7nf5v0fba8gHFu3axW9R/9ICXSk3gEX++GdpJaml2sstZQXLmGlqt680yWl/izb8DNe6g7ZLqhBYN4HAlgSWIDFRBTx+1xFEu1uoIvrXh/82U3jY1JT7M9wJS6cyWZL7CtZ9BKSNfSgj48OohNG7ua5o8VsESyoIxR4rTFo4lY2cBPH3Hs3uVuAtWa4biOGQatU3DjmnX/yfj6Rcct0nRRbL2AzTCaSdhanr15xbCpVNccInbjhj5d0McxK87J8yFTXGXSemubvN1nZoanC/i4FccjZWjkbB8oCMchiM6gVWBWShk2SWcV0dG1+Uwr9kls6IakkOkeOG1KKyNx5TaOmcjY5HyklIQg1IgbJhzjxQPhpcnwVFtatqJTEyT9KScx5FHaJjMXlD9SDAoggC71F5+ruQ2t3xEXsokxFFZGsIE2XwavX0nLkdkFVtTcL15OZku6woJh1W0BhxgOwk4SlsuQUeZTZTu4G8XtY7lxHRVzGk7f1A2MJJIU8nEHrNyktGvXe+HsJQl6pp7l7WZUmZMusXdexlQqy4EBY6VkYtBlUUdjGk0UtPPzqHuCqhv8qBZnU2avT2fmvHFXMQFYDDIlZmBsWixfcsZDsbCKcmVJBUzb6jwIEy72LP3aurP1JvjFX1i/+5wqBhBtqwAxzVRBFxCIcgmrI/2L89bhG5BdZI5BuBJHp/K3n/qVFSOb1kJfz5iWL0ZTVcvOoUFLMyEIGLh4lWy+Y8k8WlqTuQz5209HTLHpCjg9l4glsMOIibfejQgVKaJ1z8j+Yfxkk756qHoDlE7i45ZPKXr1Ohq0sCACr/858KDRHtO4B/PL8vED9vHlbMzB9pv47k03UqLbFRfm3XQaVWfh6bm/t82zFdjqwotl56Q7Wa+4JjZ6Perl9UuziWcPpG9EKQ9emk9u7kSdFr9xmxgabA3YyBfJNKq/U2MAeSx3HqhkDjCglJLdMxlY0dKUGZ2ZyUWqDTI4cRO1J/STD83eUKbSmqmh42NKJ6K6gBlHBzsxNpBQUWkJdEdi+6mYvoBev5SLS+q394PL72lffBYZBRlMIPaiWHArzSSAfk8d1kSjzqbL2nCizAw1mH7ckLYOcxkYMWVn1OI6uPMddziUhiYbDZCtqu6O+e4gSCR0rxLgxZ/C7hkYn1hWmWdBQlnUc5FToodHokDs+jAql9BwCGp7fHpGnyp7J80wn8LdvrItJSOcW5DjruwPZdF2zAw7PQMJFx9sous/lo6F0zncb8GNOSNdlf2hcEzolcH1DbteQxSxrW/Ix59YhNjnflB1vbERXL9suS7AFODyR4BRQNJxUjNMrHFN1htxIYnrh6Bo6hJgnOBndWlRCwlUyPDnj5lTUI6NdEsVPJtwEprx3JwexnT7ochXUDaDDEu9+h1eu4mafV7MaadjfmU+tbIsJ0AM+/LgULkJRibWyoYaCR72kOlyqlg6gWiE2xNOkcKVS870PIp9mHBIfyB7UfDj99OPn8ZXrjtDbbS2QpojavlezKhyRasdA2EMe7y4CNO63WxEhodaB8rMsnQKt2vQKijEYKsN736Mn76gKWYnisKm5mCi/vqXYn+fr61Y5Tzs+iwaQADJk8e03gqnZoiCslEXE8a4BHkd49kfyYMd6Ra4Z2u7hwGiKFDyaBc2T6hihGhwtqg3qZ8uAc+G21vyox/iRELLacZxLdYsEscikyWuhQFWvi5KCeITntZtJHneM81yuL0tGv0Yu+yDG4mpNXqxkn9ZG6oediyDU5FPGlff1/7uf0Qaxpfm7KMDORqIVMJEdl7qCRmeaH0/vn3bPtwBaYJyZQh0lcqgRounNGfYB61z1Rzwf/LzfL9hnNRoHMtyxRyyyDNQMotzScMEZGUGnZ0pSzrf/G7S6qH9vVgjJJ9DeRcTAHu4V7ES7fHkznzJLnLhxC/34uy80E7t7/6IlB1XAK4MoTjuRTGe+kALJrDfVfVdAFyZTqkUTvoqah4IPSnTltWnUUozMQOmB7597CenYiDRl79mY0hVW8uugIOTKKLypEajgKyuGOMooBHWTJGYQofbykqChYoTAL79UrBQ7G3iiT7ZPZIZT7/6Hfn8D3RzL16/Kr/6MsrndQHQxGflaYgLa3rbp2Efzy4jpEC2qHojKXV6727Kc1G+pLpjHgp6fi4cYpbmuRrZkGlmBiIgnZzmZuOlKd2P4MoGubnh1E5oMFTFKVUsYCT1QgpXprWuH6iQNI9kcU11zkB/wNNltbaIu2008eXqEvDHZP26TjQghChMk5MDgZxpNT2PiouK2LDVVArgD7/jBQMIAAt6qt1lGeIOjkGiqBiiX3wKMKaxFTWO2e273vc/It190moj2NJO3hE+NhNpNI7k4rQ9iOVBw4+RePbUT9mW7/PpS6r2CmZnmZGQx6/Adi1OpfCkh3YOZNLQO1tkLPjlVfvslBUcDRcvGYU0xgjv7cQf3LIgYJtb0VRVH3bi13u8fqCOj+j0Cgq7oNtXpRJsN61yCRpF9vwhf/Y16Jyo/KI0iPb7b/yVS/ig7U8lXSFVpyU8SwNCcY7OupGVgLYODQl8Rq4tWMmyPD6WowPz1vdUKeVNBvFeK06ncC+Izw4hiDG+8HNLCb22o1eXcG3H2H+TKlXB29ciU0XRSCjmYKinNAPZgiO0PJU67w8mbT2RhSbCwreJZVWrajCE1YK19RJ8dN16V2c7r3Fmho5OtXZXT6eFbhLeSerZYG7WHI5ljLmG1WJVX1zXNp+TCfU7I8txJYosoXAlDwzb+P8XiQZe9rgbDAAAAABJRU5ErkJggg=="
-grass2_url = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAADIAAAAyCAIAAACRXR/mAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAABjcSURBVFjDZY53lKRndebvfb9UX+XY1dUVujp3z/Sop2c0M5pBEooIGINJwhLBRiZYWER5ZVi85gA2Rl7b8hqMjQ82BnZB9rLo2JKsLDESmjzT0z2hc+7KOVd96b37B2fPsmd/f93nOc99zgNERESG1SUizWz/SlpcJ6Jmr/AraVo6EVXbGSLSzS4R1XsVIip11okTEbV65V/v+fUkEXX1Bv0fWtr/k6x1skTEufUrs97J/+pgAGDy7vzmqXRr+clTj8+Xv6vp3Z+d+UvOzbNLzzSN1i+Xflqpl7936hGPEvmPtc+upq402/XHX7yn0ikWGldeWfpurrn23LW/BYDvnz+ZKe28ufpzRrJh9i5sv1Bp5v/5tS9zQW/1mt8//R4OxlNnnwCA5czp+Y03Lqy/UGlmAOAn579arlX+4dydbrWv3MwAABLRUvr0C/M/zfZebPcyh5OfVUT1lxfnDKvxsbc//O2LD97u/arpWFjOXHjP0Xfv5theoditW9z+i81u8737PrO+O0dKYdB/MNs4z4wT9WazWe9NzOguPrJRm+uV/SFXbHI4Vmgtv7r6VIjf9ql7v5mqb6zsXsjpK+n82h+ffPZG4d9ObX7HTuHBgYMTfXffMf4RSZCQiJ545lO7rfnQwNWLuzDpDJc0a3u1fMuhZLGxy+wdiUO9rQ4EuqfXYb87aPP4s6lcJDLagblel61tOIfiwviQ7dxGMSnFu2IvpCq5MtodO6AKekOaHpnZKyxVtFaxQA7Rk0wGhQ7LG8uxgLyyYwuofotqof72QsqIyzG7K/jwkb8fj96C1Vbu6z+/pypcf+lliE/A8Uk4ewkSMWh0QZYh5Me9IvlcUCmiLlEyCKIE9SLYPIASVMrgdgLXIV8BssH+AbhyFQQbjA3D1RU4PgurexDyAumwvAfxIPrstJeH4QSsbMEtR2F7FyJekBQ4twCpEr7tGCnm1KHRk245wryO8Mfu+xbrDgyMALSxrSHaWLUKER+WmljrwPQwooGhILAm9kzcTaFsx1IdLy+wRAi1GkoSpou4e12w2cHTz6IhLJXY/nG2nUOvDcvbTHRjPSc4Rcj2MBBmpTIOD+Dpq2h34bUMLm+hBhiWgQBuVDb68fYP3PwoA4Cr668I1sjbjoFdAU6wtQzZDnZ0GE+AVsfn3oB0Hvwe1A0mCFSqoU2BoBscgMtbWOvCG6/AiQNw6BBcX4JOhaommEB+D22tsnYbUmXYuISHTvCmDquXodQg1Y6ZLhydgr0dMEqQWYSwDZIjtJEGV2f4cuEUALB0/cZPz/6NqW7M3wCbExauwLFZMnP4/LNsZ43sCrE6ZJv42kuYHLJ6DRZxUa/HVpZwcoQKacrsCg1DbpRpa4WcLnTYWDnDphJ05g0W7+c3rosBP/g9XNRg/hIODrMRH1VaNBai5UXc3sBwiCQPKAzmF1h+AxL7uwf6Zs6u/LvwyUc/UGeXF7c2Av0QdKDOQe+gadDwKOhtQAn9HuzUYWIC0il0qdi081aGhSPADbA5JK/TBMJwkrb3mM/NGjUQ+oha0Oqy/ggNxUhEKDbAFwGGoMpQr0FFIr3EGMJQjC4t4MgY9roQScCBcVhYqt87+em33nSSTYbuHHZ8IGCPdWrQsaBQwJYOsUHweWjkAHRauL4L8QHqC/PYMKR0kjvMG7WYQuP7eaPBM0UYTFjVknDkKDrtFgQtu4GSB4bGea0J6QLVNPD5WCGNR4+AP0Q1GcZ8rGmQL8qbbQwnwNRA8UJqj/wxuG125vLeTwCAZVpX/uWNr1liYX4R7BJF+yiZBI4YCOBqjqamKDlKlRa7vslkoMkQqBLUm8LkCLwyx6anLH+/1DWxrll+h2XqGFBEm4iKBAKC1RYGx3EsDoEBXmpQpw35HJsdBjJJkFD1ga6D1w/JQbI7wRJZvQY72W1neOO16z8W/vArnx4emDq1eCrRb9RNbJngdYMkw8V5dDhhaoQKeSE8wAlYU+eVDkbCBITn50iWYWoYahUyJTYQomIL6hZjBoxM8dNnsVSHW4/wnXWxrUOhROPDQq5JHQMcMrickGlgtQSz+6BVhK0iyAJGIlRuQbZqdVn+0Tt/xsLOmWevPCt1kx4/pBcBG+zKaWxWwRuh3UVW72K+x1dvkBN5LStBVWhXmdG2JJuYWndsl3G7xLsVM5/Cctaharh13RJ0FG1iSBXXd4QcN5bW4OpVW6kAWo7sJn/lBXF+QbzjMG9nIFeHhSx2O8hNaFXAauFIvxnrfhgAGACsby4eHp6dOwvH7oTpfXxohMpFNjuMR47xoItSG6zeU7Yywuy0aXBgMssVhTsOWXeeaIFBNsl26zExl8W3HGmlM4J3QG006VDSsLu4JMOAKCYH4ZMPdrdWsUuC3SEOJaxY0KyVMRzHbhNvHqPoIB3ex7NFbDRJ0+FL7//rF+Z+JPzeFx9w+wtPn/tfHd3otjFbBuSsy7nWEtoS37zB9o1huwluH5q6ZQHL5qyhMaFdAdUN6+u2WLw3d9U9PtZNp8XkkLG4Kjo9oqpa9TLr6BxMRXTpmxs4mGRWzyo1pZExc32T6cDiYdANEETQLUrlmWoDj0pOuyii+903P8Iinsly24oOKIF+qHXRZ8PtBrlUqHCzWhZUj7BXwaDbMCzLAGFsknI1eW/DWCsImglNNKsl8NvrXFbaJNhtbOam3qUr7NqKasjg8Yk1o5OviqokrqdgbAT6wlouJyVHcXENCj1ut8Evb4DeZI0yBIPUNMErHP73K4+bUGUA8OaFhaquD0YhHiXFQxEVY1HUTdbvIrIZPoUMkn0q9vv41UW4+4SlGXLYZfmdJKLVbClZTRz2a2N92tUNMV+zv/1WTVW6TkC3bPWIyTrl2nx2n+kN4uJ1MRi08jmYjkPcg6kCjMSgWEDmoZAdmAA3Uud/9InKqfmXhEcefciuCKd3/iPgxIZF0MCKBqiTqYlhN/f4mOrmpsVmpnCjYjkBAXi+4raLmqIScTHuN0l0+rzaVl0YclrXNxWXG0NOcy8jq3aTSfJEHIIuS7exa9cRmSpLWtjHDB220xgJgYwQ8NB4AtbqJDWgZ7q1jv7B2x5hIfdgKOCM+KFSoa0Uzs6AYDBdgEDIbHCWKoBosZGE+fqckKuIsovVWzgxXg32wy8uuTwuAZEG+xqXlmzlhiC61Uig1dGp0JL2zWgXFh0eQbMpoCkskwe/27rjaGs1rbYtVulhsJ/rBtUKODoB5+cxlwFU4Uu/9cVUI1018sLHH33Xnzzzm++4+b0/fnX56AgaIpkG2OwoKxgKkCzi+SuCYqdi3bJrsH/KyjSEiX5qaeRg5rU1yWSi1rX6Ioath5EBTbaxYoYmxywmYDor9AzsdGF2zDx7QXbaxCa3Bv1ks1kjSWrW2aUFiEapnIeiDlhlB47Sv77++vc/dmp977rw8S+cbHa0M4vPRgZ4OAiL65iuYyIEr5+yWdxMRikapLOX1XuOc6fHUm2sVLRqXXezarkd4HJyrrELa7EP3lW7sWoTbWaxaCNRCTi0zS15/1ivWPMy0mXB8nitfj9cW7FFEnohxVQFqnUkU+KaqSpseACRYdBL509DV6w8cOwRbOq5n1x8+Mnz/+a1w/oNoQtMBkgkjbAfb6xDvW3vs+vJEWM3LTabXHRyZwDMIuiI9R5FA2DWwRJA8gOYgBZoPaip4C6LGc2cTADTYKsAtSa87W5YXYKD03jhHGMR9HUFQF1A4fJ1uutWVsxwqY87JZoeOtRnvv99d90mOqXw2eU3+oVJFJYHoiSRefmK6PEzkMgmCMPTnVpRuH5NPn5CF3rTh8c+/NWf/OfH3//fzmy8eP/xhxg4f7b4kNs68bl3fvNH5z59IvGFfDfnA99DP3zg6T94zmYTvvCj+/7o/s8N2N/WsM58e/PPillo22mfDBsVM+RkqsR9Kko2MxCHkA8uXBaC/rlAyOuwPse2q2fH1A/mSysXr7CpEWrreOig6RSwXZLuOG5Wi0K7ZQky7mVs8+vXP37Llwfd8NE7Pt/W9ZnEkTOLLzXy4W/91lPf/J+fTO/J/+PVP7//4MOPP/WNa99av7z7yqnzp//sfWeTzg+9MPedk/u+MeQ5sLCqHB/heg8Tfh5N8NVt5cABa30buQGrKbz7VqtQ8u3Vi7XOjui09c0cknPiaH1hrdxERQZBFoMB02mnl+Zx1A+6V0BuFdsmc8Gzc//65COb//0X/3UkQtwIHt93goTK/ObL333p9JEZ0DUAgPO7i1515L/8+ImxfudH7v7ihdUX/+q3X0hVcle3r+0bhHxejvRzpwJzKTgwohV7LOAQUzkuy1a6BFrbGvLsT4bHWFAdOb+wm8153voW2M4hucgbsnSLVlIkChiLck2DpmH63czvgx+d/aPBgaG/fuZLmVI05HMeGTq5uL5ycPje0j+WfvA7Z1cyAAD9AfjmU4/m/oF++fXmn/7sE5Ox2fc+fmss2C/L3mwbbG7e1OipVyVFwfgg73WYzW7a3HwwBrmyUDEbgjJAlozVVvqT/3yvjbRcd2NkCEXCTJqcfiy3GHbNoSHcLcDWpuxzCkdu7rz0MhQz4I0yn59LOrgCMLcGsTCMeaLrpXTUD01drjYsQ7Cobh9M9ApN3mjA/mE4fwnGBm2lnuKl+vTt8OZplE3x9rvNYg5SeTw8zt+4KMT6reHgFHrgQ5N/Jzz+zb9w+dfm1y+ub3bbOlvZhK4p5tP8+CHaaIGuodsu2ESs1KhjWJ/5ja/0tKZgN+46HBNsqoG2Y+PHJOJdkc2MDG7n46ZuvfP2gQGPIzboaJkuByi3HLz9zJX1Jx7+i7Xa83qLyjUcGSSHXWi2UHVa166hKwSNOhseolYTembpntFv3H3gfgbAzq9sONTo1CyACD4bgsJjCXj1OmkVoZgVaz1rcFC3e/jVNVjeXnF4eVy8KZNNWK2BzQKZXcvsqkP+w04xeWjM2ilntpbD6d1+oxUM44G2xRpVtNlgJ9u1O0DXTbBhpSGASUw28xlBc5DQFaptkmxw7iJ6g4GLWz8FIGz1Sh/9y1vStN5tCA6Fwj7a3QG7Q6gQmwjrHQm8AqSKiqhYEdW6vkfMgI2ce3+sMT0L11eBcbi04/vUPcbiumIIZSa55pet45OdfF6cmDBvpGSXpDe74lCf2egpsooKaPU2RoPkcOLaluAJGOktQfDw37yDnnyGTcT5eP+t++ITzKEEfvyf3giYMbtgCToJMtaaUqjPErsciU2E8dqqkloH0aRiFacnZadHnR3TOZe9DtjLhAIqjnmsG+lWvtgbCNnaFf0dx/nenuDxqU63vdcQvIqicljNu+MDmkhGdAjaNZYuisEAb9X4wgUWC5HdYj9/ht0+y0uliN8ZvW/6MeGdv3fs+bkfcNSDAzu+MNvYYhrnPi/ZVVhYYsGQAMSnJox4lNndPJXGQIBA13N1weZg4YBeLNK+yZ4q22PjsLHBbYJRbvJEUqnXWb1tTAxqJIqqykbjOiFV8nR1WTxxGBauIicKRwEsdHlxKM77gnTxCgwP9vex2Xcc+ggS0aefRJJBYrBTBK/AdopEJpMlCPj5bp7G48w0UFJgvcT7kLVEajdVj0MvlWEkarbbcl1nB8e683vgNOSSKXRqdGBY65B4eYFNjzO3zQwEzZ0i6B3B0EBxcZ9IhSYrldHngmTY0hm4HXB2DYZVSowO/P7sS8XWsvA7n31X2Dv48tJriytIFvoipFcFLnC3GzpdDIXA0KCHkMpBt4mRGFg97AvoiQG+u0mZhhqL6F4Pz5Yh6sHBuJXLoaoyYObYMDWq2O5wh5vyFb5RUEb7jOQAVKvUJfR44UCSZ8sgK+D0wKvnQDbg6FG4Om9Z9tTJw59jbb7UaJcDSjjUR6aBvI35HnlFWFug3U1UGXv5VaGe5RYXfXZhIATlFoVd9N1/tHsCSj4vqCJfvMyrDZRtAkcYCBv1shALCS8+pzIUzLpx9pykiMLtU2a1yLZKnEmslRcn4rxjQDkDN9bRpcJbZiHgg9VdSE5zXo16JL/w6GNPfOnJByYiE4lo1uKgqIAaZFo4lECuEYowO0vbO/LhaV3jRBYUO2xjS5qZMGXiomK2myI5WDRIxGgvjypKulOTe9wXpHIZowmBWSABD/ZTscX2Mizo5aLPymex02YOH7rsVK+i1sP+GPR60Cs4pvcfwY6dcVj/k/u/e31r7pU3wNAgswdkYNBBnQ4kJ2F1GxoV9LiM1R3BasLcBrMBBJzcEqjTsWQmOYNGpI+VarS9y12SuFSw7CCki0Kxbo0M66UqGx3XyzWrWGVetzXgYW2iRgVVAXsSn97HTR3aOi8WoNEDrQ2lGopW+dXCQyzhvifVe9EXgEOHYG4R2x1c3YNyEexuqtVxYhQ1zg3gIS+rNNhAkFoVKrVNu8xUh2Jwrjdob0cfTYDFne2mqYDVKJGugk2wyQK4fT3NYI4+GSzo1iGR0LNp1mtK60XuNeGll9EwsFUUWh0IOmhuAQ4fDD+/+MM/vG0Niei9fzWaHDY3szuDMSwX4MplHBsDhwK6g7s4PvMCm5kBj5sLDLJF5nOBTQFmI6bwwra4tSv291s+r+ly4dKy4PGCKvPZfXyrDetXRA4kMIr2cxDA48TVDTQMOjxNjQZqLp6+hn4vpHbAH8SeQDfPULMtf+jE78vdY8KHHrm90nvz4sbS0goOxSmdwsOHoKtBzcCGQX1uPDBDqTRrMxABwgEwCToaC7r5ehmSMUjEzGJNYg7T70C/l2QJZAU7JqUrEHNyzyAEZehyIBFcKhSLwtFDvNUDizDboH474z6IBsGSodvDYJCqZbvX13v37FfYSOjmAc8Jvae+7S66tobZFm6lIdAPksCNOgsGYW2FhWNmxEt7NbZbB00Dl8dc2MHKnjyRpHQKxiZ7DgF3K2yzAvUW9/msl8+xek7cPwsBkTocUACHzHaKIPmMy9dZ14KLS6AYMDVLYgdABG8AJkZobQcCwf3PnV21C2Hh61/71sP/9J4TAx/dyM2NDWIkCOUclOqwbxTzRTAtyLSJdVhqE0ej1CmzpSVGJrz1dq4yrnFoAOTWmV2BmB9EmYppduZNfNdv8Ik4v7yIiJCqQjwI9RrEQtjIYaNC++LEbJhdQ18YGh0AGTZvAENw26DVSD39ufblzdeEz/zBQ6ogPX3l2xvL4PbjxhZwGXwqFJrAneRiaPWgXGC6jopCwSAA58W6mExQrQ6ZBrTrSBaLRvnWJpT28KYZGN8PPgfsFMHrxoUrgm+Isyo22yDZgDhzqtQwcHicFDcYXchWCBl6JEAb7q6TXYw2tfLJI7/Ngq7B+2Yf3D8avuU4ZLMwPIyqAF4fpGtAJZzfBDTQo1p9A/zqDbCQooMQ9JjLKywUhr087h+BYtPyuNjZi9L0Qbh2jeYX4PnXsF5ljSaoMVOssfUqgIgBP0kSz3ZhK4vFFOM9stuxYWAtAzkTwl4eicFbxt+vsmFJUJCIHvvBe+tGt668WM3iyDhdvs54k2QHdNsQ9lGDEJoQiYKpA7qg28BQP6VL5CLUONoYlRuQGKaEH5a2ULXBXg6cDox46PUzODJC+QwMj0JfAlCHQh2cKjTqlCmig0GpBEyG0Sh1CScm4PIlCnicf/qB58PuYVZtp5DRTuM1rwQVRjvbKHKeykGtjh4HdTXQKyT5MB6njp2ye0xw8PUdlDoMXOQPcguorx9CNriwDRbBehqnRok4X90gWeKlOiaHIeCleh0WN2gvT0urpCAYTVpNQThOPhv1TNw3RpdXqdcDk6RUPtvWSszniP35x77n8himPtvnSoT7KBYa6Y/TgVnebImFtuPgbHQoyvONuG4o+ycs1nH4/Twc5T7rvqVV1akETBRubPo4KNE+5lfFTJelUtAyhKMH99tFftMstQ3PwiZ53bYP3jXgV+3pJkxMKTcNU7JvsqnB6Dht52RdV4ZH4Xfv/vR89jWPr0/42te+lm6shb2J15euzfjvQvuG1zv14NF3vfjmgizG//h3P2IY3Uq3sbRXmPG+fWhIGB18h1bJ6hbcetMJVHcOj92Xr80v7+IX7/t81ZrbLPZOuD/vt/e/+97bfC4lV06trjiqWL9r/P77bg7/y9kF3nI/cOdbF/a2+p03e3HE7/V6/Ih0dMo16/YXLu3uPXbHP7kVPxIRAADA987fOxF6x251/XjisZ7ecYnOofDg6xvf36lmVnZWeupTHzjwdyuFS7fEH72wdtHl3Tyz9cPx0DvfPvqYRxz4+ebJ+e0tRba/ffzxA9GbQ3bfub3vvLr6dKPqePDWL4+HIk/84uTxsQ+79HtWWksHQpNxX3IlffrE+PvOpP9m2P6Jy8Wvzq3NxyNj7xx/fLu2fDR2y/+dVe4tZIrYtSpHk3c0eg23zQ2/Rr49V284a1rmaPKOrtFVJbVQL3kcfkVkALBROaXiVL61ORs/XutUvXZfq6cpkiwJ+Kv3S3tPKTjsVG1J/yQi/H90zm2+LjLHTbHjPaPjVj3/G/l7ld0iudUoAAAAAElFTkSuQmCC"
-grass3_url = "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQEAlgCWAAD/2wBDAAIBAQIBAQICAgICAgICAwUDAwMDAwYEBAMFBwYHBwcGBwcICQsJCAgKCAcHCg0KCgsMDAwMBwkODw0MDgsMDAz/2wBDAQICAgMDAwYDAwYMCAcIDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAz/wAARCABkAGQDASIAAhEBAxEB/8QAHAABAAIDAAMAAAAAAAAAAAAAAAYIBQcJAgQK/8QAQRAAAQMCBAMFAwkGBQUAAAAAAQIDBAAFBgcREgghMQkTIkFRFGFxFRYjMjNCcoGCJFJikZLBChgmQ7E0RGODov/EABwBAQABBQEBAAAAAAAAAAAAAAAHAgQFBggDAf/EADQRAAEDAwIDBQYHAAMAAAAAAAECAxEABAUGIRIxQVFhcYGRBxMiUmKhIzJCcrHB0RSC8P/aAAwDAQACEQMRAD8A7+UpSlKUpSlKUqP5gY0TgJq3TpGgtrktMWYs/wCwlwEJdJ9AsJB9yyeoAqQVZs5Bl24ctUH42+HiHWFCUnwMEA9qVDpVIUCSnqKUpXo4lxFFwlYJlynOd1FhNF1xXnoPIepJ5AeZIFe9w+2w0p55QSlIJJOwAAkknsAr6VACTXvUqP5YXaZiLBEG6TvDIuqTMCAdUtNuEqbQPwtlA18yCepNSCvDH3qLy1bu2wQlxIUAdjChIkdDB3HQ7V8QriSFDrSlKVeVVSlKUpSlKUpWHxxGuT2HXnbO4G7pF+njJV9m+pP+0sajVKxqn3EhQ5gV6eV+Z0DNLDiZ0Pcy83oiVFWfpIy/Q+oPkfMehBAklV5zRXM4f870X62o3W+9BTzrGuiH+Y75v46kLB8ivzAIMZ661BcaZfZzplVoSG308+AE/A8kdCknhWP1gpESkRZXTxZId/TyP9Gts58WD5y5OYjipSVuewrfbSPvLb+kQPzUgVFeEHNsZmZZJiyHu8uVgKYr2p8TjRGrLh+KQU6nmS2o+dbJw9foeMcPxrhDcTIhzmgtBI6g9QR6jmCD0IIqj/CvmArJbiucw5Je2xZc2Rh1/ceXeJdUllXvJcQlIPo4axepsonHaoxmaYUFM3KCysgyCkkKaVPKApZM/LxdprHZC8FvdsuT8K/hP2j7n0q91V64y8wHrtfrLge3OfTTnG3ZISeq1r2MoP56qIP8Bqwb76IrC3HFJbbbSVLUo6JSBzJJqkeTmJ156cYcG6OhxTM25O3FIV1aaZbUtgH8IQ0n41T7Ysg4uyttPMGF3ziWzHycSQr1JSD9JVVeaueFKLdPNwgeUif5FXMuVztuAMJuSpj7cG12mNucdWfCy0hP9gOg5mvHBeIHMWYUgXRyK5D+UWRJbYc+0bbX4kBY8l7SncOYCtRqdNarTxRZonO/iOwzk7anlLtqZzT2IChegf2jv1M6+iGUqUeoK1I6FFWJwDmph3M1E75BukW4/Jb5jyA0fs1AkAgeaFaHasapVodCdDpuWL1EzdZV2zaWlLbX4aRIBW4AFOBI5kNJ4Rt1UqdgDVxa5BD1wttBEJ+HxUN1R+0R6nuqQ0pStwrJ0pSlKUrxU6lK0pKkhSvqgnmfhXlWOxVhiPi6yuQ5Cnm93iaeZWW3ozg+q42oc0qSeYP5HUEire6U8llSmEhSwNgTAJ7JgxPbBjsqlUxtWRqEcQeA/n5lpMbZb3zrf+2RdBzUpAO5I9dySoAepB8qwWC86ZmE8WLwnjVTbVwbUExbmEhtmag/UKh0SVeRHLXVJ0I57UrUWb7Faww9xZCYUFNuIUIcbVuCFJ3hSTuCCQSJSSN6twpu4bKfIjqKrlwn5qpsmIFYdlPfsd0UXIhUeTT+nNPwWB/UBoNVGqo8cj8jLbi8xUqEpUZ0So90iODqlxbLTu8fB3f/ACrcWfeHXsps37hEilUVnvE3C3rR4S2hZKk7fTYsKSPwVobtJscJxnmXhHFDaW2vl3DTTUlKeiZTEh9Do68hopvTXntKT51y1hr26OFe0lkz+PYuyg/RKkKAPYlSgUn5VADZNRzqS6KceWl/mbUD5bj+SPtV6OInO5h7gtlYqgq7tOKrTGTFTr4gJgQkgH95Lbiz+j1qrPCpmdGydax3j6Y228xhLDq+5bVqEuyn3mm47eo6b1p2a+W8moje89/nN2f2WFgLqnJEO9XFp9WvlFJ7tPwDc1nl/CDWic3c3lWjLv5rx3FpN6uDNxm6KIBbjIdQwj0IK5LqiD0LSDW76jzi77U1pedWWUkdzhQVgx+5SZ7hVhmNTD3rd2D+VsEfuUmR6Eie4VMMus7plhXiq+vTHHsRYibXBVJVpv0kL72Y+D5LUEpb8vDJcI5p5SDKTiOumUONId9s8jZJinatpR+jlNHTcyseaVaD3ggKGhSCKM4i4kLpZsTyo8NiC9Cjud2C4le9ZHJR3BWn1tdOXTTrU+wLnL88LG5OaYlMtxXW48nckqbZdcStSEFem0lSWnSkciQ2s6eE6YG80zkWvdXiSQUbpIO6STxSe+evcATtUfWeqhxhDazxJ5eMyT/7pXevKjMy2Zx5dWnE1ncU5b7sx3qAr6zSgSlbatOW5CwpJ01GqT1qQ1z77FviOVdr9ijLyU9ubcY+XrclX3FJKGZCQffuYUEj91w+ZroJXUemMsrJY1q6cELIhQ+obHyPMdxFdDafyyclYouhzOx8Rsf9HcaUpSs/WapSlKUrW3E1k0rNbArjkBtJvttSp2Jz09oH3mSeni05a9FAcwCrXV3B9xZJutyZwXiSQpEsnurXKfJCnCOXszhPRY+6T102nxBO6zVc8e1HsNpyVzitd3t8llp7FjTs2RCTyVHeaUgKfGnQOFQPqVocOp1OkM67xFxhskjWGH2Xsh9HIOI2CSfqGwncj4TySQdX1A8uwAyTXIQFDtB2Hn09Oyt7ccUe2Y6y/h4sscyLck4fnrtc9yM4FpaCyBosjzS5sAH/AJtfMVz94vmHpuDrbdW3FqbtMhaHUfdSl/Ynf/U22n9Q9KmXCFxT2m45uyMsbpeIUeLmZDXZm2nnPDHnlBVCd0Guiu9AbSOWpdT10FY3GdvTi7DNys8pPc+3MLjLCxzYWRoCR6pVofimoO1ZcOO5a31I417svbOJEwVIhKiJ5gtlBH1Tzio8zWRay1up1mJVIInkpMEeUcJ9a0zlli+RIwd7Gt5Socee8+02eiHHG2EuKH4g02P0CtecQeMvY8V7kq8UWAkpGvVW5ZH/ACKyuWU5yDhdLchJbfS+6l1B6oWlZQR+RTp+Vao4gbwqVmJMb+6GWR/8A/3rbcPjQ7ll8W4APoIH8VFWSvVJsUmd9v4qBuO7EqWtXTmomu7/AAQ9mhh3BvZzR8uMbWtYu2OGRecQqA2S4M51KS0EE67HYqUtIHVO9tZ0IWoHlT2V/DZ/mg438F2WTHMiyWeR8v3cFAWj2WIUrCVg9UOPFhk+56voYqedPWKHUrddEj8sHlvz/oetSB7H9NtPNv5K5RxAy2kHlBEr9ZAnxFcUeFC24i4IO1kwjgnFB2zot7NmW6jws3OPNYcZjvo5nwLLrSwnUlKk7T4kqFdrqqp2iHBSM7Mzcn80rDB77FuWmMbM/MS0n6SfaBcWVvJPLUlg6vJ1OgR7QACpYq1dZPB4wWHvbdH5eLiHmI+0R9+tSZo/Cu4lV1ZEy3xhSCflUAI8REHwnrSlKVnq3SlKUpSlc3c6OH66doL2uGNMNznpkHAuWFpt0W6zY6glxXexhJZjNkggOLdkOkkjkhlzmFFGvSKsFgzLez4An3+XbIvcysUXJV3ubxUVKlSS00yFn8LTLTYA0AS2PPUnGZTGN3yENPCUBQJHbAMD1IrB5zDJySWmXT+GlYUofMADCfAkgnuEV87fEJkvijhb4n71bm1qt+IMK3dMqM+0kjun0LDzTzevPao7HUa89i0E1djO/EUW9ZhSL7b2nI9sxhGi4mhoX1S1Pjty9v6VPKR0H1DW1e274XmbjfcJ5mQYydZR+b15KE9VaKdiPK0Gg6PMqUSSSuOkdBVN8MZly3ZTOEbk5udwvb0ItpUfEqEt1x3YfXu3nnAD5IW2kABArnv2g2JQhWMWJLZC0nqUbp/sSe1NQO9jTg7+4sTPApQKfQkeoJBPamKj2ZDLeH8ZTEteFuYtU0e9TqlKWfzc31ojNZtVxzDlEfebaJP6Ej+1byz0e3MW+Yn7qlMKPrqNyf8AhX861DdLW5e8Sp9nZckyH0obbbQncp1ZOiUgeZJ0A+NeWlV8DaXlc+Ej0I/ya0nNJ4llods11I/w8nDmnCOTuLMypkfbKxVMFotq1oH/AEcUnvFoPXRcha0KHrFTXRioFwuZKR+HPh2wbgiOGf8ATlqZiyFtDRL8jbufd/8AY8pxfxVU9ro3F2v/AB7VDR5gb+J3P3rqvS+JGMxTFlG6Uif3HdX3J8qUpSr+s/SlKUpSlKUpSlKUpUE4nMn0595BYpwnoz7VdYSvYVu/ZsTGyHYrp9yH22l6fw1wi4rruMuc/MH3xlt6PHnWGPJdaWnavunHnwoKH7wSRy8lJHpX0MVy+4/OxXzS4luIeZiDCF2y+g4bS0tuGi53GWzKPeyZEtzchuK4hIS5JW2kBZ8DaD4ddoj3WWnXL28trtpPEEhaFgcylSZB8iI/7VF/tKwN1e26HrBsrcBA257GR5Df1qmGastNwwNLUhSVFnY+gjmCAoan+kmpr2UeTyc9eNPA8d5pT0GxzVX2YQNdiIiQ63qPQyO4Sfcvz6Vu229hjnenAvyVLvmWLjwiri703abtI0KUf9lryGn8qsZ2R/Zk4x4GcVYwvWO52E7jcLtFZhWtdllvyO5aKiuQHO9Ya03KbjabdddqtdOWuraZ0nesvJafbISFgyeRA/2PvWg4bR+UezFu5dsKS2CConkOH4oPjEVeKlKVNddHUpSlKUpSlKUpSlKUpSlKUpSlKUpSlKUpSlKUpSlKUpSlKV//2Q=="
-output_treeUrl2 = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAADIAAAAyCAIAAACRXR/mAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsIAAA7CARUoSoAAABP6SURBVFjDfXl5kKXXVd855977LW/r7tfd090z07NoNs1oZEmRLMkS2IOJDGZJKjZOyoZySByMgCJxcMVUnKVCCJRxJVWGMgGq4lCY1WDFMsY2EgKDtYwkzyapZ3qmZ+nu6Z7e+63f977t3nPyx3vTGhns+17dr9777ne/3z333LP8Dl6LZ+E7NGYmon6/86ewgAAjCwHDHTf+gecBCABAgAGYnfquo9/S9He5h4ggQEQgwMIAICJCIEiCBIOX/r0mAMgMACTCDIggAEKE3xWIACAAgAiAyHeGJYKIzAwiICKAQsC356a3TCj9CwICAAuD9D+IqJH7Sxy89TtiEhAUEBERINYigohvxSMIKCIszCiCAoAoBPjt4hFhAh1ADYktpJkkAiIgKISAuAOEvhsgAUAQIQFgAQAS4LduoshgmSx91RFERCAEFAQQRtAalQXL4EBQc00om8eXewntUQfHzAQiGKVRcStv5i4nIEABuWPZuIOmv1oWFAYRYQQUEBYEAN1XIAEBEBZhAEAUFESiO5Yp4jyoWijWbXeXHq9Bmcg1/JnL8tLV/KVY/CypvS24r4yVRivhVvDE/vdalLzIAAGB9G3hicjg2v+isLAgAvRhIAoCAl6LLomIQ5G+2vVHgOAdusDiqjC5iuc2zAvrRbcr4FOZrN2Ua1N+dUQNr9l11vnZm2utpLAu55h6S5X/88OfL5kaiItdK+GIAAlJRBjAgUMgEGFAEQBEGBwNRABA0AVYQJLbcG6juRMTaDAz+o8zumYp313yvzL/rcVWq1rxkzx/8sT7lvJbNa96af1WayHrxnlpqFQe1UvhtRduPGf22zznE/j4PbX7u7S2Et8ySjsHAgoQsI8JkABYBGkgRgTAS/EMAg5g/j19dJh7XBmiQ5/JfuDR6v2h9v9o5puZ6yUx584Fw3jq2JFhE55fWLWSX51tIJI4Up4buat0bXZj3/HRoUoI2k9yeY/34feNfWAuvoQAIFoEABixryfcFwvz4MWa/qFz0jceBsISH9zEN86bXy8VQwt29dmXZ4Zr2tfeeq9ldfzBe989BcN/Mf9GnGRaEyrPD0GQG6ty9f+22yud6KFs4tiQKrHx9S/8xb/d+vnVj439hxZ0lqN5K7RjpZlJBACASBBBhPFyfOnbTLMAs3AFd7Vo/pr540JtJQWuZnaztX3t+lYAQYrZ0UPj/3z68RbEX7j2ajkkT9HaQnfhaqfX5LSVZOu+rgZF1DKjUjriTR0YW3wWw1qxjBf4kHzs+H/7uWMfX0nms4KJkAe+wu1IBBHxcnypfxJloPQgwAFUXg4+t6i/MVRMd7vy4NDJW/nWizcubG710OLQKJw8vicp3KszS7vKIYtxhWu0s+sXOhBZP4C07VFGvSwqHVIuxt6MK08H4VhFqF3b52/iStP2Xn7f1W7RcsKIMDC9IizSP63q5z75s3LbXhGCCDnElqx8rfuZ1lLt0sLafaPHwtCzFAVDqusS0jC9ewhEra2lZaMAKEmZwYUhFqC8ChZ54TqaU8iTXtFEaKBXI9tznYW2qokpm/rwaMmvXVye+b673pPbXPpeQuTNHoFYuG8OCBGEEACRbQ6d83elSfGRB3+sUsdr+VwCqa+8A/uGj909ylo1utl2J8oK7sZZp5kVOZMiRDFK+9Ug7tkoTpmFWdh3TjkIuXq3nnioUj8cMJt0zv/i336hl6UA6vbBF0AEIiJCRE077gpBABiEhadLd//Ld3zwNf76mfglV0igg07RaXR6raRLRHHaGx2qOubtRu4b4oJb63nHSLKcxyuu0yz2PlZOu5nyymQAEJWH5TFdqnvGeL1N7G2Ymadnf+b9/448z+a9vptlAbqtRgiIs92LO0ZKBHJkJaCC5Mv8q0UE15e2hoeCbjePkjxNil5UdKP0+NHRB45NJ84mEr1+dmv1Riwgjl3znI27vQM/WH7bqcntZtFrF9FmYTwwniKfPI+iDeysEyPXGuN/84lnrmRXellESIOzjwMPAAD6TscuwojsUfkbyWdurbe31rqdHhepFIVDBcPDIRl44L7R/VMTCshHuvBSd3M7LXQhLadCE3eyyXf7Jx7dHYKvU2nd4CLhuChKw5A7m2+4ZEN7Q8rUSGq9T174xAfv/vBwON6It5VCIYE3t1MIeMcuCBODiKCNZie+euF5KPieY/VuL3GFLYXQi1PbcqOjQ7nY5Wbnz5+9vL4eRU3ro1EjOtrKdr8THji1u14LN1eTlcvd9s2cCPyK19ywnRuSNhEIsq08mu0t31z/s9O//6+//P7VaJVIiWA/jgPpm0zSiCICgGxFGFhYehj9xMn/bnw7cl+nw5tBBa7ejK6ca6/Ptqq7zNm9Ydnq5aVWUNbDo2HSLlATWkSTvvP9x4YqleszW6vLEQOGhqWHuU+rf90aPl4iKElcKGZQOtno1itDcVp89Pd/6ms//7XN9hYRCKAA92M2naEVFiAYiA1xBA6/rj4/fV88210hUc2mO//MrXg+UQbiju2sJBvttNeAnmfLoy6oejdfbUWLPVD5uSMbw6Vo42Y0NGU4pCyFfM0mW5FnsLeUK+1MxYPAjzci0mJ89ErDt1qLnTgGEGEBIATqb6MWEOrvJAICGAzPwmfFv7KewdJSMr+2fuNbzfpE6Ptou1nWzDZutEbGykGZ2UFrPVk527Q95QcmzezWfKflpa4H8Vq2+Uaqfa0CwxpV1QMnTFLEedLuKcXhWLB1I09Uc7OxvdS8tXt4zDrGN0NV0MDIt8MJADBAc8XqATv63NnnuXC+MyMjoThRoc85DB3WlV0us5nSuui5retxacLvzud5Ys2ogzQN6l7SgsaiMzUPrSDnuooQh5ow7UZZnIZj2tQ8ZNXrJQrVG59d5qDby2JU8pYUQ4SI5HZ8JqAwidufevr5A/vGw1KwvNi2zrlU8lZ+4F1D0weGoWAA7mynZ766rUNkAVGu/hgdeGCyVPO359OFmcSvoHKAFVY1JQ2Tg7OibGL9XVqVNaKyqcEivfgHt5bzy2kvIiTgt0Qwmsj1vXc/hmclrVkvFDW/uDA5NtW4nkma21zywrbW7OHDJrfcahSuMEP7SmA5acXHPzo2vqtmjJm/kKy+BqUxXSSFmVCeIdsytlDaSLQZkXLk+WCU5KXtZOOe8RObsJgmESANPM6bCZCoJ//jk31rRogCWHD+A4feN1HZk7nkyvrF5ZvrURyVvCoSINj6vsra9ZiZ/YraXEhs103fX953ZNygtzKfzr3UDWtEoKFACpgzsl1DWoS5u9b06r7yVKeVrG6sjNanfumn/0dY0izMAoIiCIICCIyCCBqABj4cBAUBYDNf/r6j73379Pe+uPLcc/prWHgXWi+aIrBp0utK1MpcKmyhM5chFPt+clol+vpss9XMy2VNKDpELMpx0qaeJs1EVKSOmJBw6cato4fv/cATP3nq4XedOHai0Vg3RAPzvqPtAAyIF7qv4+2cBxBBWJQ4K74Ohkv1VtqI0tYTv/nYWFAd1WNgVJGKLTjrOtth10wP/Uh916Gx5ctNVVKdm2wEs67trtt0I67uqgIpBNda73DimsXWv3/yv77rkVMHJvc5zrdb25o0CgkJ8SBbFhDqx6nnu6/3o/x+0AUkAgyCIMIAyvMAJGkVv/WlX/vmrWeM+NFWxhmP7q/oulJlSubz/Y+PV8dKN0534nnH1uYZ9zZ7WqMKFBO4pHA5uwxKpvrnT/2VLTpxLxbuHzSUnfT9tuNBRATUyH3RMYMAMgkAE4AAMiAOSX2Mdr8y/OLUj5cfuHz86t8t3/+BE5VIX3jmEjLNN9vllj/3pVU1akRUlqLEFjX4YQCBS1u566bgG3Y4+kjwyOMPbDTXTkycXMjnorSrQJMIAfJtWG/pz3cvsDjCgZEHpxidUmZC7a3SyFPd3/1i9BvK8NTugyMwunb52tyfXGr1khUbt9bgwyP3fj65BFWEnKoxhDUVPlS99eqWXWRYAfOLcAiGw4WKf7DW3ZbcRsvdpZPjD/zKP/nswcm7F7auJHmvn2shIN0BCxHxbPcsCbIQCgiyp4Iq1h3IF+Lf+kryO6PhxN6RQ5Thtadmr399tihj04gXmY9MPPIzx06NHZ6sjEx/8tOfXai3r681/NNBkSVTv7r/8epDH//gx2Bt8d+88omn15/fk4zXpNJOvLzgjjRWG9v37rn7P/2z/zk9ub/dbRQuZ2ESIERQqAQBEc+3L4AggDgUJAKAP41/54X06XG1a6K6P28U1/7fxcXTi25EWV/ttfV/NfnYB+55e7hvHCZHverw9dnFL//mHxosvTK3ejNtbzfaM3/7leDQ8PbiZe3ckD/RaS88eeZ/v7D8ehWMhtBKCEQtbq5srv+jAw/+9BMfnx7emxdpIRYICQGINKDuW3dHLCA+Br/Q/tFxM/Y2/34hc+Y/v7r82mrpgOePV+/19n1o+pFTx+81e8dorE6mxA6EyfZSCDBXRVFlyikMzF+d+caj6lAepVaKzcZaYPmPTnx0Zs/Sp2e/emb7RpZtlnRYV5Xa7vpWtPKzv/uhh4++46e+9+Oe8hQiISKxKNKORJABgIAy7IXr9VJ9REJwppj+kUMyYh7r7nvy6BP7j+21U2U1PIQqBBZkFiEEzHuZTwSaAlBaXKCoubGed8ejqOeKorB5y9nFbMMvik/t+9Gbo62vrr32zPpsR2JFUCnVTg6PXrs18zenn/nHj763YEeKiJR2pIH6dAwAIpHpbsduFUq7Ar/mTZ4a2fv9e0Yv4oLBqcrUSOmg40bkeiQE4ECsiOluNsA6P/SNAgISC9euLjxwz65ON2Vh55xlBw6M8rbybLMTH9C76pWNba8LgtzkXie1y1UZwV4ciWNtjFbKaaUHlBcM0lnP15JzeznSgY43Em+4szAB34iunmidf6R98p9Wvme4PJ3b1cjmKMBsp+6aXJwdWltcjzu9tc3WrpHKyq3N2Ss3A18LoUEzrisG9Ont+Vc685fs+hy2qhKYVYxaBbc5j63FIi+ydjtCAs8YX2utDX6rexYEWEhIlMKPPP+evXIImdm5wrLylfaUV/PapbiIoj089Xa696O1H6qUJrv2VlLEge93G82lufmnnn6hm6aj9QoqMqF/dO/uQ8O7nIK/bF3+ZjS3Rt1tk5uexg0lrcLGTiwojagwtemjD777/pMP+j4Z33ie5xsPX22fY8S+OS155f/1zf/y17e+dGDs4IgaAQZmtiygAI3yh7yeH6e9pJT5D8vJXxx6f7U0uu1WrWFg12008zzbbjaw5YaT8mLReip97XS+mJeZA+A1lS0wxxZzQRGgfhQKDuxWe+OhI6cefcc7KyUThL7vG8/38OXOOURGRGG2iGWqvrF4/nPnP321uHB45HBV14GBxYqAAyatvGEdeZ086nUS9/1y/y9V/0U1GFqGtVzyYS7Xcfxc47VfWf7y2fRmecj3TNCZ4dbFhAoecIp9lo8gs2k7bkChHz7yPSfuOmnKulKvhWHgBZ4fePhqdAaArAVEYWBAUqRN5r++eOG33/jlJXfx4Mjhih4BkX4OgAykUY0qp5PNpHEz7v6Yfcengg+VK1PPRS98YuP3Vs32XVOTQVa++Ze99bNd44HvkRCBE0F0wnERJZ2W79cfO/quEwfvYShSyRChXCkFtYoX+qHx8NXonHMgwiKChFYcgBToPDZVmHhj/vznLv7yClwZC3f5ukKo+vS3WPE8o0c0mmjZta4Wq0mST4aV4yMHedmb+9PWyoUoGKNSWSlAdujEWbFJkWRpMj1y7LGj79w9OZXYTmZzUgREisjT5FfKfmB0KcDT7XMi3GdQHYmIiBSFOMfCrlAQDMnY+YWzX5z/7W2e94zvKaOVj0AiQha0CcnkKkDtcPNGdu3rndaNLJikoIxkwTnI2RZcMAs7OTJx4qFDD5fLpZ7rOmalNREqRf1mtFG+9nwvMAZfap0dhBUMhWIU5xyI5MziHFtxhbOe+CUefW35zLPLX9iGmxZiz/gBlfrOPdoqll7utJcy7Gm/ok0IaMEy50WeO2fQC03lyOSxE3vvVT4ktoeIpJVSSERKKaK+ESWlELUhz/MU4cudMyIDDpiJmcU5x8I8WKIrmC0zW6soqNqR12+deaXx7Fox37aboe+FupJ1ZGuu21stio5SBeRF0cszEAy9Sj0cOzRx9MDkAYdFIRkpIqWUVpr6QJAIEUkRYZ+rUQq18TTh6fbZfsXAAQsI327OORbLlpnBOuscW7DW2pBDz5Xnti/NdE7fTC+vuUWTmOZckaxJss1plHiqXK+MTQxN7Rs9OFEfKzBjFK1JG6VIK0WoCJGISCEgIiBhnz1CIkWglNFKiwgOCBPYqWj0WXMEJQAyoA+FGLToVLJIot31vfuGfnypfeN6PHMpObPWu9Ju2rCoHxk/MjU6tWd0b7VSdmhZWd/4pLXRWhEiKSBEJKR+mUMG9CmiAiBEIVSKlCZ8sfktQhRBR5ZBUNA555xj5n53h/wsc9/+9wc4Jb5msxWvtTrbUafAHHwKRCSzKbNDpfu60w8MBhkyIsogg0eiwW9EAuhD7WubRkRBBAASYnCDfBH7MkUAuuOnujPDJETnigTykWq9XhsDcFmRZ1lqc3aFddZZ5tsMzICI3IH0bYUmfLMRKUIA3ecCLTIJEiCDEJFz7o6BdPthjciIrj+Rcw6BCNhKwZb7hTFlNGkRq4BRHLP0xcwyKH7JDklKpHcg7SDr18qUUhqIWASAmJ0CcmQRUSnFt6n7HXzMjAhEeqf2KYqZRTklenBWRISZRQsLCyvNKAzQrzWJMO+wtv0qan/+N18CAH3t//8eI2/ipZ1oGgAAAABJRU5ErkJggg=="
-output_treeUrl1 = "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQEAYABgAAD/2wBDAAIBAQIBAQICAgICAgICAwUDAwMDAwYEBAMFBwYHBwcGBwcICQsJCAgKCAcHCg0KCgsMDAwMBwkODw0MDgsMDAz/2wBDAQICAgMDAwYDAwYMCAcIDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAz/wAARCABAAEADASIAAhEBAxEB/8QAHQAAAgMBAAMBAAAAAAAAAAAABwkEBggFAAEDAv/EAD8QAAEDAwIDBQQGBgsAAAAAAAECAwQFBhEHEgAIIQkTFCIxIzJBURUWYXGB8BczQnKRoRgkJkZTYnOxwcLh/8QAGgEAAgMBAQAAAAAAAAAAAAAABQYDBAcBCf/EAC4RAAEDAwIEAwgDAAAAAAAAAAECAxEABCEFMQYSIkFRgcETMmFxkaGx0QcU8P/aAAwDAQACEQMRAD8AcdIX+RxBfKlnyhRV8gMn+HH3kuED89OANz4ajSrW0wcodNTeUepVBBnvTKIks+AgxlBb6nJSh3bW9ILafVRUoEJUBg+fKpJipL25RbtKdX2osXbVlWvTFyXIU+Vt8vdMIG9R+9RCUgepUspAA+eOBTenONYWnkZCrimTqO448YyYz7SfEKcASrCQlRStI3p8wVg5AG4nyq/qvarM2rCqFs1ai2xWpdYUlbcebX6rKTBDWS2p0PzXEuHJORtSlWcKBThJmQ+YDTrWXUe3ply0KHU65T4Tb8duh1lFv0xCi4VIdeTG2rU40UAp2rR0Ue8DiQ3tne4dvG1hx4KDUEyADIjfJHfFJt1xLcEgtAAHz9B60zqs8yNv06kxqg3TbwqESUkrU5Eo6imIjJAW6pRATnr0JyB19DxZKNXotzUVudDc3R3Eg7j02k/s/wAcjpkZHrwq6O7X6Zeb0jSWKzdkP1YqtRqviHG3iMqbjAgeLUk5CVnAJ/xOpN9tjnHecvC2ZNwWjGg0m4Y0dUe4Kg0/FhIlqJBQyyhxCGHlIQkjvACodEpThe4I9pd2OpqFJAJIxzCM5TMgx23wTEZqvb8TPhcugEf7w/VMSfPT58Q5RyeAvoDzuU/XG65Vvs0x1D9LkuQn53fbUSFtrKN6WlJykFWMgknrwaJAClAfjwJXzJVyrEFO89pFNNnftXSPaM/j7UWHHAhzJ82D6cJv579Mrw04qr1O1A1AjV20JVyPyXu6qrj1UWyHFMJkKjLbDIUC2UJG5RZW44raoZPDdtRbyZ04sur1+RHkymaLDcmOssNlbi0oSVHCQM/Dr8hk8Ix5oFzNXaXVJtU+uZoMiUsU6tvMFUR5t1Tj5jOLTHOVhXerCkOJC07gUJCBnQ9BaKrsHEYJMSfL40O4nWnoQd/SvnZepteboyLfoNuuRLNgRnHI8SU2w9So7rPRNRC5GA/LDxTl7CnN+QjytpSjzmsvFlcLT2rz6o9Cq9xeOjVKu7Uo8cy2mN3bciUUklaS4vZk7tpUCcBIFK0xblTKJSafsqDztPi+ChKaSMONIJS2HEkH3RhJSR12jODnFj01umDqPbry7ouWFVLNW0Y8uYy40iNRkgpSpYUkbGlArR0UMqKmx5tyctTzZbu/7ABUlJggTKuYETkET3gxkeOaTXE9UDNTqtfv9GvTij0q0alNQq5XHUSXBHU2hUbZja3KKQkOKJIwkle3cemATdtObEm1fQ+vRbg/tNT6OzIr9Fp9tVMtCI8yw6UJUJCGO92JKior3ZTu25VsHAMsfnAZ1WpX1PqFutvWfTHjJivKUpTlSLZUlKnO8wWRg5wM9ehV062bTR+RqJWKpadRvP6FjyGFOxKdT5yWvEeqmY8lvBddYX5WyVYBT5jkg5pX2kXDDZTcJ5FhQWpR6lETg9MEGMEbgYncVG9brblKxBGa2Jyn3nM1GokG76TOis3c4zEhodMlLoqCEbUYPeHHlYCj3hO4BCRnAHG7HNyUYV72Rkj3SQOuB8OufgMcLs5VrxtGt1F6nw3KbVapZ0hRKqVLSpuasII7hKmSCW1qCcqBGSkEdPVh1MXJl0mG9NYbjTHmELeZQrKW1lIUpKT8QDkZ+IH28ZLqDfJeuIgpzsdwDtnOI2pj4WPvo+Rjbz+f5owuoUytKkkpKeqSPUcZY7UvQG7deNIojlr0FNzVSnO+2bS+548tbkn2Le4NupyCVJ6rB27QQVY1w/GB+XECTDA3cOHIW1BW8GaeLy1RcNFpWARSXKb2cGstJmqdk2HdElN4x3ITLCYgbYgeRLRLzYViONvUKcCd+CSSMq4JnN92QNu8u3Izct3WfcdZs696Hb63rw+g3Vs0e+2EOF3wsyJv2HuysJaeSMjugopJUSGkuxdpx8+hA+P2cZm7Wu+abY/IXqDT5Uxhur3TSlU6kQQrdKqTqnEbg02PMoJTuKlAYSOqj1A4YuH9X1A6oyllZEqAUBsR8RsQB+96FWeks2BLhWYPjEen1pYPIX2V9385Onz1YpGqEPTqgQENNlMelOTJ77zjWFD2brGxnYOiu9JypSQjaNxOTvYm3dypMUet6fXF+kqvPVQpmtuUhmmohhaTslkKecW6EufrC46cAg4xvXxauwf1po1v0Kt2DXKlDpNcqCILtHjTHEsGprbQ4260zvwFvArT7JB3kBR2nB4Y1Iid24UKThSehSR1B+7gv/IHEep2upvWSOUMqMwEjqHxVEn61K5aW100pCSCCckRWGeTXs1L00DvSZUrjr1AaZlIU3I+jZK5rs45J3JLjKA31KjvOF4URt82RsNqnphx0NNp2ttoCEj/ACgYA47bsbBP5zxFdiY/36cY9eOquHjcOe8ceXhXLHTWrRJS0DnfOaJEm4I6fV9kfescc2TdlPbX5pkVH7zyRjihyxTXj5m21fhxzJVJoz3vRmVZ4Znre58PvV5V0e0fWurrpr7SNI9JLguLxUOZIpMRTrcdLwX3iyQE5AOdoUoE4/ZB4ShzJ85DeqN91CdVax9IVKYrDzzrw7w4zgevlSM4CR0SOgHrw4qVatBeCgqGwQrO7IyD+Hp/5xxKjpJZVRP9YtugyP8AUgtK/nt4McP6kNOJU8zzE9wY/IpJ4m4fXq7iVLd5UpEBOYnxpNNmXfSaq1sVIhutvDatC1JKVj4bhk5+WOvr9nDSuzp5v4956Yz6HdtyRTItxTCIU2ozB30qO4F7WlKUcuKaLfvHqUrQDkjJvqtCLAP907eH3QWh/wBePStCbDV71r0NW30PhEdP5fH7McWNf1xOoMeyLJSexJBoPoPBtxpd+L1p7EZTmCDRKGrlpyT7O5KK5+7LSeP19fqA/wDq6zTl/c8DwOIukdmwT7Gg0lr5FMdI/wCOJzVn0GKR3UGI3t9MIHCGrT3ewrRhdOHcD71//9k="
-output_treeUrl3 = "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQEAYABgAAD/2wBDAAIBAQIBAQICAgICAgICAwUDAwMDAwYEBAMFBwYHBwcGBwcICQsJCAgKCAcHCg0KCgsMDAwMBwkODw0MDgsMDAz/2wBDAQICAgMDAwYDAwYMCAcIDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAz/wAARCABQAFADASIAAhEBAxEB/8QAHQAAAgICAwEAAAAAAAAAAAAABwgGCQAFAgMEAf/EADUQAAIBAwMDAwIFAgUFAAAAAAECAwQFBgcREgAIIQkTMSJBFBUycYFRYRYjkaHwNUJDUqT/xAAaAQACAwEBAAAAAAAAAAAAAAAGBwMEBQAI/8QALxEAAQIEBQIGAgEFAAAAAAAAAQIRAAMEIQUGEjFBUWEHEyJxgZEysRRCQ1LR8P/aAAwDAQACEQMRAD8Av06wtsdus648N236jjo5dZ156670tsZVqKqnp2dHkUSyqnJVALMNz5C7jc/bfoJax969FhKSNjNubK1t8pjrjC3EIOIbeNmIVtvqDAkHcEDcg7DuYM2YVgsnzsQmhN2bdRNtki9gQT0HuIr1FVKkp1TC37+t4Ovx1xMgEvHkvLbfjv52/rt1XTZu7KS4Wya7W7MMys1jvFLJHyvESNU18rTuGKK3HZVkDqx4DzuqkgsVk1DrRqTjeTW2mro8dobjURrJBJ+crzrYPIMaEH9fL/tJCry8E779JuZ4/wBOlQSKJW93WA1+PTcte7Xt3jHTmKSq+k/F99tuvDs/EPlv1nSxaed396wvHLa+VW8XaG7V/tx1lHWrMtJEQuytsCSwHJvJAPx4+SwmJ55ac1WRrXWJWLDsW2Vl8HfYjcefj7dM7K/iJguOhKKaaEzT/bVZTsSwdgtgCSUuw3aNWlrpU/8AA36GxvG56zrOXnrOjiLcZv0Gu9XuVpe3rSWukp71a7Pk1bAWtJuDrFTsyyRqxeR/oQfWF3Y+CwO3jouXi4R2i1VVZNJBFHSwvKzzSiKNAoJJZz4VfHkn4HnqrT1au+64a4aD0eL4rhvu1y1ZrLhKZo61qOAwMoVgY/oUmQO0isAhhTyQx2C8649Ko6NVImd5c6aCEWVs4CmUGCSxsSQxuAWjFxzEU0tMoBTLUPTvf2bY3t9xHb36gtNe9T7Vcr1b88rnuivb7UWhmeqeV3KTSRmPaGSH3UChRExLFSGCjY9dba8i101KrsVoMTzq4fl9POLTlNetRjdqaIAGRfZVWmk+s+2CkZ5gqVdB5Wvvs71/s9m1tsdjzazXzIKha16C0SQ1U81PGfZdYoYkUiSMGRot/b22Vm3KhenU0617t+L2LHhmd7uGn+E0NXWol0p3hmuNTKZn4QSuQzxIS7bPKp29lQBtIrHy3mLL66SfZJWtQsST6ndiGOolgxHLlxC7lzlKVpqLuevs7nZu+4azRrMm9Pm43rRmut1jorXlF0uFfLLJcrvkNRDR45E/FpqZTNzn4o6uSsaMzllZuPkLFtcprPpnE1qs14vVwv8Ahcc7ZHUVFVVVCijWP3EWGSVlZwdyysm3gMPnYBkDqNDl+mlpy+huWI5lDb62WKSjt1X7VfU0LsU3rYhwblzKlwSWBkPkgndPPWJ1Gumqt+xOzxXC1/4it1dVWc43FRyrdaeCpEMlMjVCfRNBxCkISDvIHXmrMUo5fTU4hXJoqkkB1Em9iwfUC7Bgw/FlEEniL0uhFQ6JSbsD2bkkuyR3JPdhG/8ATS7nrhkOpNdi92v8i2+uouVKSk70jcY/dEkhj4usY8ANuF3B3322NgWmuSrer7jd0bJFs9FDIWP5ZXpxrVDqSkhcAq2ytsy7+HPg7eFR0y7qcFxO7WPT2qv2oV6WzRQ0NJn9CHqZtoogyU8lDECIkV/pI9p1ClSZASSs7r9bstjxqsyqguWKZfjt4rktiKIlpqyuLI0YmmEi78tkJ25cl2H/AKlhj44mYrEBVSpPlAsQ9wW2N0pAJZykgHd46TORJHpuB07MeoLDsGLm52i1mw5Tb8op2nt9ZT1kanZ/bYMYyfsR9v5/p1svnqtzQ3uorMKmusmC2+4TXB5Ymu1snqfxDQAIT9CShZpdmYsQocgPvvxG4sas8tTPaqaSshWnq3iRp4lbkI5Co5KD99juN/7detvDvPxzHTrTPlFE6U2th6DqJbSXJ2FwfgkXg7wvFEViTpFxvu3OxIHT4iDd11+rMa7csyrKGw0mSyRWuYSW+qmaGGWEjjKzlfrKpGWcqmzsF2U8iOqMqu6W23vb4bXJlFrp8jjkarvdbBPUwVgjUyFKROKLx5qeI5HYblmYjzef3UaZXDWXt2zDFrX+XG4X22yUkK14P4d+W26sQCVJAIDgEoxDbHbbqhuDVW/YZmhq6fNL01xtVo/LatFtrXOKnc8fdpOIUldiiiN1A3WLy31bMO+J1PNXWylB20FujueiSSxKTdxcMN4EM5JP8mUVbMeBu9+/Tnn3cJ5JbL/HfLLfMRvQhksNzlpaO4UamKeh5RyIze2VKqrLIyEfUp5EH5HU20jv1dluIS2662HHbtmEN4E0F2nUyS3tnk/y4ngVN5PA47qR9JX6QfLSbtmx6/ZpmWWw01tu98ocko2rnqaGyS100LS7rxd4EKQkvuNmGw5DzvsAzFj9DDXLNcekuVsv1pwO6UtKl0scz1EkM88waNoqef21EtHKvlvdUOVZFUr5PAZp8OqsQmfw5colmIWAbBy4JADsSRp2e7Rk4Vh8yunJkD0pJupiQkHm3/P03gS97elGo3p/0dDleQ6a0Fvtepwnx29LSTpDTR1KRrLTxe5EXJJWN5UY/LQPsQVI6TPWbQvMtcMqp6e3peLtUQ07NLJFHLV1j+zFzdlC8nPCKMMSB9KqPtv0z3fn6jPcNq5p8nb9rVjuP091w/IqWpvVyeiMF3Z6dWdRII3NMwdZFkE0KqjxbFQQxc2O+i/pZj+JSZhk9QlLDdKOjSOKplYKaenklnkmbc/A2SIlvsp/oeiyhwWiosQk0lAS63BUu6hpBLHYOAGFuA7tD9wzLNHh2ETguWFGzlydV3SSxFnIcBnYPeKUcW1wzftGyg22qjyTD8ls4WjlFfZwl2SKURvKssdWCRyT25FEibnkGBUbEl/Sbuf/AAX4qntN2p6QRVpvMVXU0LTS1tUzD/qMnBi24aXiEATlINy/EEE71dqvG+8fvtzrJtG8du2XW602migyG62K2VN1iutXDHIstcntK4SnjgSmgE30ROYCwLAq7KbilW1khvln9mqFumni/MKCkWOnmmUckdDy2IbYAcBuNwQdiTvj5iwOkXMWBLG/5ABlBxdyGLObOzk3DvCWx/Dl01SqXOTpO4YMGLM3xv3dzD3XLUW8ZHdsLumVXCj09ySnoolllEbzW6phMszLCZIC27kOAOJBARlbcMCLUOxPV296jYveqHIMgx+71VhqBRU6UMyPMY4+StM3H/xs2ypv52Q77Ejqq/tV7a807k2ojg9DUVOF5MrC5TU6xmO0pF7UFK8kSusKzpIVmBRWJKMdiqMxty7Oe0Sy9nGlS4zaq2a7TM/OpuE1LDTS1WxbhySJVX6QxHI7sd/JOwAy/C/LtenFU4hJdMlIUFbhKn1AJA/q0rBsSoJsbFomyvT1JqPOAIRyX3tb39+LwWul+159MLRnX2ySUdVh9rxuWsu0V2uFbjtJBbK26snuBoZ544+bxOJX5LuDueQIbz0fTP11mfYfPXoiopJNQnROSFDuIOp9NKnJ0TUhQ7xAO3rtPwLtWobjTYLZFssN1kV6gfiZZyQvLggaRmIReTbDf7/foj+OvP73L/nz1DLN3D4ZllHk8mP5FZ8knw6R4LvS2qsiqKiilUsDG68gFbkjruxC8kcEji20eqkoZOn0y0BywYCzqUQPsn5MdLlypKRLQAkcAW72EJd653YvatQcKg1mtVLHDkmLU4oruVXxcaLkXgZx8F4pdowfvHUOCTwQAM9rnbLVd1VsseG1XOGySNHJXyuOX+RFGm/IHcN8L4bcFgoPgnpzu8jWax629hWp0lvWupZqKGKirKGvg/D1VLMaiEqjpuR9QIIIJB8+dweoT6SdbT1OJLJyV5kt70qy7fVKFkQgn++w2P8AUoT9+lbjSaHE8WpF06wqVOZTpNjcjfh9LHkF+YYeC4hNRg0ycguUkgHpYfp4bXSXSXHND8Go8bxW00dls9CP8unp1482P6pJG+ZJGPlnYlmJJJJ6WTXT0e8D1H1dtebWE/k98qM4TLMmlquVV+cw8JQ9KgPiJfccSBQOLEfWG4xlG3979uvom/5v00KzDaWpk+ROQCnYDZrNZtrWtxC8q6eXVBp41e+/3HnxrErVhlsFDZ7Xb7TRKxcU9FTJTxBj8nigA38Dzt9uth10LL+/XNZv56vMBYRMAAGEaGuy2lo9+cqj9z1p6vVi10v6qqNf3PXTe9N0uYbkz+f79RC89vMFezfVIP5PXRJ7RJ5Nd7HQsJJKyBUiPNizhQAPJ3P26rV7GsYs/pydxOX3y+5ZDl2P1lNV2y2U9jilqKytilnhlWSpEqpGhCxAEK77yM2xK7sXOzDs2hyWlaP8dcKRiCBJBIAy7jb4YFT+zAjoD5x6QVwvlY8tu1AudHyO+1VbYqgg/ujRD/boPzNhVdVzpE6jSl5RJBJLgne1g1hu/sOcfEE1QmomyJSZmlyxURf/AFtz9Qp/cX3L6j5XiuSU5/MK2nyKYTvardFDQ2mjCeI44oOfI8BsvNyzMFX4+OiZ2e9zOSaQdtuO3Sw2+GqzD8dGKm2VMywrEgjcSrISfALBxuN/1qQCD1NpvRjzTn41So2Tf4fGX3/1FZ1tbD6Q+YWqQM2o1C39eGOuu/8A9Z6X4yVjSAny0gFJcHUHB3/ytcvZotUmbcw09MqjRQywgiwCtiTcnUtRU4cXPTgMWZ0T9QCm1D9inyLFq7F6yRN3mSup66j5+dwCriX+43j+/nbo5UOb0NdEskNRHIjjdWVtwR0nuGenHerC0f4rM6ufj53pqBIGP8u0g/26MmJ9vtfjlLHCtzrpuA25Svuzf6AD+AAOmTl5ONpdOKlJDWI/J+7WZud368R0U+umkmrlpQOiSTf5J/fxBsgvsM36ZFP89eqKuV/hgeh/ZdPayiK8qqVv56lFssc1Px5SM379E8aLCP/Z"
+# The images now live in assets/ and are loaded by Assets.py when first used.
+# The old *_url names stay available and are resolved lazily.
+from Assets import AssetUrl
 
-input_treeUrl = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAGQAAABkCAIAAAD/gAIDAAAABGdBTUEAALGOfPtRkwAAACBjSFJNAACHDwAAjA8AAP1SAACBQAAAfXkAAOmLAAA85QAAGcxzPIV3AAAKNWlDQ1BzUkdCIElFQzYxOTY2LTIuMQAASMedlndUVNcWh8+9d3qhzTDSGXqTLjCA9C4gHQRRGGYGGMoAwwxNbIioQEQREQFFkKCAAaOhSKyIYiEoqGAPSBBQYjCKqKhkRtZKfHl57+Xl98e939pn73P32XuftS4AJE8fLi8FlgIgmSfgB3o401eFR9Cx/QAGeIABpgAwWempvkHuwUAkLzcXerrICfyL3gwBSPy+ZejpT6eD/0/SrFS+AADIX8TmbE46S8T5Ik7KFKSK7TMipsYkihlGiZkvSlDEcmKOW+Sln30W2VHM7GQeW8TinFPZyWwx94h4e4aQI2LER8QFGVxOpohvi1gzSZjMFfFbcWwyh5kOAIoktgs4rHgRm4iYxA8OdBHxcgBwpLgvOOYLFnCyBOJDuaSkZvO5cfECui5Lj25qbc2ge3IykzgCgaE/k5XI5LPpLinJqUxeNgCLZ/4sGXFt6aIiW5paW1oamhmZflGo/7r4NyXu7SK9CvjcM4jW94ftr/xS6gBgzIpqs+sPW8x+ADq2AiB3/w+b5iEAJEV9a7/xxXlo4nmJFwhSbYyNMzMzjbgclpG4oL/rfzr8DX3xPSPxdr+Xh+7KiWUKkwR0cd1YKUkpQj49PZXJ4tAN/zzE/zjwr/NYGsiJ5fA5PFFEqGjKuLw4Ubt5bK6Am8Kjc3n/qYn/MOxPWpxrkSj1nwA1yghI3aAC5Oc+gKIQARJ5UNz13/vmgw8F4psXpjqxOPefBf37rnCJ+JHOjfsc5xIYTGcJ+RmLa+JrCdCAACQBFcgDFaABdIEhMANWwBY4AjewAviBYBAO1gIWiAfJgA8yQS7YDApAEdgF9oJKUAPqQSNoASdABzgNLoDL4Dq4Ce6AB2AEjIPnYAa8AfMQBGEhMkSB5CFVSAsygMwgBmQPuUE+UCAUDkVDcRAPEkK50BaoCCqFKqFaqBH6FjoFXYCuQgPQPWgUmoJ+hd7DCEyCqbAyrA0bwwzYCfaGg+E1cBycBufA+fBOuAKug4/B7fAF+Dp8Bx6Bn8OzCECICA1RQwwRBuKC+CERSCzCRzYghUg5Uoe0IF1IL3ILGUGmkXcoDIqCoqMMUbYoT1QIioVKQ21AFaMqUUdR7age1C3UKGoG9QlNRiuhDdA2aC/0KnQcOhNdgC5HN6Db0JfQd9Dj6DcYDIaG0cFYYTwx4ZgEzDpMMeYAphVzHjOAGcPMYrFYeawB1g7rh2ViBdgC7H7sMew57CB2HPsWR8Sp4sxw7rgIHA+XhyvHNeHO4gZxE7h5vBReC2+D98Oz8dn4Enw9vgt/Az+OnydIE3QIdoRgQgJhM6GC0EK4RHhIeEUkEtWJ1sQAIpe4iVhBPE68QhwlviPJkPRJLqRIkpC0k3SEdJ50j/SKTCZrkx3JEWQBeSe5kXyR/Jj8VoIiYSThJcGW2ChRJdEuMSjxQhIvqSXpJLlWMkeyXPKk5A3JaSm8lLaUixRTaoNUldQpqWGpWWmKtKm0n3SydLF0k/RV6UkZrIy2jJsMWyZf5rDMRZkxCkLRoLhQWJQtlHrKJco4FUPVoXpRE6hF1G+o/dQZWRnZZbKhslmyVbJnZEdoCE2b5kVLopXQTtCGaO+XKC9xWsJZsmNJy5LBJXNyinKOchy5QrlWuTty7+Xp8m7yifK75TvkHymgFPQVAhQyFQ4qXFKYVqQq2iqyFAsVTyjeV4KV9JUCldYpHVbqU5pVVlH2UE5V3q98UXlahabiqJKgUqZyVmVKlaJqr8pVLVM9p/qMLkt3oifRK+g99Bk1JTVPNaFarVq/2ry6jnqIep56q/ojDYIGQyNWo0yjW2NGU1XTVzNXs1nzvhZei6EVr7VPq1drTltHO0x7m3aH9qSOnI6XTo5Os85DXbKug26abp3ubT2MHkMvUe+A3k19WN9CP16/Sv+GAWxgacA1OGAwsBS91Hopb2nd0mFDkqGTYYZhs+GoEc3IxyjPqMPohbGmcYTxbuNe408mFiZJJvUmD0xlTFeY5pl2mf5qpm/GMqsyu21ONnc332jeaf5ymcEyzrKDy+5aUCx8LbZZdFt8tLSy5Fu2WE5ZaVpFW1VbDTOoDH9GMeOKNdra2Xqj9WnrdzaWNgKbEza/2BraJto22U4u11nOWV6/fMxO3Y5pV2s3Yk+3j7Y/ZD/ioObAdKhzeOKo4ch2bHCccNJzSnA65vTC2cSZ79zmPOdi47Le5bwr4urhWuja7ybjFuJW6fbYXd09zr3ZfcbDwmOdx3lPtKe3527PYS9lL5ZXo9fMCqsV61f0eJO8g7wrvZ/46Pvwfbp8Yd8Vvnt8H67UWslb2eEH/Lz89vg98tfxT/P/PgAT4B9QFfA00DQwN7A3iBIUFdQU9CbYObgk+EGIbogwpDtUMjQytDF0Lsw1rDRsZJXxqvWrrocrhHPDOyOwEaERDRGzq91W7109HmkRWRA5tEZnTdaaq2sV1iatPRMlGcWMOhmNjg6Lbor+wPRj1jFnY7xiqmNmWC6sfaznbEd2GXuKY8cp5UzE2sWWxk7G2cXtiZuKd4gvj5/munAruS8TPBNqEuYS/RKPJC4khSW1JuOSo5NP8WR4ibyeFJWUrJSBVIPUgtSRNJu0vWkzfG9+QzqUvia9U0AV/Uz1CXWFW4WjGfYZVRlvM0MzT2ZJZ/Gy+rL1s3dkT+S453y9DrWOta47Vy13c+7oeqf1tRugDTEbujdqbMzfOL7JY9PRzYTNiZt/yDPJK817vSVsS1e+cv6m/LGtHlubCyQK+AXD22y31WxHbedu799hvmP/jk+F7MJrRSZF5UUfilnF174y/ariq4WdsTv7SyxLDu7C7OLtGtrtsPtoqXRpTunYHt897WX0ssKy13uj9l4tX1Zes4+wT7hvpMKnonO/5v5d+z9UxlfeqXKuaq1Wqt5RPXeAfWDwoOPBlhrlmqKa94e4h+7WetS212nXlR/GHM44/LQ+tL73a8bXjQ0KDUUNH4/wjowcDTza02jV2Nik1FTSDDcLm6eORR67+Y3rN50thi21rbTWouPguPD4s2+jvx064X2i+yTjZMt3Wt9Vt1HaCtuh9uz2mY74jpHO8M6BUytOdXfZdrV9b/T9kdNqp6vOyJ4pOUs4m3924VzOudnzqeenL8RdGOuO6n5wcdXF2z0BPf2XvC9duex++WKvU++5K3ZXTl+1uXrqGuNax3XL6+19Fn1tP1j80NZv2d9+w+pG503rm10DywfODjoMXrjleuvyba/b1++svDMwFDJ0dzhyeOQu++7kvaR7L+9n3J9/sOkh+mHhI6lH5Y+VHtf9qPdj64jlyJlR19G+J0FPHoyxxp7/lP7Th/H8p+Sn5ROqE42TZpOnp9ynbj5b/Wz8eerz+emCn6V/rn6h++K7Xxx/6ZtZNTP+kv9y4dfiV/Kvjrxe9rp71n/28ZvkN/NzhW/l3x59x3jX+z7s/cR85gfsh4qPeh+7Pnl/eriQvLDwG/eE8/s6uL5TAAAACXBIWXMAAA7EAAAOxAGVKw4bAAANbElEQVR42u2aB1gU1xbHJxYUBRHpvYNSNZaYWBMbqCAibQERpElfdhHpVWlRApoixhY1YoklCUgXIShiDJYQFelGRCP6CCgg9Z1l1mGYnV1Ink9YnfOdj8/duXcWfp77v/9zZ5E+KoYdCIWAgkXBomBRsChYFCwKAQWLgkXBomC9jeju7XrR/TcFa+j4vbV0W6XVmSepFKwhIu3x7tCqjfG1XiFVdhQsXrHnQVB0tXNinQ9kZPXm260lFCzy2P0gMKbGFSUFuaNmy/HGFAoW2epr3I3VFJoJtV7wDgWLGBUvb4JC4UmhGVplB9siBWtQxNS4gKJzwgqvdnjy6iEFayBut16NqHbkJAUJ79e333+nYG39YfP/Mv1QQ3xsrTsXWA4P26vfHVj3H5eL+CDS/khW+Rkew5LqmW3dL0gvhVXZJ9R6k8KCSy1d/3l3YMVe8FcPGacfNVWCgQSeId+8Lj47B+oTUmXb2FFPuNTZ8wosKCkpIAiX3qnd0DBZTztcaGb0NEj5AMQnjcY5BnY6+MvBCgRV0h60V+Iv/d31LLxqEyks8FlHHu18p2ABIIOoqSgsSGkmcrx0UE+X03QSNjusWIBXU2cjdrW1qzmMCyxYgzVtd98pWJIMBCMFadC/HvEDQKTxkgQWASgQ6o6TVFytR3J9wHB+gc7uV+1dL191d/ABLKnBsCDVgsfGXWD/nfdelHHagtgad+hssDtEVTslDDZZaAFC0RE+q6un63pjcdqd1PirW33zrDelr3DIWOmYscoxwxDSIWMVvAM5emHJ+MMyFMXD0o2Y8mGMBHr1ROMekB5ST/Dr3xfRMYcbEgEf/ipsBWUtRfhPyao5E3TJyT59uUumsXv2eq9cC988K3oezS/fBp8+uVaMfNsRgNXd0133V9Xtuuu36n6tfVLJbZhRioF2+OTBK1FU3A/hVjVY3we6jo4pac7BusL+HdAu99lp9FJPb8/+WzuBkVvWOp9cS3o+kQ4hPXLMDt5Oequw5gcpiDsgwraIqD0itomV8A8hW0TOBXH4cnX+7XT84IPFycqBxJUI5dba3tLZ28HNFkACxyvNWXCHVz0dwZU2CXXs7bL4PxnonTOqTgImj2wzzgrillB3sE7fKqzZW6WUt3yg5S1ISHVPAUU3ZJo9AlcLyjOx8QoBiH6kCAFWx6uOPzuquPUx/Urv+XmdL3qHvX9GAjsQ/rq2CrbqF7o6Z64ZPiZIGAxw37bAnyjeL+GIcMLCUs1jvJAN4vSVCTq+sCJLjI4YRIsSlmH5i2tR1Zu5werXJruX3a39pw63Uh9GYbsbLDrPnA3Dx4QmCFlcif8I7IaSjoiGpwAPXpAwZkWUDjo+MStIislWehD4Odul4M1bLVegXnjAApTlraX4zwWRcslc651r+U9J9a/BtdceFY4ArP15SSBbvGFBSm1G7FLYW/Xu/JhpdEQvUkQzdALzFEu8K17cjORZWdE1Lpee/4j/XMDknWvxL0jR86ydLqweMZ+l5T1R1WMcJyAN74mQ2MspdggsW3RKWX2JUiACffWVapYteNb5mFsrg2ZMjWtWUxr2iTtLg8AWcCVSwAvWlmzTU3cPjBishucPJlgjml4TCaTmuIrMchNW8Bun6iugCeC8JsC+iZ8YfNYVd6KwkduJAgorp+kUOvLaoyKwl+QsCm2Z1zZ5f2/KjRdI+7/2om/MlKb9sm8SbRAvoKPiK2BMkw1fOsvEWk6ZLqBEHy/nirh8Y0p6h2ONX5CaUvYyrHYuac5GRzpdMAJTzlFNtswyR6+DxrZz1X1/suAGCzaE0/cOjny7k5weJcjiNYHAa7qXYMyiOTvnz7c1U1HzmTDGDmnvbOOcXtd2DwwBN1iR1Y5VL8th2Pd/fA3riICAUWpPz7a2X6VjLizum2HpV2RHSgoQu2aZjJZGOv36qck2iILroBJT95kAK9F/hV7CJ/MgjYxFGaddSKfvqvOLq/XkYh2gNemFMeCPBlmqQlZBufgtsJKVsRSX8j5uyijeyE2tYO69Z7dH0akDtD72uw2hxKQ3I0puiLrneAAH+iXHGMtcoRuzcPb2BbP956k/e1BPon0ddWDQyc4VPHfVMWDAybvfuuPKCgrK97yFzUxVa1V5K3mZLXHL4R1upKCmDtzaNRqPaFidWl6S1a6lQApqDXRdyA4Z64B4f6QUsXBm+OKZ3hoSmV+R/OqnHn8d/fpIC6fuLgXPz/Wr1Wo6qlYXbfxvOroGLbGUlaFpK1mryW/eNId5w5FrJ5htFlrkyn9Pd5gGymGLZ4YvmcXUV0qxIxF72BNjaz3whzBQbr19vTcel4CZZC+9UntQKCslOZqeMm2Gkt3HGv48STHy3+SXId4MrKbWJ1/kRtC+/Wx50gzjPbP9TtqdLTtCGPPwbrm3piTAilj6YeBcrahlczmrMrzaIf61eMXWuB9siOv3VsFeOeaMyxvpmVasatJUtNFXoekqWynLAT7YDUmMQj4NVl9wocvoOilt63xpsXchNHpqwWOnhwnqhAtph08Gg64ciMCb7sc2vOhowQb/EBO8bY4GwIIMnq8dulCPcDdoA2FnRMU+uNIWLCu8Cf6IcdXe68g6KwVZgMUipacMy9BzvzGpqPvkWtmnL/vX5zD/L1hny45CewyMCGd7WLcM1GBA2I+e2JTAeVphiwzYvD7Whp+Ee3b0tIG3gh7ou0eJrE77aZnb5fUeyYaWMtJQTUAKkiVVTvOYvzlwYnLOXAM/a5orRtcZ/PZ0hgQDIcWET9XgMct2aWGz7vxy0U9XHoUFGfTR9MT1JGcmu+qZXT2dLOFvOOQYvYBFSo9NiqajZGOgAr4Bzwh6IDD3zIsbrzYUjLoHFlE/+0ozEd6YIGExGqXoE+bGm3waskAP47X1Q7Uj/h7cPijwc8sN0hIDpPSUzWUkPc6s87xoviVrHQg/a5Hm26bdSX3UWj9Kn+6EnfeA9aUVOpFbZelGTpHwQ+gnSE6763+/SdeRw2BB0rVlr50/zTnySubPRmKCGCnIDcqSPoyVKfeiD/+eklXzw52mG9293XzwKAyU2/k7E1BxlaAPpodN1I0Q1oucohMhDDoltxWBl6U1Rdzmxq1dEoorLtgiYaNsfdaEH3Ov7NfPRD7Ak7LSVoCXfSMXb8A6HC35evPhtQviFfUjRRYnqvqk0YruZ/OeUl6QA7YLX1wg/F86mGMDmpueLhcbR9NVwkgBpuXTxtZXEB+pltWXxPxMN0zWUwhAJBkIiAP8/+lECLkcMeH91YpRbUoJETBbHTwqu7IWz/TTke/t7cWurlOeBnWEkYI0U5fc4WyDv0NiVpBq8FioYvWQ8drhQvqvH3qDMuhFimiFTVTYhoBoHrnyJd/DSv8iLnCuJqZZ5QW52CX3T+dt0JDGk4KyWikxARsQk+4HGzE4O8JDEM6EAYBs7g6plvZmPobV8vQv3xkyLPcwf8Zel4GSObA9dK38FDwpSBMl0bTkBLaryAkV8RnasuAT6g7WZnFlHr/CYjm1VZ+Ah4CdEXun9k75sqlj8KLOsqA6igALP9EydTGU1fBhoV+wEPVFOJswvoGVszfFS1388omBP8BUVdxKR5FQVmsVRDKPEQ85F8QraYYI/ENeotPoSPYf5/gS1l+11QxdBexlEt3NVEWMQArKar2aBOl02H//eX2xeNU1VfIfLJaZunyJff5XU7VMlLgAIY0Vp6Yf3sdtumXqItgNh69fMFIjRAAkjy9hYbFp7nTLGfLEstJVWiMnzHviweJkEG9wwryRoV09jAS9a257zsewCs6eXC0rRCAFCRJ2KDZ8yOnQcrseNYX2SzVozIywSWCyAA0k+Abt8MlQSorbWGYV3PKj5j/5VeAHdF1FzJpD11HL3tX5atgn2t37f0my3rcU2lIpJgJGDErJKMUg9Lz7pYpM/jalWPx04BtjBRHOsjLXkgk0N+obTTHysKCz4SwrlmOQn1Kae4GCNRB5p77n9Ov9a1DJSHpS3yiLEYZlN1ON0DCzz600pGNdN1KwBuL+rTJDKUFOUqhrL8lKp2DhekMnG8LpwsA+KDaub/TFSMJaIT6e07JDgjt1WzKbgjXIiJI6BkhoBlPDAyhYAxFosRqcFCksgFiccZ6ChVuDYuRrENJIZtLThocULHZcv5hLaq9QdQeOfaMyRgbWnm0+ZuqSpLDAzVtqK1CwBmLjLA1SL9q/Fcp5r/yEgoUXrHGkpND+OZRmQsFix42iAm6CxWp0NKV3ONtSsNhxPCmO86wd3xXGb7GnYLEj0t7cXFOGR2Vtd6JRsF6fNMxS56bu/ZolG2S5hoI1oO7c7CjaGG5ZOoeCxYrmpqeG0oLcSKFPdAjPn99fWHd/u7ZGTpgHLMiVEgIULFYU/XjGWHEqb1hAE5hSsPrO7duzTnkab1hgLE6kJFKw+g7FRpiqivOGZTFdztdoEQWrb08A1xaaOlYmRoKH4wYNKd6w0G+vZR479L7Dina0Bo8+JCxwWw7ztN93WAFmqwylBKFwhsyFE5Fblwvfa1hXczIyjx7MTvtuyLxw5EBpDvX4nm+DgkXBomBRsChYFCwqKFgULAoWBYuf4r/3E6wq+V3kjwAAAABJRU5ErkJggg=="
-input_treeUrl2 = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAGQAAABkCAIAAAD/gAIDAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsIAAA7CARUoSoAAABulSURBVHjavV15VFvXnX7/zB+dzpl2cpp22s40duN4dw0GbDC7BGKxWWwn3jAYgzFoBWJsnPak6TTptDndpul0SZtpnbbTdtrJtGncJsaANkBgjO3EzgZowWbTwr5JepKYe999enqS3nIl0XLu4TyjZ+m97/2W77ddEVaXL75lQctJ2pyklToQOhm8OuN7MOMXPVP8Q52k6DvQF+by2Wb84hfGf0nMPaJ/EgkhRb3RGIAA3IDgBYHrHqOuO3Gk2Dcp9IkzfsxPFEWKeRMivqcHzgH3b6WuySKIlOjTs1LvY2VQCF98oIsiZcWTQWFpAEozxroFgluAxfTFQt3hGLZaCSNlcaLPBcfshRAk6ROoY1Epxnk2OFrMPBsbH1i0WlFn4Dw9SwIGiHp0CAhozsxOctRBjoBl947aPfDA4RtxUn93+cBLow6vNeFnE6FWQnrDMnkcNsvCkvPEn574o4OC4xul4HgwS84uk8se0uvzBQJg+b1+36qHnFsGT847Prfm8/kD6/6ZZYCgl/q/8X8olIbZgKjojXHpOxF2BrZRxHl6Qv/dSZqdvhE7Ob3o8fj96+uBdaEfP3NgX/CYHVAr49AsC6XXOKaDz2sR7A+jz0jMYSFTLeSzKaRsTo+b9DF4jMya/zD1f99/+IMXH7zw4tgLP3j43dcn33h3bhS9al55d2BeRx0Gxme8EWCJGylGpvBukLkLbrCsGMqMz26EHBZQPYfv4ayXkRe9U3fFKr/sONv64FzjcH3duxfq3m248MH55rHaZ6ZrLluaBhyD35p+9pXJb9lWIHaLa9CEWZ0soifqjhjzgm06on0xLs9iQBR9elZhkwestZOcmPMgvVv2LH/1oebS1Lnqdy9IDE05WnmuTpWn0+TqlDlaTXa3Ml8vr7rXcGm67suTDV+ZvugnAcTrcyteYPspL+mzYtOuoNuNX2mwwLIE1Qrr6QlcOrTlPuuMB8nUxJr10sRp+agiT9cIMJIaVFKjIl/bLDEqpAZlkVFT3Pu0RK/O08vzuuXyYeVz4+dHFh4gYbS5gCb6EQkS5egRz1uAeYq+AyGOFIacM2DxPj0oa+SwHbo7KB1ux8XJ03X35ZldKolRWQCRAjIlb/pQkadvKjJoKvvbZEYNhSDAUZ3Vpai+J784fmpixQ7+uy/gH3a4bbG4IwE+ZcVTZBHJsgSNog2DedHn89syoIAzi5SpCqw/N65oHG7M6lJKaaTAgSpXK392XFnztqrcdEWqh/JVYIQLvQq08vz7DV8ca0C2zrXsNTuFJEI8ruDi6AK3BgJbAkf7EJm2JEapLE7vegDe6LWZ37RN1OZ0AZgUAAUKEfg7V686NaRufL9dogcypaReCi5KSbO7VK3jtb+d+gXlFQOjdpKPcyGFELjmkExhxE+4ksU8IotgWCviH+E1+acXPMjiXHlYe/yWPE/PRgromlJmVFX0XZHolRApg7KADRaFV75eVdGvaBs/S5IQLfCGo04OsBBSDyiFECCDtiBSNmxeScTNPK2Y/pGyCEBlltzwFgcXDG2TddndF4AlYpCCYAFdM6gKjWogQQCXCKRoWA3KTG1T61idYaYTvNWq2zvq4EYKeWQRyUKmKhaliTdFgyHASKYQuwERnz8AKehV+3fqPzifq9VQxigCEUqgopBCL0kMKpmxOUevOHPv/Mv2r1Oa6AdvyyaojJHFtVk8SsPnPQkc/8opbmO0j8NJlfjMDi/iVs9PqY7fkefrFciuR+PCgZRBITEoynovlpsuAeUt75c/N3kBsXmz08OAxU6ExG1hwzhAlN4Q0RqHQ/DGMNJYrKgA0CsSGaxnJs5V9KugYTLy2KYI7TMo8wyKit620p4W6nzw9wvtE2cRWGOuUJzIzpckiBQ7TOaODZEg2MQ0i+boLmx2A+MSmDygrfv4ucMmOdApQK9kRnVxbysfXshOAVgBUmWmyxLoH6Ey5usavzhdg94NhE0RkiVkpzCzpvwmj2BU14ZB8EL+EZ8HQrC8D1y0ZF2ZqIVg6ZXFRs0R0yWZQcUvXAAaZUVf2+G+p6V6ZODgb4leUWyqDgPLKRTQ4eejQzLFI54EE9DZEs95cr4KDJaLHJ+DkuX3+Z+ZOFPcq5AZ1Ef72ykIuC06MupAB0t6mynOpWToGDh/T+eZ8UUHeEPHkheyB5dXIMPFhPeYmXsBk0fYGI6egKpbWIoceUFO34iDXF6DkjWydL/dXivRKiv7LxUaaLpQwG/mue2aQZWuq/vpyGsUM4XU1MxkouN13NG8koc6BCNyK78TxePoHBEWjHIcvol5N3KFL09/Q2m+UNZ7uYDSPoRUYY8QXjw0QplxA9n49TUfdLVmJ0pS88YhmFZfWEkJHLohLr3sDCRTa4Ay5bUv0qThg+Xb7dO1xcYmCYyQaZ0C1DT9WmNhL61fVNhMHRhoFspp+AFeWboG+a2v05nDQMA24zU7IuUrDKnEkjNY4Q4twKLJGRZSwJzDlLHD96GdnFmhkRpbGX1mqvapoaZcXZhayXqVW19VZF6H8gW4O4ifZUZNwYCiaEiNUg7ReIH/DlT4aP+VLF396Z4vA6QQYA9mgf2KjBaFHzY+r0TFC0LkDGTLMJFCiVAn6VgkfT6/1+tDqSvTQmfbxKmKwQt5WpU0yuXldasOXJMDsIBylfW1VQ61pX+7fufJyuJbLbSZZ50voZA60n+luKcZHOdoz+/vrLWvzNC0a8YD7ZcLV+MsmLX0YJaVEEo5uPyMOcPMqwFHPh4MmNHPL0ffbBqrKulV5OlU0SEOwquwB4ibvLwPMM/WwiFN0vmTj+0oKh1s5QiJAKC9rTCENNCpmzxDU9L1M1PL0zSndyB7Lx7r4BQvIhSZEK22x+QigTmfW4WOr3Nq4NoD452ZD/beqJLo1Pl6NQ9SlA3SKw73XSzru1SgVxcONSc3ndi0t7h0qIUyamHCxfjH4FvReAH5WqeqHyteaCjNroBVMMKn83Qx8koiDuYp8HfAEgKUESH9gV3XT0m0Fyr72wt6VJH5qdDNgyBRCWSqzNQm0UMsZEMaGqzbQIJUskF1QRReUVZMlaWvr+75KhKuiTlgNEleJhEuU5ZY8tFErJZPwGRanN7xWdpOZb55FtwDQEqil/MhxYBV0tvCMM8QWHdbiwbUexQnigY0EaQ0PLcDnQDwqkmdp7onB+Bz8kFmZ3EK1QTjCyGJ+Jgnp3xRuWOaUq35vBJDE5IpMd6kYnN02ZA6SXFyU3LhkfevPJ53aPfJJ2W3m6V6DUoxA+tW2KOO5mX5BnmJsfmw8WIwDEJgkXzpZoHixQaAxQ4h+TQRqqHd56dyx1+7//Ms3QVRpKKX7I46qf7UloPl29PLdp59suS+5ghQZAMULuAxU15X7f4fhayXlWKlrFhJb+tRU3tSV1Wv423w6UtuP6ot8uEVX5mHwGwwonP7Au4DxYCzdMAMGHa+QcFJzWkjzfES/EvR7ebHM0p3ZJTvqjlaeq+1sv9yoZEWz6wOxZ7fNkr1oZORfyzqba4wXZLo1dm6861D34N2az3w4bQ7mM4lsUQhvBmEByzRajumo6VKzbNLEKz3Zi3JXTWFXKYKIUXdf4SphsaocECd8d1z21IrNqUWFRs1Rwfbi0J0H54j6418AMH8qkaqV0uMioyOc8jMu0lwqR6qV8knKgqYISSBKqOYuQTBNivYIbRCJdp/bek4oD0njao4oLAO+L5yE2QJYWBRrxbfbt51/MltmRVb0kpP3H9W1qvGUWSKcNFFs6TOM0veNSTdyx5Yf0OWXlgUGJkSPpPAaTASjQxQoDPsJN1U4eVr7/5Xpq4hqpalBHyqvO/pkp5WIAWUNoVJFji/dLD58ymHtuVUfCH32KGhVikvNeNxrwZVjv5C/c3nvnHvF0G36B3buE4IYkM6YtExiAfB9YGrbL/7PWjdIwpZkKNfLDe1SfUqFhVgrT5l/huNT+w7vCO3clNqcclQSyFHUSOal0akoVU7bhx/ZeQP4DK8fiAH4m0zVDedX7S5NGSzNqTBCLAbEjZbrT999z8AWBFmBcB0uK9NCgurPHlkkzr7lw3bUssAWJvTSkqHWiPAohPNBsWh3tbiMFsWYqeZurpvv/erAHUZqx7S4vAlqDfsbDVhjTdjHdlgBNXQ6yHhVf7bvZ8ANYzIeYI7lNCVeiW7vBrUQWVhvzrrav1WHrAomVJBpHpaK/rakMmTGiIlK627+pbrA5iVDQBh8aBu1QT1hiGxRHwWPbLBiMIeqOGqG6rhz8x/TNfWR9RQJVTvQr5ematVFxhCeCHs4G2b1Fmv1nGChWg6Qqq8vz1PD31ivkGTp21i5AvpIKBaD5dg88jUAjnq5M0CYGVmgoVYWzDRTAhwdOEw0BbRKQiLg77ZZZhrN9nfSe2uiag5Q56tV1XdlTebVdlaeRAvKj+lVx0BfKpfk8kDVgEjU8CNGhiZanzeqcnRKkM+xKBMvh6qZZi5OiHwe3DD+kajG3CZ7LBodtES7KoInQNJqXdyni55JYMoOiq/Du4wV6d4fkpz9j6ss0rpTJ6yor+tyKARkizA0XtaAOFgUvJ5OlXTB8qWUUWuLuRtc3SN5wdeQDzLMu2NtlZYXZxsmQpvqyQ4ssOY7WFRcgcMxKidTmYpBl/M1TdG2WAFLPxpG4t6NBIjnYZ/8vYzxbdaYFYP2KxX63nUEFq9QlbxAhwcGoDFamS2kKzt765+42EPZFhenxn22JB8Myo4ZMIWZbiJiJynLREmQWWTF91QuN6eGc7RnpcYlFz9HShPoJTp1cfutKd/+Wzac2eK77YWmlSCBl4ZnqhRwUoapelI3GQ9muQbtUisJheCJR8umRLPjvLUa4mYmCdGNQkYMloTjxmv5OibpJHRSdAhGlRlfW1FvS35f2763NbiA8/XlL53Mfsqr83iK8RSsY6ysq8t29Dws5E/UY3gkQ0j1vC5J1y9iT/rgFPRRS22LnLVC3n8xPL07usnCiPCGhZfR+WcggGlrFO5aavswItnc18HPKsCgVUy1BwhTZxlHmD4QbANRFiibUIPaXrRa47KN4h0cW5gPoudtBcZTKDOGQtmtX4++kZy12mpUcWZeg8GdKrCflVBl+rzu0p3H30SxDqIwVfeuQw0SyA2hM2oeuWRvrbS3pad109MLbmoECcwYvdYuehV4npDxIAUTgERmXmHz7lI929fvv1SanctIgrcd069JOtXS7qVT6SV7cip3JZdvjOz8tg7zwi0JVEmX33EdKmot3n3myd007fQCIbN6THH3nKEU98H94XV+fcgtgkjis07yGU3ndv64p0fJd+okoRq8UouvJSyW+r079RsSTucVHg8Of940SBQQzW/GgKx0hQY1duvP6WdREj5pufJEWfYPAEmUhhK47Pi9JTaYm8PQ8YL4IWMF0zaWDv2Xj9d2tciodtmuCDoV2dfPb8762j64erNqcBmtXCWJxBvANDv153L6my0LE4gmXIseodZkxe0O8Oo43G2YsUvWZy5fYtg0hrNDw7bUUsI1McF73LjzX/f23EyU9uQT/UpR6wCk0r6q6Z9+Sd2ZJdvTimhqjvK0KsG2iHkGeQHtPVJHae/896vmOqkfQFO3YXNqOAZWVssMyqENa5eCQtrAtUi2MY2YicdCx5m7uvhov0r91/O6riQ3FmV1n02Q3suQ1sH1kFtXZaxLu1nNU/sP7wjtwJ4w/ybjRk6+Hfwarq27oC2JqW7Zk/HqTJ9yysjrwWCk2I+PyQrI8HCahifwhtFwveP8c9I23iG8liaSHWTwjAIHHuWYIwdGpV7uDJ9Y3LgquXaj0d+/6Ph3/9w+Pc/tb125Y/ff2xfEfCGn0ku/OXkn384Av8O1k9GX/u1rWPAfm/Zu8KqdgdccI7HE+yxiHmmSTgzE/0qEQ/zDAaGQnJHDV5aXR7Xsg8EjMOwK8j7cNa94nbDKizPfOHtW/cfTcrfnlvxT7sz+ccPA26ff2YRBDSwD97CagaxYHP0+G6QiEMycebkgEA9mGE3PQiNX/oDfrcH5nZ6bt56NFlCgXUQvbTqJlc9/hW3b2GNdC0B3H2A9AJDPkIPTkcutvNKJIfFKZ5ERPURq1eCSUvwW6sPg9TBtjCxLvoTWPf7A5xgAf390A5ie++Sm1xaIx/Oeajigje0ZuDvEUpyLQ44RmDhb5zEycxY+QMjgqNhG7NXgv/zzA6ffYkelXt5+H+bbr6guvWt1Leqkm+cSr1enUKtfW9Vpd+oLTGogUliQIsGCxhvq8vLEkw+CaXbBlzL0KVEl6MtGLl2UZNHxDHoKULenF5mRKBj3HTx7ZcOaOty9BdQxEuFewqJoQnEKBWmS7l6BfBxJw1f4gMLvOck1bzrWp27Nm4QF1Fg9ZeAfIU9S/yNFYTJBGGJsVsZIzAKzVO89qA75UZVJKXSw2p7hQkW5QtgK5JqX3c1qsf0RoLlB5q1FmS22689Wd5zMbWjOrWjJvVGDfidAteZ9I5z7W+/VNv77DztKwHJJNn98fjZJ+H2NoLdYGTh41PYiUCkyODBLq5Bceix393fdS4sD2VQFvW1VPa1SfuUhUMq8BtQzVxjY7FWzQXWunOZrpie7vlKjv48xWaReMKkfpGxGaYc9KpsfcNBXUPG9bNu2G4IE/BmZ5hMJd6Da2HUUIij46WrLaxxNGBl0QzYq+Y/pWvrI8ACAXBhn0rym6Y9VUcLu2CUA07Y+9YpTrD8VLfXKyOvp3adQdn3ArrAoSw2qmFlGxbuNQi7Qp0C/S+qRSsq55lwmYfA6ZWI1SgCyVqg+v/+MtGX2l1NByusOo1sSLWn6tiW5LLHMw7LdEqJSZnXrUQ265NfyNudd5QBC/1I9SrY5xXsaJYY5EVGTeVAe6FBQ0eaVH4ipeu0afodcP7sCml2kGENZQnvmQTMCyG8wQ+OLYtuOQRPdWqRRAY36fopKZpYNTCpFVVBr7rghnxLetm2jPLHM8qyOut/aPkdlKyBW1uyyvcVnfz4rjCwkt+qZgaEC02qop7mI6YrMqoZJBSTGxT7tef+29oBW47QdgYbsWcS28IQQr0SVPEijrjBAptEvAGqy/PP46ad14/nUXKB6g6o9CAzqQq0TY+nlz+RcfgTKTmLq6twdPPOO/+8T7otpzxCsrK6GqX6JmmvQnZLnfHj2srBS5KeULYnmHRVpnSfvTHZD86fXyWj5zY5dv7C31WAMnmEeC9hHC4SgOUip+ZJxH0GHfdLdOo9HaeTus7s7aoGK6kT/D6TrK/O+Evtpv2HNx8o/UyKBJx5//0PH92bz7ZZyKt+/f7VA/q6Q3dath85umV7WVLzCdmgml1/hbppVCS9dRLxMMbAC6QA0D1a8DKaQuV7nP3KMCo9IEAJ7QyyRrpn1ubBml1boBY4mIf9xWsrn07J31N4PEl2VPWlrz2WUcoGa26Zzlgce/vS1sojO/ZXbNpbkvWLBlmfislWS2F1unHH9VN/oYgYCAdGBXpKKaWx4lmYiEF+Is7paOEZ1tD+ID7gmNZ8fkEaub68uvpYesGm9JLHMkt25FZsz61kwPIE96s5UtW8Ka3kkd3Zu398IrXvbHJnzb7OarCSgKh2VBV0K3um7iL/Ob0ARy3Eu5Vj31KAiIN52sS2rmO5Ub+FmuCxuLzj8yQIg+Gao9a8b2LeNz7rRSmIldW1T++TbMkujwAL/eQ/Vf/Z1IK/37pfa7rpXF+cWHEwa3LJPuteZEJy6AftXs6hp+geXAte8Vho7Fds0FOc7kdWdJ1w+sdMHZujli0Y+s0vLgLB2R4FlvTE+Z3SYx95Is14c0ggc+H1+SfmyGHwYGbCtqmJU284w50YeiXwCmJc7dP0kBideGLSKcHsoM3lpksb3/zPz+2XscGSnWrYmlP+0a379Tdvo7+4ljxTC97p4ALHU/Pehy4SZh3YW+DFG4cIZDQJdhME3nR0wsF25J4Q5Ig9MLcCeZm2r/+TSZDBf+IL2RCp0427JMf+YVu6cZBGahrm2n1R4kmhz5eWiWVq0hbc+NHCFxuOie29SBtFsSbymGbb2c8GsG3XMgSrb3Do0aR8aLZyKoCRSip66qNb04y37iBXMDXvprvbORYpNMmKN/01JrarAGHD41MW/tp3iLlg7pcQVVszO3wILJSiAWBtza1ILTkBkOqhkVqfpGQq1t3+mESzDWf6S6y+H0MDrqjvEzdkPHMzDFgwkE4CYFVuzy3/2PZMRqbgtjMO0uqMMaaLZZM/0T22Em3Ajc7DiubVOC1CSLIGhgCDB5L1L2nF33jpp7T20TJFYpZLOLPkieyDy/hHQmyzD/HPsOFtj8aXj7ZQWYpZysC/qTV+KkkKwHpkV9aax035PirKC/UXkjg15IgyT0KbqbImwIlEBBhnlAXn6QE40GjG96/++rOpgDpUPLI7i96xbsYTSqgz25pgmMiN2QeXMbICk6yWmJBKsEgHmytpXvqUvG1zRjHFszKZggUzTxLrqKDoxce2qwB3kZVuMPIluNUKZl4NEKXJeTrL/sguwODL2aSUDRZyWMKhTAwu0uWPtXhBxOc+sLaXxqrXwsL1ClVh/d21Nz+VLN0JXSEHWCH0nYnmPHG2xeAs8xAcZzgTLfNYcRUZPF44z4zmOc9o2jdllGzP4wVLNCTAiRxsMe5nFWevAz67seCyG/CEoRrSla6csq3ZZTtyYwPLwmVccAcd/koz0vjsJsa8GtrmFVr3j+/IBH5wRyySxWZ5VrxEQCI9uEQMdEOsvh8qiMXQouizBfdZ/tj2gwCp2MCKvZaeSJmHiLXBCIu5YGcgg2BByfrHEFiAZ2GDtUENRjiEkcAJU8awm55iLdJFgwWQ2ppT/q8HZJhgJcg8N3KSdaN2VeIzeZFgUUillVZhgrUhzBPfdBC4wrIR+8RHS3EEWECsUopPJRed/NiuDHzqIBS3C8/zsuInnI3piIT4FA6U7I15uQbJIsBCmshn4GNqbbdhGFk2mn9FsCysp4fDbjifXpQaVkYULELhDqZasT8RmxVi7oNLxNk2I7qBSMSXzvBck5kGC/783eaUzx8sBWvzwdKPPJHGBgtz6wVL7F9bIp594owNLeFPT/RLoWLa75rv6VFFdrq0c6yhpaRGcahWVVyjOCFvpVM09K4fuF+gRfvuDdrkL+IeiZg2Y7HGIlOY+72Ourxe0sfZLOoh4bSngMnDz3bgf/0C20VyqKEF84tN+Kaj401jMZ7I7PQsu31w11HqBx0sr8F2SyrYpgM6WyIb+AvspMq3eTTnRtRsh4VPBRIPtlmFJZhZHrGHLdTcIbyBP2YVjr5B7O+qsGF1Kyfw9KKzRYJCDr97gC2eFq6F2WmG9TV4eDsGC5MhIiLnGWuvBMcWxgln7vHJlHC1fWNDSJrB4yw25NwnhI8dJLJEP4v5xFDxYiPeUGzhkVLkiYTPsVEDr2PBrUb+BmtshjbDf6tPJP8fObOJzUBEId0AAAAASUVORK5CYII="
\ No newline at end of file
+_assetOfName = {
+    "tent_1_url": "tent_1",
+    "tent_2_url": "tent_2",
+    "tent_3_url": "tent_3",
+    "tent_4_url": "tent_4",
+    "tent_5_url": "tent_5",
+    "grass_url": "grass",
+    "grass2_url": "grass2",
+    "grass3_url": "grass3",
+    "output_treeUrl1": "output_tree1",
+    "output_treeUrl2": "output_tree2",
+    "output_treeUrl3": "output_tree3",
+    "input_treeUrl": "input_tree",
+    "input_treeUrl2": "input_tree2",
+}
+
+
+def __getattr__(name):
+    if name in _assetOfName:
+        return AssetUrl(_assetOfName[name])
+    raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
@@ -0,0 +1,171 @@
+import argparse
+import numpy as np
+
+from PuzzleParser import ParsePuzzles
+from Solver import solve, const_cellType_notTested, const_cellType_tent, const_cellType_uncertain, const_cellType_grass, const_cellType_tree
+
+# Binary puzzle corpus, little-endian throughout:
+#     header        magic, format version, flags, puzzle count, offset of the index
+#     records       per puzzle: rowCount, columnCount (uint32 each), the tree mask packed 8 cells per byte,
+#                   topHints and leftHints (uint16 each); with a solution, the record is followed by the
+#                   solution cells packed 4 per byte as 2-bit codes
+#     index         uint64 offset of every record, then, when flags has corpusHasSolutions, the uint64
+#                   offset of every solution (0 for a puzzle without one), aligned to 8 bytes
+# Readers map the file with np.memmap, so puzzle k is read without touching the others and processes
+# opening the same corpus share its pages.
+
+corpusSuffix = ".tents"
+corpusHasSolutions = 1
+
+_magic = b"TENTCORP"
+_formatVersion = 1
+_headerType = np.dtype([("magic", "S8"), ("version", "<u4"), ("flags", "<u4"), ("puzzleCount", "<u8"), ("indexOffset", "<u8")])
+_recordType = np.dtype([("rowCount", "<u4"), ("columnCount", "<u4")])
+_hintType = np.dtype("<u2")
+_offsetType = np.dtype("<u8")
+
+# 2-bit solution codes: 0 grass, 1 tent, 2 tree, 3 not set
+_codeOfCellType = np.array([3, 1, 3, 0, 2], dtype=np.uint8) # indexed by const_cellType_*
+_cellTypeOfCode = np.array([const_cellType_grass, const_cellType_tent, const_cellType_tree, const_cellType_notTested], dtype=np.uint8)
+assert _codeOfCellType[const_cellType_uncertain] == 3
+
+
+def PackCells(cells):
+    # const_cellType_* cells -> bytes of 2-bit codes, the first cell in the two high bits
+    codes = _codeOfCellType[np.asarray(cells, dtype=np.uint8).ravel()]
+    codes = np.concatenate((codes, np.zeros(-len(codes) % 4, dtype=np.uint8))).reshape(-1, 4)
+    return (codes[:, 0] << 6) | (codes[:, 1] << 4) | (codes[:, 2] << 2) | codes[:, 3]
+
+def UnpackCells(packed, shape):
+    packed = np.asarray(packed, dtype=np.uint8)
+    codes = np.stack((packed >> 6, (packed >> 4) & 3, (packed >> 2) & 3, packed & 3), axis=1).ravel()
+    return _cellTypeOfCode[codes[:shape[0] * shape[1]]].reshape(shape)
+
+def _packedSizes(rowCount, columnCount):
+    cellCount = rowCount * columnCount
+    return ((cellCount + 7) // 8, (cellCount + 3) // 4)
+
+def WriteCorpus(fileName, puzzles, solutions=None):
+    # Write (treeMap, topHints, leftHints) puzzles, streamed from any iterable, to a corpus file.
+    # solutions, when given, yields a const_cellType_* cell array or None alongside every puzzle.
+    recordOffsets = []
+    solutionOffsets = []
+    solutions = None if solutions is None else iter(solutions)
+    with open(fileName, 'wb') as file:
+        file.write(bytes(_headerType.itemsize))
+        for (treeMap, topHints, leftHints) in puzzles:
+            (rowCount, columnCount) = treeMap.shape
+            recordOffsets.append(file.tell())
+            file.write(np.array((rowCount, columnCount), dtype=_recordType).tobytes())
+            file.write(np.packbits(np.asarray(treeMap).ravel() != 0).tobytes())
+            file.write(np.asarray(topHints, dtype=_hintType).tobytes())
+            file.write(np.asarray(leftHints, dtype=_hintType).tobytes())
+            if solutions is not None:
+                cells = next(solutions)
+                solutionOffsets.append(0 if cells is None else file.tell())
+                if cells is not None:
+                    if cells.shape != treeMap.shape:
+                        raise ValueError("solution " + str(len(recordOffsets) - 1) + " does not match its puzzle")
+                    file.write(PackCells(cells).tobytes())
+
+        file.write(bytes(-file.tell() % _offsetType.itemsize))
+        indexOffset = file.tell()
+        file.write(np.array(recordOffsets, dtype=_offsetType).tobytes())
+        if solutions is not None:
+            file.write(np.array(solutionOffsets, dtype=_offsetType).tobytes())
+
+        header = np.array((_magic, _formatVersion, 0 if solutions is None else corpusHasSolutions, len(recordOffsets), indexOffset), dtype=_headerType)
+        file.seek(0)
+        file.write(header.tobytes())
+    return len(recordOffsets)
+
+class PuzzleCorpus:
+    # Random access to the puzzles of a corpus file through a read-only memory map
+    def __init__(self, fileName):
+        self._fileName = fileName
+        self._data = np.memmap(fileName, dtype=np.uint8, mode='r')
+        header = self._data[:_headerType.itemsize].view(_headerType)[0]
+        if header["magic"] != _magic or header["version"] != _formatVersion:
+            raise ValueError(fileName + " is not a version " + str(_formatVersion) + " puzzle corpus")
+        self._count = int(header["puzzleCount"])
+        self._hasSolutions = bool(header["flags"] & corpusHasSolutions)
+        indexOffset = int(header["indexOffset"])
+        indexSize = self._count * _offsetType.itemsize
+        self._recordOffsets = self._data[indexOffset:indexOffset + indexSize].view(_offsetType)
+        self._solutionOffsets = self._data[indexOffset + indexSize:indexOffset + 2 * indexSize].view(_offsetType) if self._hasSolutions else None
+
+    @property
+    def fileName(self):
+        return self._fileName
+
+    @property
+    def hasSolutions(self):
+        return self._hasSolutions
+
+    def __len__(self):
+        return self._count
+
+    def _checkIndex(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("puzzle index out of range")
+        return index
+
+    def shape(self, index):
+        offset = int(self._recordOffsets[self._checkIndex(index)])
+        record = self._data[offset:offset + _recordType.itemsize].view(_recordType)[0]
+        return (int(record["rowCount"]), int(record["columnCount"]))
+
+    def __getitem__(self, index):
+        # (treeMap, topHints, leftHints) as ReadPuzzleFile returns them
+        index = self._checkIndex(index)
+        (rowCount, columnCount) = self.shape(index)
+        offset = int(self._recordOffsets[index]) + _recordType.itemsize
+        (treeSize, _) = _packedSizes(rowCount, columnCount)
+        treeMap = np.unpackbits(self._data[offset:offset + treeSize], count=rowCount * columnCount).reshape(rowCount, columnCount)
+        offset += treeSize
+        topHints = self._data[offset:offset + columnCount * _hintType.itemsize].view(_hintType).astype(np.int64)
+        offset += columnCount * _hintType.itemsize
+        leftHints = self._data[offset:offset + rowCount * _hintType.itemsize].view(_hintType).astype(np.int64)
+        return (treeMap, topHints, leftHints)
+
+    def __iter__(self):
+        return (self[index] for index in range(self._count))
+
+    def solution(self, index):
+        # the stored const_cellType_* cells of puzzle index, or None
+        index = self._checkIndex(index)
+        if not self._hasSolutions or self._solutionOffsets[index] == 0:
+            return None
+        shape = self.shape(index)
+        offset = int(self._solutionOffsets[index])
+        return UnpackCells(self._data[offset:offset + _packedSizes(*shape)[1]], shape)
+
+def SolvedCells(puzzles):
+    # the final map of solve() for every puzzle when it is solved, else None
+    for (treeMap, topHints, leftHints) in puzzles:
+        results = solve(treeMap, topHints, leftHints)
+        last = results[-1]
+        isSolved = not isinstance(last, str) and last.isSolved
+        yield np.array(last.map.cells) if isSolved else None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pack text puzzle files into a binary puzzle corpus.")
+    parser.add_argument("output", help="corpus file to write, conventionally ending in " + corpusSuffix)
+    parser.add_argument("inputs", nargs="+", help="text puzzle files, each holding one or more puzzles")
+    parser.add_argument("--solutions", action="store_true", help="solve every puzzle and store the solved maps")
+    args = parser.parse_args(argv)
+
+    def puzzles():
+        for fileName in args.inputs:
+            with open(fileName, 'rb') as file:
+                yield from ParsePuzzles(file)
+
+    solutions = SolvedCells(puzzles()) if args.solutions else None
+    count = WriteCorpus(args.output, puzzles(), solutions)
+    print(count, "puzzles written to", args.output)
+
+
+if __name__ == '__main__':
+    main()
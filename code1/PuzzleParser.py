@@ -0,0 +1,80 @@
+import io
+import numpy as np
+
+# A puzzle is laid out as
+#     rowCount columnCount
+#     <row of '.' and 'T'> <left hint>      (rowCount lines)
+#     <top hint> ... <top hint>             (columnCount numbers)
+# and a file may hold several puzzles one after another.
+
+_emptyCell = ord('.')
+
+def _openBytes(source):
+    # bytes, str, or a file object opened in text or binary mode -> an iterator over byte lines
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return iter(io.BytesIO(source))
+    return (line.encode("utf-8") if isinstance(line, str) else line for line in source)
+
+def _nextTokens(lines):
+    # the tokens of the next non-empty line, or None at the end of the input
+    for line in lines:
+        tokens = line.split()
+        if tokens:
+            return tokens
+    return None
+
+def _readPuzzle(lines):
+    header = _nextTokens(lines)
+    if header is None:
+        return None
+    if len(header) != 2:
+        raise ValueError("expected 'rowCount columnCount', got " + repr(b" ".join(header)))
+    (rowCount, columnCount) = (int(header[0]), int(header[1]))
+
+    rowTokens = []
+    hintTokens = []
+    for i in range(rowCount):
+        tokens = _nextTokens(lines)
+        if (tokens is None) or (len(tokens) != 2) or (len(tokens[0]) != columnCount):
+            raise ValueError("row " + str(i) + " should be " + str(columnCount) + " cells and a hint")
+        rowTokens.append(tokens[0])
+        hintTokens.append(tokens[1])
+
+    topTokens = []
+    while len(topTokens) < columnCount:
+        tokens = _nextTokens(lines)
+        if tokens is None:
+            raise ValueError("expected " + str(columnCount) + " top hints")
+        topTokens.extend(tokens)
+    if len(topTokens) != columnCount:
+        raise ValueError("expected " + str(columnCount) + " top hints, got " + str(len(topTokens)))
+
+    # any cell other than '.' is a tree, as in the original parsers
+    cells = np.frombuffer(b"".join(rowTokens), dtype=np.uint8).reshape(rowCount, columnCount)
+    treeMap = (cells != _emptyCell).view(np.uint8)
+    leftHints = np.array(hintTokens, dtype=np.int64)
+    topHints = np.fromstring(b" ".join(topTokens), dtype=np.int64, sep=" ")
+    return (treeMap, topHints, leftHints)
+
+def ParsePuzzles(source):
+    # Yield (treeMap, topHints, leftHints) for every puzzle in source, reading it one line at a time,
+    # so a corpus of any size parses in constant memory
+    lines = _openBytes(source)
+    while True:
+        puzzle = _readPuzzle(lines)
+        if puzzle is None:
+            return
+        yield puzzle
+
+def ParsePuzzle(source):
+    # The first puzzle in source as (treeMap, topHints, leftHints); treeMap is a uint8 mask with 1 for trees
+    puzzle = _readPuzzle(_openBytes(source))
+    if puzzle is None:
+        raise ValueError("no puzzle in input")
+    return puzzle
+
+def ReadPuzzleFile(fileName):
+    with open(fileName, 'rb') as file:
+        return ParsePuzzle(file)
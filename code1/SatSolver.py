@@ -0,0 +1,377 @@
+import heapq
+import threading
+import time
+import numpy as np
+
+try: # a compiled solver is used when python-sat is installed, the bundled one otherwise
+    from pysat.solvers import Solver as _LibrarySolver
+except ImportError:
+    _LibrarySolver = None
+
+
+class CdclSolver:
+    # Conflict driven clause learning over DIMACS style clauses (lists of non-zero ints, -v for "not v").
+    # Two watched literals, first UIP learning, VSIDS activities with phase saving, Luby restarts and
+    # removal of the least useful learnt clauses at restarts.
+    # Internally literal v is 2 * v and -v is 2 * v + 1, so a literal and its negation differ by the last bit.
+    def __init__(self, variableCount):
+        self._variableCount = variableCount
+        self._values = [0] * (2 * variableCount + 2) # 1 true, -1 false, 0 unassigned, by literal
+        self._levels = [0] * (variableCount + 1)
+        self._reasons = [None] * (variableCount + 1)
+        self._watches = [[] for _ in range(2 * variableCount + 2)] # clauses watching a literal, visited when it becomes false
+        self._clauses = []
+        self._learnts = [] # (clause, literal block distance)
+        self._trail = []
+        self._trailLimits = [] # trail length at every decision level
+        self._propagated = 0 # trail entries already propagated
+        self._activities = [0.0] * (variableCount + 1)
+        self._increment = 1.0
+        self._phases = [False] * (variableCount + 1) # last value of every variable, False first as most cells are grass
+        self._heap = [(0.0, variable) for variable in range(1, variableCount + 1)] # (-activity, variable), with stale entries
+        self._isInHeap = [True] * (variableCount + 1) # whether the heap has an entry with the current activity
+        self._isUnsatisfiable = False
+        self._model = None
+        self.conflictCount = 0
+
+    def addClause(self, literals): # may also follow a solve(), to ask for another model
+        if self._isUnsatisfiable:
+            return
+        self._backtrack(0)
+        clause = []
+        for literal in literals:
+            index = 2 * literal if literal > 0 else -2 * literal + 1
+            value = self._values[index]
+            if value == 1 or index ^ 1 in clause: # satisfied or a tautology
+                return
+            if value == 0 and index not in clause:
+                clause.append(index)
+        if not clause:
+            self._isUnsatisfiable = True
+        elif len(clause) == 1:
+            self._assign(clause[0], None)
+            self._isUnsatisfiable = self._propagate() is not None
+        else:
+            self._clauses.append(clause)
+            self._watches[clause[0]].append(clause)
+            self._watches[clause[1]].append(clause)
+
+    def solve(self, timeLimit=None, conflictLimit=None):
+        # True with model() set if satisfiable, False if not, None when a limit stops the search
+        if self._isUnsatisfiable:
+            return False
+        deadline = None if timeLimit is None else time.perf_counter() + timeLimit
+        restartCount = 0
+        maxLearntCount = max(1000, len(self._clauses) // 3)
+        while True:
+            restartCount += 1
+            result = self._search(100 * Luby(restartCount), deadline, conflictLimit)
+            if result:
+                self._model = [None] + [self._values[2 * variable] == 1 for variable in range(1, self._variableCount + 1)]
+                self._backtrack(0)
+            if result is not None:
+                return result
+            if (deadline is not None and time.perf_counter() > deadline) or (conflictLimit is not None and self.conflictCount >= conflictLimit):
+                return None
+            if len(self._learnts) > maxLearntCount:
+                self._reduceLearnts()
+                maxLearntCount += maxLearntCount // 10
+
+    def model(self): # [None, value of variable 1, value of variable 2, ...] of the last satisfiable solve()
+        return self._model
+
+    def _search(self, conflictBudget, deadline, conflictLimit):
+        conflictCount = 0
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                conflictCount += 1
+                self.conflictCount += 1
+                if not self._trailLimits:
+                    self._isUnsatisfiable = True
+                    return False
+                (learnt, level, blockDistance) = self._analyze(conflict)
+                self._backtrack(level)
+                if len(learnt) == 1:
+                    self._assign(learnt[0], None)
+                else:
+                    self._learnts.append((learnt, blockDistance))
+                    self._watches[learnt[0]].append(learnt)
+                    self._watches[learnt[1]].append(learnt)
+                    self._assign(learnt[0], learnt)
+                self._increment /= 0.95
+                if self._increment > 1e100:
+                    self._rescaleActivities()
+                if conflictCount % 64 == 0 and deadline is not None and time.perf_counter() > deadline:
+                    self._backtrack(0)
+                    return None
+                continue
+            if conflictCount >= conflictBudget or (conflictLimit is not None and self.conflictCount >= conflictLimit):
+                self._backtrack(0) # restart
+                return None
+            variable = self._pickBranchVariable()
+            if variable is None:
+                return True
+            self._trailLimits.append(len(self._trail))
+            self._assign(2 * variable + (not self._phases[variable]), None)
+
+    def _assign(self, literal, reason):
+        self._values[literal] = 1
+        self._values[literal ^ 1] = -1
+        variable = literal >> 1
+        self._levels[variable] = len(self._trailLimits)
+        self._reasons[variable] = reason
+        self._trail.append(literal)
+
+    def _propagate(self): # the conflicting clause, or None
+        values = self._values
+        watches = self._watches
+        trail = self._trail
+        while self._propagated < len(trail):
+            falseLiteral = trail[self._propagated] ^ 1
+            self._propagated += 1
+            watchers = watches[falseLiteral]
+            watches[falseLiteral] = kept = []
+            for (position, clause) in enumerate(watchers):
+                if clause[0] == falseLiteral: # keep the false watched literal at position 1
+                    clause[0] = clause[1]
+                    clause[1] = falseLiteral
+                first = clause[0]
+                if values[first] == 1:
+                    kept.append(clause)
+                    continue
+                for other in range(2, len(clause)):
+                    literal = clause[other]
+                    if values[literal] != -1:
+                        clause[1] = literal
+                        clause[other] = falseLiteral
+                        watches[literal].append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if values[first] == -1:
+                        kept.extend(watchers[position + 1:])
+                        self._propagated = len(trail)
+                        return clause
+                    self._assign(first, clause)
+        return None
+
+    def _analyze(self, conflict): # (learnt clause, level to go back to, literal block distance)
+        levels = self._levels
+        reasons = self._reasons
+        trail = self._trail
+        level = len(self._trailLimits)
+        seen = set()
+        learnt = [None]
+        pathCount = 0
+        literal = None
+        clause = conflict
+        index = len(trail) - 1
+        while True:
+            for other in (clause if literal is None else clause[1:]):
+                variable = other >> 1
+                if variable not in seen and levels[variable] > 0:
+                    seen.add(variable)
+                    self._bump(variable)
+                    if levels[variable] == level:
+                        pathCount += 1
+                    else:
+                        learnt.append(other)
+            while (trail[index] >> 1) not in seen:
+                index -= 1
+            literal = trail[index]
+            index -= 1
+            clause = reasons[literal >> 1]
+            pathCount -= 1
+            if pathCount == 0:
+                break
+        learnt[0] = literal ^ 1
+        backtrackLevel = 0
+        if len(learnt) > 1:
+            deepest = max(range(1, len(learnt)), key=lambda position: levels[learnt[position] >> 1])
+            (learnt[1], learnt[deepest]) = (learnt[deepest], learnt[1])
+            backtrackLevel = levels[learnt[1] >> 1]
+        blockDistance = len({levels[other >> 1] for other in learnt})
+        return (learnt, backtrackLevel, blockDistance)
+
+    def _backtrack(self, level):
+        if len(self._trailLimits) <= level:
+            return
+        values = self._values
+        limit = self._trailLimits[level]
+        for literal in self._trail[limit:]:
+            values[literal] = values[literal ^ 1] = 0
+            variable = literal >> 1
+            self._phases[variable] = not (literal & 1)
+            if not self._isInHeap[variable]:
+                self._isInHeap[variable] = True
+                heapq.heappush(self._heap, (-self._activities[variable], variable))
+        del self._trail[limit:]
+        del self._trailLimits[level:]
+        self._propagated = limit
+
+    def _pickBranchVariable(self):
+        heap = self._heap
+        values = self._values
+        activities = self._activities
+        while heap:
+            (activity, variable) = heapq.heappop(heap)
+            if -activity != activities[variable]: # a newer entry follows
+                continue
+            self._isInHeap[variable] = False
+            if values[2 * variable] == 0:
+                return variable
+        return None
+
+    def _bump(self, variable):
+        self._activities[variable] += self._increment
+        if self._values[2 * variable] == 0 or self._isInHeap[variable]:
+            self._isInHeap[variable] = True
+            heapq.heappush(self._heap, (-self._activities[variable], variable))
+
+    def _rescaleActivities(self):
+        self._activities = [activity * 1e-100 for activity in self._activities]
+        self._increment *= 1e-100
+        self._rebuildHeap()
+
+    def _rebuildHeap(self):
+        self._heap = [(-self._activities[variable], variable) for variable in range(1, self._variableCount + 1) if self._values[2 * variable] == 0]
+        heapq.heapify(self._heap)
+        self._isInHeap = [self._values[2 * variable] == 0 for variable in range(self._variableCount + 1)]
+
+    def _reduceLearnts(self): # at level 0: keep the better half of the learnt clauses, ranked by literal block distance
+        self._learnts.sort(key=lambda learnt: (learnt[1], len(learnt[0])))
+        keepCount = len(self._learnts) // 2
+        self._learnts = self._learnts[:keepCount] + [learnt for learnt in self._learnts[keepCount:] if learnt[1] <= 2]
+        self._watches = [[] for _ in self._watches]
+        for clause in self._clauses + [clause for (clause, blockDistance) in self._learnts]:
+            self._watches[clause[0]].append(clause)
+            self._watches[clause[1]].append(clause)
+        if len(self._heap) > 4 * self._variableCount:
+            self._rebuildHeap()
+
+def Luby(index): # 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ... for index 1, 2, 3, ...
+    while True:
+        power = 1
+        while (1 << power) - 1 < index:
+            power += 1
+        if (1 << power) - 1 == index:
+            return 1 << (power - 1)
+        index -= (1 << (power - 1)) - 1
+
+def AddExactly(clauses, literals, count, newVariable):
+    # exactly count of literals are true, with a sequential counter; newVariable() returns a fresh variable
+    if count > len(literals) or count < 0:
+        clauses.append([]) # cannot be satisfied
+        return
+    if count == 0 or count == len(literals):
+        clauses.extend([literal if count else -literal] for literal in literals)
+        return
+    # atLeast[j] is the variable that is true if at least j of the literals so far are true, for j from 1 to
+    # count + 1, or None while fewer than j literals have been seen
+    atLeast = [None] * (count + 2)
+    for literal in literals:
+        nextAtLeast = [None] * (count + 2)
+        for j in range(1, count + 2):
+            before = atLeast[j]
+            oneLess = atLeast[j - 1] # None for j == 1, where it always holds
+            if before is None and oneLess is None and j > 1:
+                continue
+            counter = nextAtLeast[j] = newVariable()
+            # counter <-> before or (oneLess and literal)
+            keep = [] if before is None else [before]
+            if before is not None:
+                clauses.append([-before, counter])
+            clauses.append([-literal, counter] if j == 1 else [-oneLess, -literal, counter])
+            clauses.append([-counter, literal] + keep)
+            if j > 1:
+                clauses.append([-counter, oneLess] + keep)
+        atLeast = nextAtLeast
+    clauses.append([atLeast[count]])
+    clauses.append([-atLeast[count + 1]])
+
+def EncodeTents(treeMask, topHints, leftHints, tentMask=None, grassMask=None):
+    # CNF of the puzzle: (clauses, variableCount, tentVariables) with tentVariables[row, column] the variable
+    # that is true for a tent, 0 for cells next to no tree, which are always grass. Cells already known to be
+    # tents or grass can be given as masks.
+    (rowCount, columnCount) = treeMask.shape
+    candidateMask = np.zeros_like(treeMask)
+    candidateMask[1:] |= treeMask[:-1]
+    candidateMask[:-1] |= treeMask[1:]
+    candidateMask[:, 1:] |= treeMask[:, :-1]
+    candidateMask[:, :-1] |= treeMask[:, 1:]
+    candidateMask &= ~treeMask
+    variableCount = 0
+    def newVariable():
+        nonlocal variableCount
+        variableCount += 1
+        return variableCount
+    tentVariables = np.zeros(treeMask.shape, dtype=np.int64)
+    for (row, column) in np.argwhere(candidateMask).tolist():
+        tentVariables[row, column] = newVariable()
+    clauses = []
+    # every tree is paired with exactly one neighbouring tent, and every tent with exactly one neighbouring tree
+    pairVariablesOfCells = {}
+    for (row, column) in np.argwhere(treeMask).tolist():
+        pairVariables = []
+        for (cellRow, cellColumn) in ((row - 1, column), (row + 1, column), (row, column - 1), (row, column + 1)):
+            if 0 <= cellRow < rowCount and 0 <= cellColumn < columnCount and candidateMask[cellRow, cellColumn]:
+                pairVariable = newVariable()
+                pairVariables.append(pairVariable)
+                pairVariablesOfCells.setdefault((cellRow, cellColumn), []).append(pairVariable)
+                clauses.append([-pairVariable, int(tentVariables[cellRow, cellColumn])])
+        clauses.append(pairVariables)
+        AddAtMostOne(clauses, pairVariables)
+    for ((row, column), pairVariables) in pairVariablesOfCells.items():
+        clauses.append([-int(tentVariables[row, column])] + pairVariables)
+        AddAtMostOne(clauses, pairVariables)
+    # no two tents touch, diagonally included
+    for (row, column) in np.argwhere(candidateMask).tolist():
+        for (rowOffset, columnOffset) in ((0, 1), (1, -1), (1, 0), (1, 1)):
+            (otherRow, otherColumn) = (row + rowOffset, column + columnOffset)
+            if 0 <= otherRow < rowCount and 0 <= otherColumn < columnCount and candidateMask[otherRow, otherColumn]:
+                clauses.append([-int(tentVariables[row, column]), -int(tentVariables[otherRow, otherColumn])])
+    if tentMask is not None:
+        clauses.extend([int(variable)] for variable in tentVariables[tentMask & candidateMask])
+    if grassMask is not None:
+        clauses.extend([-int(variable)] for variable in tentVariables[grassMask & candidateMask])
+    # the hints
+    for row in range(rowCount):
+        AddExactly(clauses, [int(variable) for variable in tentVariables[row] if variable], int(leftHints[row]), newVariable)
+    for column in range(columnCount):
+        AddExactly(clauses, [int(variable) for variable in tentVariables[:, column] if variable], int(topHints[column]), newVariable)
+    return (clauses, variableCount, tentVariables)
+
+def AddAtMostOne(clauses, literals):
+    for i in range(len(literals)):
+        for j in range(i + 1, len(literals)):
+            clauses.append([-literals[i], -literals[j]])
+
+def SolveTents(treeMask, topHints, leftHints, tentMask=None, grassMask=None, timeLimit=None, useLibrary=True):
+    # ("solved", tentMask), ("unsolvable", None) or ("timeout", None)
+    (clauses, variableCount, tentVariables) = EncodeTents(np.asarray(treeMask, dtype=bool), topHints, leftHints, tentMask, grassMask)
+    if not all(clauses):
+        return ("unsolvable", None)
+    if useLibrary and _LibrarySolver is not None:
+        with _LibrarySolver(bootstrap_with=clauses) as librarySolver:
+            # the library can only be stopped from another thread
+            timer = None if timeLimit is None else threading.Timer(timeLimit, librarySolver.interrupt)
+            if timer is not None:
+                timer.start()
+            isSolved = librarySolver.solve_limited(expect_interrupt=timer is not None)
+            if timer is not None:
+                timer.cancel()
+            model = librarySolver.get_model() if isSolved else None
+        values = None if model is None else [False] + [literal > 0 for literal in model]
+    else:
+        solver = CdclSolver(variableCount)
+        for clause in clauses:
+            solver.addClause(clause)
+        isSolved = solver.solve(timeLimit)
+        values = solver.model() if isSolved else None
+    if isSolved is None:
+        return ("timeout", None)
+    if not isSolved:
+        return ("unsolvable", None)
+    values = np.array(values + [False] * (variableCount + 1 - len(values)), dtype=bool)
+    return ("solved", values[tentVariables] & (tentVariables > 0))
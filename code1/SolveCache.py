@@ -0,0 +1,257 @@
+import collections
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+import numpy as np
+
+from Solver import MapHistory, MapSnapshot, TentMap, solve
+
+
+def PuzzleKey(treeMap, topHints, leftHints): # content hash of a puzzle, the same for equal puzzles from any source
+    digest = hashlib.sha256()
+    digest.update(np.asarray(treeMap.shape, dtype=np.int64).tobytes())
+    digest.update((np.asarray(treeMap) != 0).tobytes())
+    digest.update(np.asarray(topHints, dtype=np.int64).tobytes())
+    digest.update(np.asarray(leftHints, dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+class SolveCache:
+    # Least recently used cache of solve() results by PuzzleKey, holding at most maxEntries puzzles.
+    # It is shared by the sessions of a Streamlit server, which run in threads, so it is locked.
+    def __init__(self, maxEntries=32):
+        self._maxEntries = maxEntries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            results = self._entries.get(key)
+            if results is not None:
+                self._entries.move_to_end(key)
+            return results
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def put(self, key, results):
+        with self._lock:
+            self._entries[key] = results
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxEntries:
+                self._entries.popitem(last=False)
+
+    def getOrSolve(self, key, solver): # the cached results of key, or solver() stored under key
+        results = self.get(key)
+        if results is None:
+            results = solver()
+            self.put(key, results)
+        return results
+
+sharedSolveCache = SolveCache() # one per process; the module outlives the reruns of the app script
+
+# The 8 rotations and reflections of a board, as (isTransposed, isRowFlipped, isColumnFlipped) applied in that order
+_transforms = [(isTransposed, isRowFlipped, isColumnFlipped)
+               for isTransposed in (False, True) for isRowFlipped in (False, True) for isColumnFlipped in (False, True)]
+
+def TransformPuzzle(treeMap, topHints, leftHints, transform):
+    (isTransposed, isRowFlipped, isColumnFlipped) = _transforms[transform]
+    (treeMap, topHints, leftHints) = (np.asarray(treeMap), np.asarray(topHints), np.asarray(leftHints))
+    if isTransposed:
+        (treeMap, topHints, leftHints) = (treeMap.T, leftHints, topHints)
+    if isRowFlipped:
+        (treeMap, leftHints) = (treeMap[::-1], leftHints[::-1])
+    if isColumnFlipped:
+        (treeMap, topHints) = (treeMap[:, ::-1], topHints[::-1])
+    return (treeMap, topHints, leftHints)
+
+def TransformCells(cells, transform): # TransformPuzzle of the maps in the last two axes of cells
+    (isTransposed, isRowFlipped, isColumnFlipped) = _transforms[transform]
+    if isTransposed:
+        cells = cells.swapaxes(-1, -2)
+    if isRowFlipped:
+        cells = cells[..., ::-1, :]
+    if isColumnFlipped:
+        cells = cells[..., ::-1]
+    return cells
+
+def RestoreCells(cells, transform): # the inverse of TransformCells; the flips undo themselves and commute
+    (isTransposed, isRowFlipped, isColumnFlipped) = _transforms[transform]
+    if isRowFlipped:
+        cells = cells[..., ::-1, :]
+    if isColumnFlipped:
+        cells = cells[..., ::-1]
+    if isTransposed:
+        cells = cells.swapaxes(-1, -2)
+    return cells
+
+def _puzzleBytes(treeMap, topHints, leftHints):
+    return (np.asarray(treeMap.shape, dtype=np.int64).tobytes() + np.packbits(treeMap != 0).tobytes()
+            + np.asarray(topHints, dtype=np.int64).tobytes() + np.asarray(leftHints, dtype=np.int64).tobytes())
+
+def CanonicalPuzzle(treeMap, topHints, leftHints):
+    # (bytes, transform): the smallest encoding of the puzzle over its 8 rotations and reflections, and the
+    # transform giving it, so every orientation of a board has the same bytes
+    encodings = [(_puzzleBytes(*TransformPuzzle(treeMap, topHints, leftHints, transform)), transform) for transform in range(len(_transforms))]
+    return min(encodings)
+
+@functools.lru_cache(maxsize=None)
+def SolverVersion():
+    # hash of the solver sources; results stored by another version of them are not used
+    digest = hashlib.sha256()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for fileName in ("Solver.py", "SatSolver.py", "BitboardSolver.py"):
+        with open(os.path.join(directory, fileName), 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()[:16]
+
+def _isOrientationFree(results):
+    # error messages name rows and columns of the board they were found on, so those results are not shared
+    return all(not isinstance(result, str) and not result.message.startswith("<br>error") for result in results)
+
+# the last step of a search or SAT run cut short by nodeLimit or timeLimit; such results are not final, as a
+# rerun with more time can finish them, so they are not stored and the limits are left out of the key
+_limitMessages = ("backtracking search stopped after ", "the SAT engine stopped at its time limit")
+_limitOptions = ("nodeLimit", "timeLimit")
+
+def IsFinal(results): # solved, proven unsolvable, or stuck with the rules alone; False for a search or SAT run cut short
+    return not (results and results[-1].message.startswith(_limitMessages))
+
+def _optionsKey(options): # the solve() arguments that change a final result, as a string
+    return json.dumps({name: value for (name, value) in options.items() if name not in _limitOptions}, sort_keys=True)
+
+def _encodeResults(results, transform):
+    # (steps JSON, compressed maps) of results turned by transform; every map is stored as its XOR with the
+    # previous map, which is mostly zeros and compresses well
+    steps = []
+    maps = []
+    for result in results:
+        if result.history is not None:
+            cells = result.history.cells(result.historyIndex)
+        else:
+            cells = None if result.map is None else result.map.cells
+        steps.append([result.message, bool(result.isValid), bool(result.isSolved), -1 if cells is None else len(maps)])
+        if cells is not None:
+            maps.append(cells)
+    frames = TransformCells(np.stack(maps), transform)
+    deltas = frames.copy()
+    deltas[1:] ^= frames[:-1]
+    return (json.dumps(steps), zlib.compress(deltas.tobytes(), 1), frames.shape)
+
+def _decodeResults(steps, data, shape, transform):
+    frames = np.bitwise_xor.accumulate(np.frombuffer(zlib.decompress(data), dtype=np.uint8).reshape(shape), axis=0)
+    frames = np.ascontiguousarray(RestoreCells(frames, transform))
+    history = MapHistory()
+    results = []
+    for (message, isValid, isSolved, mapIndex) in json.loads(steps):
+        tentMap = None if mapIndex < 0 else TentMap(0, 0, frames[mapIndex])
+        results.append(MapSnapshot(None, tentMap, isValid, isSolved, message, history))
+    return results
+
+class PersistentSolveCache:
+    # solve() results kept in an SQLite file, shared by processes and runs. A puzzle is stored in the orientation
+    # of its CanonicalPuzzle, so all 8 rotations and reflections of a board share one entry, and its results are
+    # turned back to the orientation asked for. Entries of another SolverVersion() are never returned; the least
+    # recently used entries are deleted while the stored results exceed maxBytes. Decoded results are also kept
+    # in a SolveCache of memoryEntries puzzles by their PuzzleKey, so a repeated puzzle is answered without
+    # canonicalizing it or reading the file. Results cut short by a node or time limit are not stored.
+    def __init__(self, fileName, maxBytes=256 * 1024 * 1024, version=None, memoryEntries=32):
+        self._maxBytes = maxBytes
+        self._version = SolverVersion() if version is None else version
+        self._memory = SolveCache(memoryEntries)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(fileName, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, version TEXT NOT NULL, "
+                                     "mapCount INTEGER NOT NULL, rowCount INTEGER NOT NULL, columnCount INTEGER NOT NULL, "
+                                     "steps TEXT NOT NULL, maps BLOB NOT NULL, size INTEGER NOT NULL, lastUsed REAL NOT NULL)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS solutionsByLastUsed ON solutions (lastUsed)")
+
+    @property
+    def version(self):
+        return self._version
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM solutions WHERE version = ?", (self._version, )).fetchone()[0]
+
+    def storedBytes(self):
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM solutions").fetchone()[0]
+
+    def key(self, treeMap, topHints, leftHints, **options):
+        # (entry key, transform from the puzzle to its stored orientation); options are the solve() arguments,
+        # of which nodeLimit and timeLimit are left out as only final results are stored
+        (canonical, transform) = CanonicalPuzzle(treeMap, topHints, leftHints)
+        digest = hashlib.sha256(canonical)
+        digest.update(_optionsKey(options).encode("utf-8"))
+        return (digest.hexdigest(), transform)
+
+    def get(self, treeMap, topHints, leftHints, **options): # the cached results of the puzzle in its own orientation, or None
+        memoryKey = (PuzzleKey(treeMap, topHints, leftHints), _optionsKey(options))
+        results = self._memory.get(memoryKey)
+        if results is not None:
+            return results
+        (key, transform) = self.key(treeMap, topHints, leftHints, **options)
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT mapCount, rowCount, columnCount, steps, maps FROM solutions WHERE key = ? AND version = ?",
+                                           (key, self._version)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE solutions SET lastUsed = ? WHERE key = ?", (time.time(), key))
+        (mapCount, rowCount, columnCount, steps, data) = row
+        results = _decodeResults(steps, data, (mapCount, rowCount, columnCount), transform)
+        self._memory.put(memoryKey, results)
+        return results
+
+    def put(self, treeMap, topHints, leftHints, results, **options):
+        if not _isOrientationFree(results) or not IsFinal(results):
+            return
+        (key, transform) = self.key(treeMap, topHints, leftHints, **options)
+        (steps, data, shape) = _encodeResults(results, transform)
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                     (key, self._version) + tuple(shape) + (steps, data, len(steps) + len(data), time.time()))
+            self._evict()
+        self._memory.put((PuzzleKey(treeMap, topHints, leftHints), _optionsKey(options)), results)
+
+    def _evict(self): # delete the least recently used entries until the rest fit in maxBytes
+        storedBytes = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM solutions").fetchone()[0]
+        if storedBytes <= self._maxBytes:
+            return
+        evicted = []
+        for (key, size) in self._connection.execute("SELECT key, size FROM solutions ORDER BY lastUsed"):
+            if storedBytes <= self._maxBytes:
+                break
+            evicted.append((key, ))
+            storedBytes -= size
+        self._connection.executemany("DELETE FROM solutions WHERE key = ?", evicted)
+
+    def solve(self, treeMap, topHints, leftHints, solver=solve, **options):
+        # the cached results of the puzzle, or solver(treeMap, topHints, leftHints, **options) stored for next time
+        results = self.get(treeMap, topHints, leftHints, **options)
+        if results is None:
+            results = solver(treeMap, topHints, leftHints, **options)
+            self.put(treeMap, topHints, leftHints, results, **options)
+        return results
+
+    def purge(self): # delete the entries of other solver versions, and return how many there were
+        with self._lock, self._connection:
+            return self._connection.execute("DELETE FROM solutions WHERE version != ?", (self._version, )).rowcount
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM solutions")
+        self._memory.clear()
+
+    def close(self):
+        self._connection.close()
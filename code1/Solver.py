@@ -1,122 +1,288 @@
+import functools
+import logging
 import os
+import time
 import numpy as np
 
+from SatSolver import SolveTents
+
 _undef = object()
+logger = logging.getLogger(__name__) # progress and board dumps at DEBUG; nothing is formatted unless it is enabled
 const_cellType_notTested = 0
 const_cellType_tent = 1
 const_cellType_uncertain = 2
 const_cellType_grass = 3
 const_cellType_tree = 4
 
-class Cell:
-    def __init__(self, row, column):
-        self._type = CellType.notTested
-        self._row = row
-        self._column = column
+class CellType:
+    notTested = const_cellType_notTested
+    tent = const_cellType_tent
+    uncertain = const_cellType_uncertain
+    grass = const_cellType_grass
+    tree = const_cellType_tree
+
+    @staticmethod
+    def convertToString(type: any) -> str:
+        match type:
+            case 0:
+                return "not-tested"
+            case 1:
+                return "tent"
+            case 2:
+                return "uncertain"
+            case 3:
+                return "grass"
+            case 4:
+                return "tree"
+
+
+_cellGlyphs = np.array(["_", "▲", "?", "□", "T"]) # text of every cell type, indexed by const_cellType_*
+
+
+class TentMap:
+    # Board state backed by a single uint8 array holding the const_cellType_* codes.
+    # Cells are addressed as (row, column); no per-cell objects are created.
+    def __init__(self, rowCount, columnCount, cells=None):
+        if cells is None:
+            cells = np.full((rowCount, columnCount), const_cellType_notTested, dtype=np.uint8)
+        self._cells = cells
+        self._version = 0 # incremented whenever a cell changes, so callers can tell in O(1) whether the map changed
+        self._changedCellCount = 0 # cells written so far, for profiling
+        self._trail = None # undo log of the changes, kept while searching
+        self._changeLog = None # flat indices of the cells written since takeChanges(), kept once watchChanges() is called
+        # tents, grass and notSet cells per row and per column, kept up to date on every change
+        self._rowTentCounts = (cells == const_cellType_tent).sum(axis=1)
+        self._columnTentCounts = (cells == const_cellType_tent).sum(axis=0)
+        self._rowGrassCounts = (cells == const_cellType_grass).sum(axis=1)
+        self._columnGrassCounts = (cells == const_cellType_grass).sum(axis=0)
+        self._rowNotSetCounts = self.notSetMask().sum(axis=1)
+        self._columnNotSetCounts = self.notSetMask().sum(axis=0)
+        self._lineCounts = {
+            const_cellType_tent: (self._rowTentCounts, self._columnTentCounts),
+            const_cellType_grass: (self._rowGrassCounts, self._columnGrassCounts),
+            const_cellType_notTested: (self._rowNotSetCounts, self._columnNotSetCounts),
+            const_cellType_uncertain: (self._rowNotSetCounts, self._columnNotSetCounts),
+        }
+
+    @classmethod
+    def fromTreeMap(cls, treeMap):
+        (rowCount, columnCount) = treeMap.shape
+        cells = np.full((rowCount, columnCount), const_cellType_notTested, dtype=np.uint8)
+        cells[np.asarray(treeMap) != 0] = const_cellType_tree
+        return cls(rowCount, columnCount, cells)
+
+    @property
+    def shape(self):
+        return self._cells.shape
 
     @property
-    def row(self):
-        return self._row
+    def cells(self):
+        return self._cells
 
     @property
-    def column(self):
-        return self._column
+    def version(self):
+        return self._version
 
     @property
-    def type(self):
-        return self._type
+    def changedCellCount(self):
+        return self._changedCellCount
 
     @property
-    def isTree(self):
-        return self._type == CellType.tree
+    def rowTentCounts(self):
+        return self._rowTentCounts
 
     @property
-    def isSet(self):
-        return self._type == CellType.tree or self._type == CellType.grass or self._type == CellType.tent
+    def columnTentCounts(self):
+        return self._columnTentCounts
 
     @property
-    def isNotSet(self):
-        return self._type == CellType.uncertain or self._type == CellType.notTested
+    def rowGrassCounts(self):
+        return self._rowGrassCounts
 
     @property
-    def isTent(self):
-        return self._type == CellType.tent
+    def columnGrassCounts(self):
+        return self._columnGrassCounts
 
     @property
-    def isDefinitelyNotTent(self):
-        return self._type == CellType.tree or self._type == CellType.grass
+    def rowNotSetCounts(self):
+        return self._rowNotSetCounts
+
+    @property
+    def columnNotSetCounts(self):
+        return self._columnNotSetCounts
+
+    def type(self, row, column):
+        return self._cells.item(row, column)
+
+    def isTree(self, row, column):
+        return self._cells.item(row, column) == const_cellType_tree
+
+    def isSet(self, row, column):
+        return not self.isNotSet(row, column)
+
+    def isNotSet(self, row, column):
+        type = self._cells.item(row, column)
+        return type == const_cellType_uncertain or type == const_cellType_notTested
 
-    def setType(self, type):
-        if self.isNotSet:
-            self._type = type
+    def isTent(self, row, column):
+        return self._cells.item(row, column) == const_cellType_tent
+
+    def isDefinitelyNotTent(self, row, column):
+        type = self._cells.item(row, column)
+        return type == const_cellType_tree or type == const_cellType_grass
+
+    def setType(self, row, column, type):
+        if self.isNotSet(row, column):
+            self._write(row, column, type)
         else:
             raise NameError(
-                "Cannot change type from " + CellType.convertToString(self._type) + " to " + CellType.convertToString(
+                "Cannot change type from " + CellType.convertToString(self.type(row, column)) + " to " + CellType.convertToString(
                     type))
 
-    def forceSetType(self, type):
-        self._type = type
+    def forceSetType(self, row, column, type):
+        self._write(row, column, type)
 
-    def trySetType(self, type):
-        if self.isNotSet:
-            self._type = type
+    def trySetType(self, row, column, type):
+        if self.isNotSet(row, column):
+            self._write(row, column, type)
             return True
         return False
 
+    def forceSetCells(self, cells): # change every cell that differs from cells
+        changed = self._cells != cells
+        if changed.any():
+            self._writeMask(changed, cells[changed])
+
+    def watchChanges(self): # record the cells of every change from now on, for takeChanges()
+        self._changeLog = []
+
+    def takeChanges(self): # flat indices of the cells changed since the last call, possibly repeated
+        changes = self._changeLog
+        self._changeLog = []
+        if not changes:
+            return np.empty((0, ), dtype=np.intp)
+        return np.concatenate([np.asarray(change, dtype=np.intp).ravel() for change in changes])
+
+    def startTrail(self): # record every change from now on, so it can be undone
+        self._trail = []
+
+    def stopTrail(self):
+        self._trail = None
+
+    def trailMark(self):
+        return len(self._trail)
+
+    def undo(self, mark): # undo the changes recorded since trailMark() returned mark
+        trail = self._trail
+        self._trail = None
+        while len(trail) > mark:
+            entry = trail.pop()
+            if len(entry) == 3:
+                self._write(*entry)
+            else:
+                (changed, oldTypes) = entry
+                mask = np.zeros(self._cells.shape, dtype=bool)
+                mask.ravel()[changed] = True
+                self._writeMask(mask, oldTypes)
+        self._trail = trail
+
+    def _write(self, row, column, type):
+        oldType = self._cells.item(row, column)
+        if oldType != type:
+            if self._trail is not None:
+                self._trail.append((row, column, oldType))
+            if self._changeLog is not None:
+                self._changeLog.append(row * self._cells.shape[1] + column)
+            self._cells[row, column] = type
+            self._version += 1
+            self._changedCellCount += 1
+            self._count(row, column, oldType, -1)
+            self._count(row, column, type, 1)
+
+    def _count(self, row, column, type, delta):
+        lineCounts = self._lineCounts.get(type)
+        if lineCounts is not None:
+            lineCounts[0][row] += delta
+            lineCounts[1][column] += delta
+
+    def _writeMask(self, mask, types): # types is one type or an array of types for every cell
+        if self._trail is not None or self._changeLog is not None:
+            changed = np.flatnonzero(mask)
+            if self._trail is not None:
+                self._trail.append((changed, self._cells[mask]))
+            if self._changeLog is not None:
+                self._changeLog.append(changed)
+        self._countMask(mask, -1)
+        self._cells[mask] = types
+        self._version += 1
+        self._changedCellCount += int(np.count_nonzero(mask))
+        self._countMask(mask, 1)
+
+    def _countMask(self, mask, delta):
+        for (type, (rowCounts, columnCounts)) in self._lineCounts.items():
+            typeMask = mask & (self._cells == type)
+            rowCounts += delta * typeMask.sum(axis=1)
+            columnCounts += delta * typeMask.sum(axis=0)
+
+    def trySetMask(self, mask, type): # set every notSet cell of mask to type, returning True if any cell changed
+        mask = mask & self.notSetMask()
+        if not mask.any():
+            return False
+        if (self._cells[mask] != type).any():
+            self._writeMask(mask, type)
+        return True
 
-class CellType:
-    # using property decorator
-    # a getter function
-    @property
-    def notTested(self):
-        return const_cellType_notTested
+    def treeMask(self):
+        return self._cells == const_cellType_tree
 
-    @property
-    def tent(self):
-        return const_cellType_tent
+    def tentMask(self):
+        return self._cells == const_cellType_tent
 
-    @property
-    def uncertain(self):
-        return const_cellType_uncertain
+    def notSetMask(self):
+        return (self._cells == const_cellType_notTested) | (self._cells == const_cellType_uncertain)
 
-    @property
-    def grass(self):
-        return const_cellType_grass
+    def setMask(self):
+        return ~self.notSetMask()
 
-    @property
-    def tree(self):
-        return const_cellType_tree
+    def copySetCells(self, copyFrom): # copy the set cells of copyFrom into the cells that are not set here
+        mask = self.notSetMask() & copyFrom.setMask()
+        if mask.any():
+            self._writeMask(mask, copyFrom.cells[mask])
 
-    @staticmethod
-    def convertToString(type: any) -> str:
-        match type:
-            case 0:
-                return "not-tested"
-            case 1:
-                return "tent"
-            case 2:
-                return "uncertain"
-            case 3:
-                return "grass"
-            case 4:
-                return "tree"
+    def copy(self):
+        return TentMap(0, 0, self._cells.copy())
 
 
 class MapSnapshot:
-    def __init__(self, changedCells, map, isValid, isSolved, message):
+    def __init__(self, changedCells, map, isValid, isSolved, message, history=None):
+        # With a history, only the cells changed since the previous snapshot are kept and map is rebuilt on demand
         self._changeCells = changedCells
-        self._map = None if (map is None) or (map is _undef) else DeepCopyMap(map)
+        self._history = None if (map is None) or (map is _undef) else history
+        self._index = None if self._history is None else self._history.append(map)
+        self._map = None if (map is None) or (map is _undef) or (history is not None) else DeepCopyMap(map)
         # print("MapSnapshot -> ", self._map.shape)
         self._isValid = isValid
         self._isSolved = isSolved
         self._message = message
 
     @property
-    def changeCells(self):
+    def changeCells(self): # [(row, column, oldType, newType), ...] when kept in a history
+        if self._history is not None:
+            return self._history.changedCells(self._index)
         return self._changeCells
 
+    @property
+    def history(self): # the MapHistory holding map, or None
+        return self._history
+
+    @property
+    def historyIndex(self): # index of map in history, or None
+        return self._index
+
     @property
     def map(self):
+        if self._history is not None:
+            return self._history.map(self._index)
         return self._map
 
     @property
@@ -131,30 +297,158 @@ class MapSnapshot:
     def message(self):
         return self._message
 
+class MapHistory:
+    # Maps of consecutive snapshots, stored as the cells changed since the previous map
+    # plus a full copy (keyframe) every keyframeInterval maps to bound the cost of rebuilding one.
+    def __init__(self, keyframeInterval=32):
+        self._keyframeInterval = keyframeInterval
+        self._keyframes = {}
+        self._changes = [] # (flat indices, old types, new types) per map
+        self._lastCells = None
+        self._rebuilt = (None, None) # (index, cells) of the last rebuilt map, so stepping forward is cheap
+
+    def __len__(self):
+        return len(self._changes)
+
+    def append(self, tentMap):
+        cells = tentMap.cells
+        index = len(self._changes)
+        if self._lastCells is None:
+            changed = np.empty((0, ), dtype=np.int32)
+            self._changes.append((changed, cells.ravel()[changed], cells.ravel()[changed]))
+        else:
+            changed = np.flatnonzero(cells != self._lastCells).astype(np.int32)
+            self._changes.append((changed, self._lastCells.ravel()[changed], cells.ravel()[changed]))
+        if index % self._keyframeInterval == 0:
+            self._keyframes[index] = cells.copy()
+        self._lastCells = cells.copy()
+        return index
+
+    def changes(self, index): # (flat indices, old types, new types) of the cells changed by map index
+        return self._changes[index]
+
+    def changedCells(self, index):
+        (changed, oldTypes, newTypes) = self._changes[index]
+        columnCount = self._lastCells.shape[1]
+        return [(flat // columnCount, flat % columnCount, oldType, newType)
+                for (flat, oldType, newType) in zip(changed.tolist(), oldTypes.tolist(), newTypes.tolist())]
+
+    def cells(self, index): # cells of map index, rebuilt from the closest keyframe or the last rebuilt map
+        (rebuiltIndex, rebuiltCells) = self._rebuilt
+        keyframeIndex = index - index % self._keyframeInterval
+        if rebuiltIndex is not None and keyframeIndex <= rebuiltIndex <= index:
+            (start, cells) = (rebuiltIndex, rebuiltCells.copy())
+        else:
+            (start, cells) = (keyframeIndex, self._keyframes[keyframeIndex].copy())
+        flatCells = cells.ravel()
+        for step in range(start + 1, index + 1):
+            (changed, oldTypes, newTypes) = self._changes[step]
+            flatCells[changed] = newTypes
+        self._rebuilt = (index, cells)
+        return cells.copy()
+
+    def map(self, index):
+        return TentMap(0, 0, self.cells(index))
+
+    def allCells(self): # the cells of every map as one (map, row, column) array, replayed in a single pass
+        if self._lastCells is None:
+            return np.empty((0, 0, 0), dtype=np.uint8)
+        allCells = np.empty((len(self._changes), ) + self._lastCells.shape, dtype=np.uint8)
+        for (index, (changed, oldTypes, newTypes)) in enumerate(self._changes):
+            if index % self._keyframeInterval == 0:
+                allCells[index] = self._keyframes[index]
+            else:
+                allCells[index] = allCells[index - 1]
+                allCells[index].ravel()[changed] = newTypes
+        return allCells
+
+class DirtyRegions:
+    # Cells of a map changed since each rule last ran. A rule that found nothing to do keeps finding
+    # nothing until a cell it reads changes, so it only needs to look again around these cells.
+    # The changed cells come from the writes of the map, so an update costs time per changed cell.
+    def __init__(self, tentMap, ruleCount):
+        self._tentMap = tentMap
+        tentMap.watchChanges()
+        self._pending = [np.ones(tentMap.shape, dtype=bool) for _ in range(ruleCount)]
+
+    def update(self): # add the cells changed since the last update to every rule
+        changed = self._tentMap.takeChanges()
+        if len(changed) == 0:
+            return
+        for pending in self._pending:
+            pending.ravel()[changed] = True
+
+    def take(self, rule): # region the rule has to look at, or None if nothing changed since it last ran
+        self.update()
+        region = self._pending[rule]
+        if not region.any():
+            return None
+        self._pending[rule] = np.zeros_like(region)
+        return region
+
+def RegionItems(tentMap, version, items, isDirty):
+    # Items outside the region are skipped until the map changes (from version), then every remaining item
+    # is visited, so the sweep gives the same result as visiting all of them.
+    for (item, dirty) in zip(items, isDirty):
+        if dirty or tentMap.version != version:
+            yield item
+
+def RegionCells(tentMap, version, candidateMask, region): # row-major cells of candidateMask, see RegionItems
+    cells = np.argwhere(candidateMask).tolist()
+    if region is None:
+        return cells
+    return RegionItems(tentMap, version, cells, region[candidateMask].tolist())
+
+def RegionLines(tentMap, version, lineCount, dirtyLines): # line indices, see RegionItems
+    if dirtyLines is None:
+        return range(lineCount)
+    return RegionItems(tentMap, version, range(lineCount), dirtyLines.tolist())
+
+class RuleProfile:
+    # Per-rule counters of solve(profile=...): calls, seconds, calls that changed the map, and cells changed.
+    # solve() only calls record(), so any object with that method can take the place of a RuleProfile.
+    def __init__(self):
+        self.rules = {} # description -> {"calls", "time", "fired", "cellsChanged"}
+
+    def record(self, name, seconds, isChanged, changedCellCount):
+        counters = self.rules.get(name)
+        if counters is None:
+            counters = self.rules[name] = {"calls": 0, "time": 0.0, "fired": 0, "cellsChanged": 0}
+        counters["calls"] += 1
+        counters["time"] += seconds
+        counters["fired"] += isChanged
+        counters["cellsChanged"] += changedCellCount
+
+    def summary(self): # the counters of every rule with its no-op calls and fired ratio, the most expensive rule first
+        rows = []
+        for (name, counters) in self.rules.items():
+            noOps = counters["calls"] - counters["fired"]
+            rows.append(dict(name=name, **counters, noOps=noOps, firedRatio=counters["fired"] / counters["calls"]))
+        return sorted(rows, key=lambda row: row["time"], reverse=True)
+
+def RunRule(profile, name, tentMap, rule, *args): # rule(*args), timed into profile when there is one
+    if profile is None:
+        return rule(*args)
+    changedCellCount = tentMap.changedCellCount
+    startTime = time.perf_counter()
+    isChanged = rule(*args)
+    seconds = time.perf_counter() - startTime
+    changedCellCount = tentMap.changedCellCount - changedCellCount
+    profile.record(name, seconds, bool(isChanged) or changedCellCount > 0, changedCellCount)
+    return isChanged
+
 def DeepCopyMap(tentMap):
-    (rowCount, columnCount) = tentMap.shape
-    newMap = np.empty((rowCount, columnCount), dtype=object)
-    for row in range(rowCount):
-        for column in range(columnCount):
-            newMap[row][column] = Cell(row, column)
-            newMap[row][column].setType(tentMap[row][column].type)
-    return newMap
+    return tentMap.copy()
 
 def checkIsValid(tentMap, topHints, leftHints):
     (rowCount, columnCount) = tentMap.shape
     # print("checkIsValid", rowCount, columnCount)
-    rowTentCounts = np.zeros((columnCount, ), dtype=int)
-    for row in range(rowCount):
-        colTentCount = 0
-        for column in range(columnCount):
-            if tentMap[row][column].isTent:
-                colTentCount += 1
-                rowTentCounts[column] += 1
-        if colTentCount + leftHints[row] > columnCount:
-            return (False, "row" + row + " is invalid")
-    for column in range(columnCount):
-        if rowTentCounts[column] + topHints[column] > rowCount:
-            return (False, "col" + column + " is invalid")
+    invalidRows = np.flatnonzero(tentMap.rowTentCounts + np.asarray(leftHints) > columnCount)
+    if len(invalidRows):
+        return (False, "row" + str(invalidRows[0]) + " is invalid")
+    invalidColumns = np.flatnonzero(tentMap.columnTentCounts + np.asarray(topHints) > rowCount)
+    if len(invalidColumns):
+        return (False, "col" + str(invalidColumns[0]) + " is invalid")
     totalTopHints = np.sum(topHints)
     totalLeftHints = np.sum(leftHints)
 
@@ -162,89 +456,64 @@ def checkIsValid(tentMap, topHints, leftHints):
         return (False, "total tents hint (top) must be equal to total tents hint(left)")
     return (True, "")
 
+def CellRows(cells): # the glyphs of every row of a cell array, one string per row
+    glyphs = _cellGlyphs[cells]
+    return glyphs.view("<U" + str(cells.shape[-1]))[..., 0]
+
+def CellsText(cells): # a map as text, one line per row; a list of texts for a stack of maps of one shape
+    (rowCount, columnCount) = cells.shape[-2:]
+    lines = np.full(cells.shape[:-1] + (columnCount + 1, ), "\n")
+    lines[..., :-1] = _cellGlyphs[cells]
+    # each map is one block of code points, so viewing it as one long string joins its rows without a copy per row
+    return lines.reshape(cells.shape[:-2] + (-1, )).view("<U" + str(rowCount * (columnCount + 1))).reshape(cells.shape[:-2]).tolist()
+
 def stringify(tentMap):
-    result = ""
-    (rowCount, columnCount) = tentMap.shape
-    # print("Here stringify", tentMap.shape)
-    for row in range(rowCount):
-        for column in range(columnCount):
-            text = ""
-            match tentMap[row][column].type:
-                case CellType.notTested:
-                    text = "_"
-                case CellType.tent:
-                    text = "▲"
-                case CellType.uncertain:
-                    text = "?"
-                case CellType.grass:
-                    text = "□"
-                case CellType.tree:
-                    text = "T"
-            result += text
-        result += "\n"
-    return result
+    return CellsText(tentMap.cells)
+
+def stringifyMany(maps): # the texts of many maps (TentMaps or cell arrays) at once, rendered as one stack per shape
+    cellsList = [map if isinstance(map, np.ndarray) else map.cells for map in maps]
+    texts = [None] * len(cellsList)
+    indicesOfShape = {}
+    for (index, cells) in enumerate(cellsList):
+        indicesOfShape.setdefault(cells.shape, []).append(index)
+    for indices in indicesOfShape.values():
+        for (index, text) in zip(indices, CellsText(np.stack([cellsList[index] for index in indices]))):
+            texts[index] = text
+    return texts
 
 
 def toHtml(tentMap):
-    result = stringify(tentMap).replace("\n", "<br>")
-    # print("toHtml-> ", result)
-    return "<div class='text-map'>" + result + "</div>"
+    return TextToHtml(stringify(tentMap))
+
+def toHtmlMany(maps):
+    return [TextToHtml(text) for text in stringifyMany(maps)]
+
+def TextToHtml(text):
+    return "<div class='text-map'>" + text.replace("\n", "<br>") + "</div>"
 
 def RemoveZeroColumnRow(tentMap, topHints, leftHints): #well done
-    isChanged = False
-    (rowCount, columnCount) = tentMap.shape
-    for row in range(rowCount):
-        if not leftHints[row]:
-            for column in range(columnCount):
-                isChanged |= tentMap[row][column].trySetType(CellType.grass)
-
-    for column in range(columnCount):
-        if not topHints[column]:
-            for row in range(rowCount):
-                isChanged |= tentMap[row][column].trySetType(CellType.grass)
-    return isChanged
+    zeroMask = (np.asarray(leftHints) == 0)[:, None] | (np.asarray(topHints) == 0)[None, :]
+    return tentMap.trySetMask(zeroMask, CellType.grass)
 
 def checkIsSolved(tentMap, topHoints, leftHints):
-    (rowCount, columnCount) = tentMap.shape
-    rowTentCounts = np.zeros((columnCount, ), dtype=int)
-    rowNotSetCounts = np.zeros((columnCount, ), dtype=int)
-
-    for row in range(rowCount):
-        columnTentCount = 0
-        columnNotSetCount = 0
-        for column in range(columnCount):
-            cell = tentMap[row][column]
-            if cell.isTent:
-                columnTentCount += 1
-                rowTentCounts[column] += 1
-            elif cell.isNotSet:
-                columnNotSetCount += 1
-                rowNotSetCounts[column] += 1
-        if columnTentCount != leftHints[row]:
-            return False
-        if columnNotSetCount > 0:
-            return False
-    for column in range(columnCount):
-        if rowTentCounts[column] != topHoints[column]:
-            return False
-        if rowNotSetCounts[column]:
-            return False
-    return True
+    if (tentMap.rowNotSetCounts > 0).any():
+        return False
+    return bool((tentMap.rowTentCounts == np.asarray(leftHints)).all() and (tentMap.columnTentCounts == np.asarray(topHoints)).all())
 
 
 
-def logStatus(tentMap, topHints, leftHints, prevState, result, stepCount, description): # Record tentmap changes in the results
+def logStatus(tentMap, topHints, leftHints, prevState, result, stepCount, description, history=None): # Record tentmap changes in the results
     # print("Here logStatus")
     (isValid, errorMessage) = checkIsValid(tentMap, topHints, leftHints)
     if not isValid:
         snapshot = MapSnapshot(None, None, False, False, "<br>error: " + errorMessage)
         result.append(snapshot)
         return (prevState, stepCount, False, True)
-    isSolved = checkIsSolved(tentMap, topHints, leftHints)
-    currentState = toHtml(tentMap)
+    currentState = tentMap.version # the map is only rendered when a consumer asks for it
 
     if prevState != currentState:
-        snapshot = MapSnapshot(None, tentMap, False, isSolved, description)
+        isSolved = checkIsSolved(tentMap, topHints, leftHints)
+        snapshot = MapSnapshot(None, tentMap, False, isSolved, description, history)
 
         result.append(snapshot)
         if isSolved:
@@ -259,43 +528,25 @@ def DeepCopyArray(arr): # function that copy arr array to newArr, not same addre
     return newArr
 
 def CopySetCells(map, copyFrom): # copy copyFrom to map so map address is not same copyFrom
-    (rowCount, columnCount) = map.shape
-    for row in range(rowCount):
-        for column in range(columnCount):
-            fromCell = copyFrom[row][column]
-            cell = map[row][column]
-            if cell.isNotSet and fromCell.isSet:
-                cell.setType(fromCell.type)
-
-def SetGrassAroundTent(tentMap): # Set notSet cells around tent to grass, in Up, down, left, right 
-    isChanged = False
-    (rowCount, columnCount) = tentMap.shape
-    for row in range(rowCount):
-        for column in range(columnCount):
-            if tentMap[row][column].isTent:
-                lastRow = row - 1
-                if lastRow >= 0:
-                    isChanged |= tentMap[lastRow][column].trySetType(CellType.grass)
-                nextRow = row + 1
-                if nextRow < rowCount:
-                    isChanged |= tentMap[nextRow][column].trySetType(CellType.grass)
-
-                lastColumn = column - 1
-                if lastColumn >= 0:
-                    isChanged |= tentMap[row][lastColumn].trySetType(CellType.grass)
-                    if lastRow >= 0:
-                        isChanged |= tentMap[lastRow][lastColumn].trySetType(CellType.grass)
-                    if nextRow < rowCount:
-                        isChanged |= tentMap[nextRow][lastColumn].trySetType(CellType.grass)
-                nextColumn = column + 1
-                if nextColumn < columnCount:
-                    isChanged |= tentMap[row][nextColumn].trySetType(CellType.grass)
-                    if lastRow >= 0:
-                        isChanged |= tentMap[lastRow][nextColumn].trySetType(CellType.grass)
-                    if nextRow < rowCount:
-                        isChanged |= tentMap[nextRow][nextColumn].trySetType(CellType.grass)
-    return isChanged
-def GetCellsAround(map, row, lastRow, nextRow, column, rowCount, columnCount): # Get Cells Around present Cell
+    map.copySetCells(copyFrom)
+
+def SetGrassAroundTent(tentMap): # Set notSet cells around tent to grass, in Up, down, left, right and diagonally
+    return tentMap.trySetMask(DilateMask(tentMap.tentMask()), CellType.grass)
+
+def ShiftMask(mask, rowOffset, columnOffset): # mask[row + rowOffset][column + columnOffset] at every cell, False outside the map
+    (rowCount, columnCount) = mask.shape
+    shifted = np.zeros_like(mask)
+    shifted[max(0, -rowOffset):rowCount - max(0, rowOffset), max(0, -columnOffset):columnCount - max(0, columnOffset)] = \
+        mask[max(0, rowOffset):rowCount - max(0, -rowOffset), max(0, columnOffset):columnCount - max(0, -columnOffset)]
+    return shifted
+
+def OrthogonalMask(mask): # cells with a masked cell in Up, down, left or right
+    return ShiftMask(mask, -1, 0) | ShiftMask(mask, 1, 0) | ShiftMask(mask, 0, -1) | ShiftMask(mask, 0, 1)
+
+def DilateMask(mask): # cells with a masked cell among their 8 neighbours
+    return OrthogonalMask(mask) | ShiftMask(mask, -1, -1) | ShiftMask(mask, -1, 1) | ShiftMask(mask, 1, -1) | ShiftMask(mask, 1, 1)
+
+def GetCellsAround(map, row, lastRow, nextRow, column, rowCount, columnCount): # Get coordinates of the Cells Around present Cell
     lastColumn = column - 1
     nextColumn = column + 1
     topCell = _undef
@@ -304,267 +555,187 @@ def GetCellsAround(map, row, lastRow, nextRow, column, rowCount, columnCount): #
     rightCell = _undef
 
     if lastRow >= 0:
-        topCell = map[lastRow][column]
+        topCell = (lastRow, column)
     if nextRow < rowCount:
-        bottomCell = map[nextRow][column]
+        bottomCell = (nextRow, column)
     if lastColumn >= 0:
-        leftCell = map[row][lastColumn]
+        leftCell = (row, lastColumn)
     if nextColumn < columnCount:
-        rightCell = map[row][nextColumn]
+        rightCell = (row, nextColumn)
     return (topCell, leftCell, rightCell, bottomCell)
 
-def TryIsTentOrNotSet(cell): #Identify if that cell is tent or notSet, returning True if it is, and False otherwise.
-    if (cell != _undef) and (cell != None):
-        return cell.isTent or cell.isNotSet
+def TryIsTentOrNotSet(map, cell): #Identify if that cell is tent or notSet, returning True if it is, and False otherwise.
+    if (cell is not _undef) and (cell is not None):
+        return map.isTent(*cell) or map.isNotSet(*cell)
     return False
-def TryIsTree(cell): #Identify if that cell is tree, returning True if it is, and False otherwise.
-    if (cell != _undef) and (cell != None):
-        return cell.isTree
+def TryIsTree(map, cell): #Identify if that cell is tree, returning True if it is, and False otherwise.
+    if (cell is not _undef) and (cell is not None):
+        return map.isTree(*cell)
     return False
-def RemoveAssociatedTreesAndTents(map, topHints, leftHints): #Remove newly identified trees and tents from the test map to show which tents each tree is associated with.
+def RemoveAssociatedTreesAndTents(map, topHints, leftHints, region=None): #Remove newly identified trees and tents from the test map to show which tents each tree is associated with.
     isRemoved = False
     (rowCount, columnCount) = map.shape
-    
-    for row in range(rowCount):
+    if region is not None:
+        region = region | OrthogonalMask(region)
+
+    for (row, column) in RegionCells(map, map.version, map.treeMask() | map.tentMask(), region):
         lastRow = row - 1
         nextRow = row + 1
-        for column in range(columnCount):
-            cell = map[row][column]
-            if cell.isTree:
-                # print("remove Cell Tree-> ", cell.row, cell.column)
-                (topCell, leftCell, rightCell, bottomCell) = GetCellsAround(map, row, lastRow, nextRow, column, rowCount, columnCount)
-                tentCount = TryIsTentOrNotSet(topCell) + TryIsTentOrNotSet(leftCell) + TryIsTentOrNotSet(rightCell) + TryIsTentOrNotSet(bottomCell)
-                # print("remove tentCount", tentCount)
-                if tentCount == 1:
-
-                    tentCell = next((cell for cell in [topCell, leftCell, rightCell, bottomCell] if TryIsTentOrNotSet(cell)), None)
-                    if tentCell.isTent:
-                        cell.forceSetType(CellType.grass)
-                        tentCell.forceSetType(CellType.grass)
-                        topHints[tentCell.column] -= 1
-                        leftHints[tentCell.row] -= 1
-                        isRemoved = True
-            elif cell.isTent:
-                # print("remove Cell Tent-> ", cell.row, cell.column)
-                (topCell, leftCell, rightCell, bottomCell) = GetCellsAround(map, row, lastRow, nextRow, column, rowCount, columnCount)
-                treeCount = TryIsTree(topCell) + TryIsTree(leftCell) + TryIsTree(rightCell) + TryIsTree(bottomCell)
-                # print("remove treeCount", treeCount)
-                if treeCount == 1:
-                    treeCell = next((cell for cell in [topCell, leftCell, rightCell, bottomCell] if TryIsTree(cell)), None)
-                    if treeCell.isTree:
-                        cell.forceSetType(CellType.grass)
-                        treeCell.forceSetType(CellType.grass)
-                        topHints[cell.column] -= 1
-                        leftHints[cell.row] -= 1
-                        isRemoved = True
+        if map.isTree(row, column):
+            # print("remove Cell Tree-> ", row, column)
+            (topCell, leftCell, rightCell, bottomCell) = GetCellsAround(map, row, lastRow, nextRow, column, rowCount, columnCount)
+            tentCount = TryIsTentOrNotSet(map, topCell) + TryIsTentOrNotSet(map, leftCell) + TryIsTentOrNotSet(map, rightCell) + TryIsTentOrNotSet(map, bottomCell)
+            # print("remove tentCount", tentCount)
+            if tentCount == 1:
+
+                tentCell = next((cell for cell in [topCell, leftCell, rightCell, bottomCell] if TryIsTentOrNotSet(map, cell)), None)
+                if map.isTent(*tentCell):
+                    map.forceSetType(row, column, CellType.grass)
+                    map.forceSetType(*tentCell, CellType.grass)
+                    topHints[tentCell[1]] -= 1
+                    leftHints[tentCell[0]] -= 1
+                    isRemoved = True
+        elif map.isTent(row, column):
+            # print("remove Cell Tent-> ", row, column)
+            (topCell, leftCell, rightCell, bottomCell) = GetCellsAround(map, row, lastRow, nextRow, column, rowCount, columnCount)
+            treeCount = TryIsTree(map, topCell) + TryIsTree(map, leftCell) + TryIsTree(map, rightCell) + TryIsTree(map, bottomCell)
+            # print("remove treeCount", treeCount)
+            if treeCount == 1:
+                treeCell = next((cell for cell in [topCell, leftCell, rightCell, bottomCell] if TryIsTree(map, cell)), None)
+                if map.isTree(*treeCell):
+                    map.forceSetType(row, column, CellType.grass)
+                    map.forceSetType(*treeCell, CellType.grass)
+                    topHints[column] -= 1
+                    leftHints[row] -= 1
+                    isRemoved = True
 
     return isRemoved
 
-def seePresentState(tentMap): # This function aims to see the current state of the tentMap.
-    (rowCount, columnCount) = tentMap.shape
-    result = ""
-    for row in range(rowCount):
-        text=""
-        for column in range(columnCount):
-            cell = tentMap[row][column]
-            match tentMap[row][column].type:
-                case CellType.notTested:
-                    text += "_"
-                case CellType.tent:
-                    text += "▲"
-                case CellType.uncertain:
-                    text += "?"
-                case CellType.grass:
-                    text += "□"
-                case CellType.tree:
-                    text += "T"
-        result += text + "    " + str(row+1) + "\n"
-    print(result)
-def excludeLand(tentMap): # Remove any cells that don't have a tree around them.
-    isChanged = False
-    (rowCount, columnCount) = tentMap.shape
-    for row in range(rowCount):
-        for column in range(columnCount):
-            if not tentMap[row][column].isNotSet: # only pass isNotSet
-                continue
-            lastRow = row - 1
-            lastColumn = column - 1
-            nextRow = row + 1
-            nextColumn = column + 1
-            noTopTree = True
-            noLeftTree = True
-            if lastRow >= 0:
-                noTopTree = not tentMap[lastRow][column].isTree
-            if lastColumn >= 0:
-                noLeftTree = not tentMap[row][lastColumn].isTree
-            noBottomTree = True
-            noRightTree = True
-            if nextRow < rowCount:
-                noBottomTree = not tentMap[nextRow][column].isTree
-            if nextColumn < columnCount:
-                noRightTree = not tentMap[row][nextColumn].isTree
-
-            #idendify if this cell can set to grass because there is not tree around
-            if (noTopTree and noLeftTree and noBottomTree and noRightTree):
-                # print("cell that can to grass -> ", row, column)
-                tentMap[row][column].setType(CellType.grass)
-                isChanged = True
-    return isChanged
+def seePresentState(tentMap): # Log the current state of the tentMap at DEBUG level.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s", PresentStateText(tentMap))
 
-def GroupAdjacentNumbers(arr): # Combine adjacent indices into the same array
+def PresentStateText(tentMap): # the map with every row numbered, for seePresentState
+    return "".join(text + "    " + str(row+1) + "\n" for (row, text) in enumerate(CellRows(tentMap.cells).tolist()))
 
-    len_arr = len(arr)
-    if len_arr == 0:
-        return ()
-    last = arr[0]
-    result = [
-       [last]
-    ]
-    # result += ([last], )
-    for i in range(1, len_arr):
-        current = arr[i]
-        if current == last + 1:
-            result[len(result) - 1].append(current)
-        else:
-            result.append([current])
-        last = current
-    return result
-
-def CountDiscontinousCells(arr): #[[1, 2, 3], [5, 6], [7]] => 4 this caculate how many tent can exist on this row
-    count = 0
-    for i in range(len(arr)):
-        count += (len(arr[i]) + 1) >> 1
-    return count
-
-def PlaceOnesAndThreesTents(rowCount, rowEmptyCells, leftHints, isNotSet, setType):
-    isChanged = False
-    for row in range(rowCount):
-        if leftHints[row] == 0:
-            continue
-        emptyCell = rowEmptyCells[row]
-        discontinousCellsCount = CountDiscontinousCells(emptyCell)
-        if discontinousCellsCount < leftHints[row]:
-            diff = (leftHints[row] - discontinousCellsCount + 1) >> 1
-            threes = 0
-            largerThanThree = 0
-            for i in range(len(emptyCell)):
-                emptyCellLength = len(emptyCell[i])
-                if emptyCellLength == 3:
-                    threes += 1
-                elif emptyCellLength > 3:
-                    largerThanThree += 1
-            if largerThanThree == 0 and threes == diff:
-                for i in range(len(emptyCell)):
-                    cells = emptyCell[0]
-                    if len(cells) == 1 and isNotSet(row, cells[0]):
-                        setType(row, cells[i])
-                        isChanged = True
-                    if len(cells) == 3 and isNotSet(row, cells[0]) and isNotSet(row, cells[1]) and isNotSet(row, cells[2]):
-                        setType(row, cells[0])
-                        setType(row, cells[2])
-
-                        isChanged = True
-        elif discontinousCellsCount == leftHints[row]:
-            largerThanTwo = next((e for e in emptyCell if len(e) > 2), None)
-            if (largerThanTwo == _undef or largerThanTwo == None):
-                for i in range(len(emptyCell)):
-                    cells = emptyCell[0]
-                    if len(cells) == 1 and isNotSet(row, cells[0]):
-                        setType(row, cells[0])
-                        isChanged = True
-    return isChanged
-def GetEmptyCells(tentMap): #Get array of combined indexed arrays
+def excludeLand(tentMap): # Remove any cells that don't have a tree around them.
+    return tentMap.trySetMask(~OrthogonalMask(tentMap.treeMask()), CellType.grass)
+
+_linePatternCodes = np.array([0, 1, 0, 2, 2], dtype=np.uint8) # indexed by cell type
+
+def LinePattern(cells): # bytes of a line for LinePlacements: 0 for notSet, 1 for tent, 2 for grass and tree
+    return _linePatternCodes[cells].tobytes()
+
+@functools.lru_cache(maxsize=1 << 16)
+def LinePlacements(pattern, hint):
+    # Every placement of hint tents on the line, no two of them next to each other, that keeps its tents and
+    # puts none on grass or trees. Returns None if there is none, or tuples of (tentCells, freeCells,
+    # guardedCells): the cells that are a tent in every placement, in no placement, and the cells next to which
+    # (at the cell before, the cell or the cell after) every placement has a tent, so the cells beside them in
+    # the neighbouring lines must be grass. Memoized, so a line seen before costs a dictionary lookup.
+    # The tent counts of the placements of any part of a line form a range, since tents can be taken away one
+    # by one, so (first, last) ranges stand for them.
+    cellCount = len(pattern)
+    if hint < 0:
+        return None
+    # prefixes[i] = ranges for the first i cells, ending with a tent or not
+    prefixes = [(None, (0, 0))]
+    for code in pattern:
+        (endsWithTent, endsWithoutTent) = prefixes[-1]
+        prefixes.append((ShiftRange(endsWithoutTent, 1) if code != 2 else None,
+                         JoinRanges(endsWithTent, endsWithoutTent) if code != 1 else None))
+    # suffixes[i] = ranges for the cells from i on, starting with a tent or not
+    suffixes = [(None, (0, 0))]
+    for code in reversed(pattern):
+        (startsWithTent, startsWithoutTent) = suffixes[-1]
+        suffixes.append((ShiftRange(startsWithoutTent, 1) if code != 2 else None,
+                         JoinRanges(startsWithTent, startsWithoutTent) if code != 1 else None))
+    suffixes.reverse()
+    if not InRange(JoinRanges(*prefixes[cellCount]), hint):
+        return None
+    tentCells = []
+    freeCells = []
+    guardedCells = []
+    for (cell, code) in enumerate(pattern):
+        canBeTent = code != 2 and InRange(AddRanges(prefixes[cell][1], suffixes[cell + 1][1]), hint - 1)
+        canBeGrass = code != 1 and InRange(AddRanges(JoinRanges(*prefixes[cell]), JoinRanges(*suffixes[cell + 1])), hint)
+        tentCells.append(not canBeGrass)
+        freeCells.append(not canBeTent)
+        # a placement without tents from the cell before to the cell after
+        (first, last) = (max(cell - 1, 0), min(cell + 2, cellCount))
+        canBeClear = 1 not in pattern[first:last] and InRange(AddRanges(JoinRanges(*prefixes[first]), JoinRanges(*suffixes[last])), hint)
+        guardedCells.append(not canBeClear)
+    return (tuple(tentCells), tuple(freeCells), tuple(guardedCells))
+
+@functools.lru_cache(maxsize=1 << 16)
+def LineTentRange(pattern): # (fewest, most) tents of the placements on the line, None if no placement fits
+    (endsWithTent, endsWithoutTent) = (None, (0, 0))
+    for code in pattern:
+        (endsWithTent, endsWithoutTent) = (ShiftRange(endsWithoutTent, 1) if code != 2 else None,
+                                           JoinRanges(endsWithTent, endsWithoutTent) if code != 1 else None)
+    return JoinRanges(endsWithTent, endsWithoutTent)
+
+def ShiftRange(tentRange, offset):
+    return None if tentRange is None else (tentRange[0] + offset, tentRange[1] + offset)
+
+def JoinRanges(tentRange, otherRange): # the range of both, None standing for no placement
+    if tentRange is None or otherRange is None:
+        return otherRange if tentRange is None else tentRange
+    return (min(tentRange[0], otherRange[0]), max(tentRange[1], otherRange[1]))
+
+def AddRanges(tentRange, otherRange):
+    if tentRange is None or otherRange is None:
+        return None
+    return (tentRange[0] + otherRange[0], tentRange[1] + otherRange[1])
+
+def InRange(tentRange, count):
+    return tentRange is not None and tentRange[0] <= count <= tentRange[1]
+
+def SolvedLines(tentMap, topHints, leftHints, region=None):
+    # (line, neighbouring lines, LinePlacements of the line) for the rows and then the columns that region
+    # touches, as indices into the map; see RegionLines for how region is used
     (rowCount, columnCount) = tentMap.shape
-    rowEmptyCells = np.empty((rowCount, ), dtype=object)
-    localColumnEmptyCells = np.empty((columnCount, ), dtype=object)
-    columnEmptyCells = np.empty((columnCount, ), dtype=object)
-
-    for column in range(columnCount):
-        localColumnEmptyCells[column] = np.array([], dtype=int)
-    for row in range(rowCount):
-        localRowEmptyCells = np.array([], dtype=int)
-        for column in range(columnCount):
-            cell = tentMap[row][column]
-            if cell.isNotSet or cell.isTent:
-                localRowEmptyCells = np.append(localRowEmptyCells, column)
-                localColumnEmptyCells[column] = np.append(localColumnEmptyCells[column], row)
-        rowEmptyCells[row] = GroupAdjacentNumbers(localRowEmptyCells)
-
-    for column in range(columnCount):
-        # print("localColunEmptyCells[column] -> ", columnEmptyCells[column])
-        columnEmptyCells[column] = GroupAdjacentNumbers(localColumnEmptyCells[column])
-    return (rowEmptyCells, columnEmptyCells)
-def PlaceExplicitTents(tentMap, topHints, leftHints):
+    version = tentMap.version
+    (dirtyRows, dirtyColumns) = (None, None) if region is None else (region.any(axis=1), region.any(axis=0))
+    cells = tentMap.cells
+    for row in RegionLines(tentMap, version, rowCount, dirtyRows):
+        neighbours = [(neighbour, slice(None)) for neighbour in (row - 1, row + 1) if 0 <= neighbour < rowCount]
+        yield ((row, slice(None)), neighbours, LinePlacements(LinePattern(cells[row]), int(leftHints[row])))
+    for column in RegionLines(tentMap, version, columnCount, dirtyColumns):
+        neighbours = [(slice(None), neighbour) for neighbour in (column - 1, column + 1) if 0 <= neighbour < columnCount]
+        yield ((slice(None), column), neighbours, LinePlacements(LinePattern(cells[:, column]), int(topHints[column])))
+
+def LineMask(tentMap, lines, cells): # mask of the cells of cells on every line of lines
+    mask = np.zeros(tentMap.shape, dtype=bool)
+    for line in lines:
+        mask[line] = cells
+    return mask
+
+def PlaceExplicitTents(tentMap, topHints, leftHints, region=None): # cells that are a tent in every placement of their line hints
+    # (3) 0 0 0 0 0 <- 1st, 3rd and 5th must be tents
     isChanged = False
-    (rowCount, columnCount) = tentMap.shape
-    topUnknownTents = np.zeros((columnCount, ), dtype=int)
-    leftUnknownTents = np.zeros((columnCount, ), dtype=int)
-    topKnownTents = np.zeros((columnCount,), dtype=int)
-    leftKnownTents = np.zeros((columnCount,), dtype=int)
-
-    for row in range(rowCount):
-        for column in range(columnCount):
-            cell = tentMap[row][column]
-            if cell.isNotSet:
-                topUnknownTents[column] += 1
-                leftUnknownTents[row] += 1
-            elif cell.isTent:
-                topKnownTents[column] += 1
-                leftKnownTents[row] += 1
-    for row in range(rowCount):
-        if leftUnknownTents[row] == 0:
-            continue
-        if (leftKnownTents[row] + leftUnknownTents[row] == leftHints[row]):
-            for column in range(columnCount):
-                cell = tentMap[row][column]
-                if cell.isNotSet:
-                    tentMap[row][column].setType(CellType.tent)
-                    isChanged = True
-                    topUnknownTents[column] -= 1
-                    topKnownTents[column] += 1
-    for column in range(columnCount):
-        if topUnknownTents[column] == 0:
-            continue
-        if (topKnownTents[column] + topUnknownTents[column] == topHints[column]):
-            for row in range(rowCount):
-                cell = tentMap[row][column]
-                isChanged |= cell.trySetType(CellType.tent)
-    # print("placeExplicitTents->")
-    # seePresentState(tentMap)
-    (rowEmptyCells, columnEmptyCell) = GetEmptyCells(tentMap)
-    # print("rowEmptyCells -> ")
-    # print(rowEmptyCells)
-
-    isChanged |= PlaceOnesAndThreesTents(rowCount, rowEmptyCells, leftHints,
-                    lambda r, c: tentMap[r][c].isNotSet,
-                    lambda r, c: tentMap[r][c].setType(CellType.tent))
-    # print("-------row direct placeOneAndThreesTens ----->")
-    # seePresentState(tentMap)
-    isChanged |= PlaceOnesAndThreesTents(columnCount, columnEmptyCell, topHints,
-                    lambda c, r: tentMap[r][c].isNotSet,
-                    lambda c, r: tentMap[r][c].setType(CellType.tent))
-    # print("-------column direct placeOneAndThreesTens ----->")
-    # seePresentState(tentMap)
+    for (line, neighbours, placements) in SolvedLines(tentMap, topHints, leftHints, region):
+        if placements is not None:
+            isChanged |= tentMap.trySetMask(LineMask(tentMap, [line], placements[0]), CellType.tent)
     return isChanged
 
-def PlaceTentNextToIsolatedsTree(tentMap):
+def PlaceTentNextToIsolatedsTree(tentMap, region=None):
     isChanged = False
-    (rowCount, columnCount) = tentMap.shape
-    for row in range(rowCount):
-        for column in range(columnCount):
-            if tentMap[row][column].isTree:
-                coordinate = hasOnlyOneUnKnownCell(tentMap, row, column)
-                if coordinate is not _undef and coordinate is not None:
-                    print([row, column], coordinate)
-                    isChanged |= tentMap[coordinate[0]][coordinate[1]].trySetType(CellType.tent)
+    if region is not None:
+        region = region | OrthogonalMask(region)
+    for (row, column) in RegionCells(tentMap, tentMap.version, tentMap.treeMask(), region):
+        coordinate = hasOnlyOneUnKnownCell(tentMap, row, column)
+        if coordinate is not _undef and coordinate is not None:
+            logger.debug("isolated tree %s -> tent %s", [row, column], coordinate)
+            isChanged |= tentMap.trySetType(coordinate[0], coordinate[1], CellType.tent)
     return isChanged
 
 def hasOnlyOneUnKnownCell(tentMap, row, column): # Make sure there is only one isNotSet space around this tree.
     (rowCount, columnCount) = tentMap.shape
-    isTopNotTent = row <= 0 or ( row > 0 and tentMap[row - 1][column].isDefinitelyNotTent)
-    isBottomNotTent = row >= rowCount - 1 or (row < rowCount - 1 and tentMap[row + 1][column].isDefinitelyNotTent)
-    isLeftNotTent = column <= 0 or  (column > 0 and tentMap[row][column - 1].isDefinitelyNotTent)
-    isRightNotTent = column >= columnCount - 1 or (column < columnCount - 1 and tentMap[row][column + 1].isDefinitelyNotTent)
+    isTopNotTent = row <= 0 or ( row > 0 and tentMap.isDefinitelyNotTent(row - 1, column))
+    isBottomNotTent = row >= rowCount - 1 or (row < rowCount - 1 and tentMap.isDefinitelyNotTent(row + 1, column))
+    isLeftNotTent = column <= 0 or  (column > 0 and tentMap.isDefinitelyNotTent(row, column - 1))
+    isRightNotTent = column >= columnCount - 1 or (column < columnCount - 1 and tentMap.isDefinitelyNotTent(row, column + 1))
     coordinate = None
     if not isTopNotTent:
         coordinate = [row - 1, column]
@@ -579,312 +750,441 @@ def hasOnlyOneUnKnownCell(tentMap, row, column): # Make sure there is only one i
     return None
 
 
-def PlaceDeducedTents(tentMap, topHints, leftHints):
-    # [0, 3, 0, 0] and hint is 2, then 1 st cell must be a tent
-    isChanged = False
-    (rowCount, columnCount) = tentMap.shape
-    (rowEmptyCells, columnEmptyCells) = GetEmptyCells(tentMap)
-    for row in range(rowCount):
-        rowEmptyCell = rowEmptyCells[row]
-        if CountDiscontinousCells(rowEmptyCell) == leftHints[row]:
-            for i in range(len(rowEmptyCell)):
-                cells = rowEmptyCell[i]
-                if (len(cells) & 1) == 1:
-                    for j in range(0, len(cells), 2):
-                        if not tentMap[row][cells[j]].isTent:
-                            tentMap[row][cells[j]].setType(CellType.tent)
-                            isChanged = True
-    for column in range(columnCount):
-        columnEmptyCell = columnEmptyCells[column]
-        if CountDiscontinousCells(columnEmptyCell) == topHints[column]:
-            for i in range(len(columnEmptyCell)):
-                cells = columnEmptyCell[i]
-                if (len(cells) & 1) == 1:
-                    for j in range(0, len(cells), 2):
-                        if not tentMap[cells[j]][column].isTent:
-                            tentMap[cells[j]][column].setType(CellType.tent)
-                            isChanged = True
-    return isChanged
-
-def ExcludeFullyFilledLine(tentMap, topHints, leftHints):
+def ExcludeLineCells(tentMap, topHints, leftHints, region=None): # cells that are a tent in no placement of their line hints
     # (2) 1 T 1 0 <- the last cell must be grass
     isChanged = False
-    (rowCount, columnCount) = tentMap.shape
-    for row in range(rowCount):
-        notSetCount = 0
-        tentCount = 0
-        for column in range(columnCount):
-            cell = tentMap[row][column]
-            if cell.isTent:
-                tentCount += 1
-            elif cell.isNotSet:
-                notSetCount += 1
-        if tentCount == leftHints[row] and notSetCount > 0:
-            for column in range(columnCount):
-                isChanged |= tentMap[row][column].trySetType(CellType.grass)
-    for column in range(columnCount):
-        notSetCount = 0
-        tentCount = 0
-        for row in range(rowCount):
-            cell = tentMap[row][column]
-            if cell.isTent:
-                tentCount += 1
-            elif cell.isNotSet:
-                notSetCount += 1
-        if tentCount == topHints[column] and notSetCount > 0:
-            for row in range(rowCount):
-                isChanged |= tentMap[row][column].trySetType(CellType.grass)
+    for (line, neighbours, placements) in SolvedLines(tentMap, topHints, leftHints, region):
+        if placements is not None:
+            isChanged |= tentMap.trySetMask(LineMask(tentMap, [line], placements[1]), CellType.grass)
     return isChanged
 
-def ExcludeDiagonallyJointCell(tentMap, topHints, leftHints):
+def ExcludeDiagonallyJointCell(tentMap, topHints, leftHints, region=None):
     # (2) 0 T 0 0
     #     0 0 0 0 <- 2nd must be grass
     isChanged = False
-    (rowCount, columnCount) = tentMap.shape
-    (rowEmptyCells, columnEmptyCells) = GetEmptyCells(tentMap)
-    # print(rowEmptyCells)
-    # print(columnEmptyCells)
-    print("row")
-    for row in range(rowCount):
-        if leftHints[row] == 0:
-            continue
-        isChanged |= ExcludeDiagonallyJointCellsInline(rowEmptyCells, leftHints, row, rowCount,
-             lambda r, c: tentMap[r][c].isNotSet,
-             lambda r, c: tentMap[r][c].trySetType(CellType.grass),
-        )
-    print("column")
-    for column in range(columnCount):
-        if leftHints[column] == 0:
-            continue
-        isChanged |= ExcludeDiagonallyJointCellsInline(columnEmptyCells, topHints, column, columnCount,
-             lambda c, r: tentMap[r][c].isNotSet,
-             lambda c, r: tentMap[r][c].trySetType(CellType.grass),
-        )
-    # print("diagonally result -> ", isChanged)
-    return isChanged
-
-def ExcludeAlignedCellsInline(emptyCell, row, rowCount, isNotSet, trySetType):
-    isChanged = False
-    lastRow = row - 1
-    nextRow = row + 1
-    if len(emptyCell) == 0:
-        return isChanged
-    lastCells = emptyCell[0]
-    # print("ExcludeAlignedCellsInline -> ", emptyCell)
-    for i in range(1, len(emptyCell)):
-        cells = emptyCell[i]
-        if len(cells) == 2 and isNotSet(row, cells[0]) and isNotSet(row, cells[1]):
-            # * (1) 0 0
-            # *     0 T <- 1st
-            if lastRow >= 0:
-                isChanged |= trySetType(lastRow, cells[0])
-                isChanged |= trySetType(lastRow, cells[1])
-            elif nextRow < rowCount:
-                isChanged |= trySetType(nextRow, cells[0])
-                isChanged |= trySetType(nextRow, cells[1])
-        elif len(cells) == 3 and isNotSet(row, cells[0]) and isNotSet(row, cells[1]) and isNotSet(row, cells[2]):
-            # * (1) 0 0 0
-            #       T 0 T <- 2nd
-            if lastRow >= 0:
-                isChanged |= trySetType(lastRow, cells[1])
-            elif nextRow < rowCount:
-                trySetType(nextRow, cells[1])
-        elif len(lastCells) == 1 and len(cells) == 3 and cells[0] == lastCells[0] + 2:
-            #*(2) 0 T 0 0 0
-            #     T 0 T T T <-2nd
-            if isNotSet(row, cells[0]) and isNotSet(row, cells[1]) and isNotSet(row, cells[2]) and isNotSet(row, lastCells[0]):
-                if lastRow >=0:
-                    isChanged |= trySetType(lastRow, lastCells[0] + 1)
-                if nextRow < rowCount:
-                    isChanged |= trySetType(nextRow, lastCells[0] + 1)
-        elif len(lastCells) == 3 and len(cells) == 1 and cells[0] == lastCells[2] + 2:
-            #*(2) 0 0 0 T 0
-            #     T T T 0 T
-            if isNotSet(row,cells[0] and isNotSet(row, lastCells[1])) and isNotSet(row, lastCells[2]) and isNotSet(row, lastCells[0]):
-                if lastRow >= 0:
-                    isChanged |= trySetType(lastRow, lastCells[0] - 1)
-                if nextRow < rowCount:
-                    isChanged |= trySetType(lastRow, cells[0] - 1)
-        if i >= 1:
-            lastCells = cells
+    for (line, neighbours, placements) in SolvedLines(tentMap, topHints, leftHints, region):
+        if placements is not None and neighbours:
+            isChanged |= tentMap.trySetMask(LineMask(tentMap, neighbours, placements[2]), CellType.grass)
     return isChanged
 
-
-def ExcludeDiagonallyJointCellsInline(emptyCells, hints, row, rowCount, isNotSet, trySetType):
-    isChanged = False
-    emptyCell = emptyCells[row]
-    discontinuousCellsCount = CountDiscontinousCells(emptyCell)
-    # print("i -> discount", row,  discontinuousCellsCount)
-    if discontinuousCellsCount == hints[row]:
-        isChanged |= ExcludeAlignedCellsInline(emptyCell, row, rowCount, isNotSet, trySetType)
-    elif discontinuousCellsCount == hints[row] + 1:
-        # print("i, disCount, hints[i]", row, discontinuousCellsCount, hints[row])
-        isChanged |= ExcludeDiagonallyJointCells(emptyCell, row, rowCount, isNotSet, trySetType)
-    return isChanged
-def ExcludeDiagonallyJointCells(emptyCell, row, rowCount, isNotSet, trySetType):
-    lastRow = row - 1
-    nextRow = row + 1
-    isChanged = False
-    print(emptyCell)
-    if len(emptyCell) == 0:
-        return False
-    lastCells = emptyCell[0]
-    for i in range(1, len(emptyCell)):
-        cells = emptyCell[i]
-        if len(lastCells) == 1 and len(cells) == 1 and cells[0] == lastCells[0] + 2:
-            # * (1) 0 T 0
-            # *     0 0 0 <- 2nd
-            if isNotSet(row, cells[0]) and isNotSet(row, lastCells[0]):
-                if lastRow >= 0:
-                    isChanged |= trySetType(lastRow, lastCells[0] + 1)
-                if nextRow < rowCount:
-                    isChanged |= trySetType(nextRow, lastCells[0] + 1)
-        elif len(lastCells) == 1 and len(cells) == 3 and cells[0] == lastCells[0] + 2:
-            # (2) 0 T 0 0 0
-            #     T 0 T T T <- 2nd
-            if isNotSet(row, cells[0]) and isNotSet(row, cells[1]) and isNotSet(row, cells[2]) and isNotSet(row, lastCells[0]):
-                if lastRow >= 0:
-                    isChanged |= trySetType(lastRow, lastCells[0] + 1)
-                if nextRow < rowCount:
-                    isChanged |= trySetType(nextRow, lastCells[0] + 1)
-        elif len(lastCells) == 3 and len(cells) == 1 and cells[0] == lastCells[2] + 2:
-            #(2) 0 0 0 T 0
-            #    T T T 0 T <-4th
-            if isNotSet(row, cells[0]) and isNotSet(row, lastCells[1]) and isNotSet(row, lastCells[2]) and isNotSet(row, lastCells[0]):
-                if lastRow >= 0:
-                    isChanged |= trySetType(lastRow, cells[0] - 1)
-                if nextRow < rowCount:
-                    isChanged |= trySetType(nextRow, cells[0] - 1)
-        elif len(cells) == 3 and isNotSet(row, cells[0]) and isNotSet(row, cells[1]) and isNotSet(row, cells[2]):
-            #(1) 0 0 0
-            #    T 0 T <- 2nd
-            if lastRow >= 0:
-                isChanged |= trySetType(lastRow, cells[1])
-            elif (nextRow < rowCount):
-                isChanged |= trySetType(nextRow, cells[1])
-        lastCells = cells
-    return isChanged
 def ExcludeCornerCell(tentMap):
     # T 0
     # 0 0 <- impossible
+    # Trees are handled in bulk, but grass set below a tree can change what a tree in a later row sees.
+    # When that happens, apply the rows before the affected one and restart there, like the row by row sweep.
     isChanged = False
-    (rowCount, columnCount) = tentMap.shape
-    for row in range(rowCount):
-        for column in range(columnCount):
-            if tentMap[row][column].isTree:
-                lastRow = row - 1
-                lastColumn = column - 1
-                nextRow = row + 1
-                nextColumn = column + 1
-                isTopNotSet = False
-                isBottomNotSet = False
-                isLeftNotSet = False
-                isRightNotSet = False
-                if lastRow >= 0:
-                    isTopNotSet = tentMap[lastRow][column].isNotSet
-                if nextRow < rowCount:
-                    isBottomNotSet = tentMap[nextRow][column].isNotSet
-                if lastColumn >= 0:
-                    isLeftNotSet = tentMap[row][lastColumn].isNotSet
-                if nextColumn < columnCount:
-                    isRightNotSet = tentMap[row][nextColumn].isNotSet
-                if isTopNotSet and isLeftNotSet and (not isBottomNotSet) and (not isRightNotSet):
-                    isChanged |= tentMap[lastRow][lastColumn].trySetType(CellType.grass)
-                elif isTopNotSet and (not isLeftNotSet) and (not isBottomNotSet) and isRightNotSet:
-                    isChanged |= tentMap[lastRow][nextColumn].trySetType(CellType.grass)
-                elif (not isTopNotSet) and (not isLeftNotSet) and isBottomNotSet and isRightNotSet:
-                    isChanged |= tentMap[nextRow][nextColumn].trySetType(CellType.grass)
-                elif (not isTopNotSet) and isLeftNotSet and isBottomNotSet and (not isRightNotSet):
-                    isChanged |= tentMap[nextRow][lastColumn].trySetType(CellType.grass)
-    return isChanged
-def ExcludeImpossibleCell(tentMap):
+    treeMask = tentMap.treeMask()
+    startRow = 0
+    while True:
+        notSetMask = tentMap.notSetMask()
+        activeTreeMask = treeMask.copy()
+        activeTreeMask[:startRow] = False
+        (topCornerMask, bottomCornerMask) = CornerCellMask(activeTreeMask, notSetMask)
+        affectedRows = np.flatnonzero((treeMask & OrthogonalMask(bottomCornerMask & notSetMask)).any(axis=1))
+        if len(affectedRows) == 0:
+            return tentMap.trySetMask(topCornerMask | bottomCornerMask, CellType.grass) or isChanged
+        startRow = affectedRows[0]
+        activeTreeMask[startRow:] = False
+        (topCornerMask, bottomCornerMask) = CornerCellMask(activeTreeMask, notSetMask)
+        isChanged |= tentMap.trySetMask(topCornerMask | bottomCornerMask, CellType.grass)
+
+def CornerCellMask(treeMask, notSetMask): # diagonal cells of trees whose only notSet neighbours are the two cells next to that diagonal
+    isTopNotSet = treeMask & ShiftMask(notSetMask, -1, 0)
+    isBottomNotSet = treeMask & ShiftMask(notSetMask, 1, 0)
+    isLeftNotSet = treeMask & ShiftMask(notSetMask, 0, -1)
+    isRightNotSet = treeMask & ShiftMask(notSetMask, 0, 1)
+    topLeft = isTopNotSet & isLeftNotSet & ~isBottomNotSet & ~isRightNotSet
+    topRight = isTopNotSet & ~isLeftNotSet & ~isBottomNotSet & isRightNotSet
+    bottomRight = ~isTopNotSet & ~isLeftNotSet & isBottomNotSet & isRightNotSet
+    bottomLeft = ~isTopNotSet & isLeftNotSet & isBottomNotSet & ~isRightNotSet
+    return (ShiftMask(topLeft, 1, 1) | ShiftMask(topRight, 1, -1), ShiftMask(bottomRight, -1, -1) | ShiftMask(bottomLeft, -1, 1))
+
+def ExcludeImpossibleCell(tentMap, region=None):
+    # A cell is impossible if placing a tent there (and grass around every tent) leaves more than one
+    # neighbouring tree without any cell for its tent. Only the 5x5 area around the cell can change,
+    # so the what-if is evaluated there instead of on a copy of the map.
     isChanged = False
     (rowCount, columnCount) = tentMap.shape
-    for row in range(rowCount):
-        for column in range(columnCount):
-            if tentMap[row][column].isNotSet:
-                newMap = DeepCopyMap(tentMap)
-                newMap[row][column].setType(CellType.tent)
-                SetGrassAroundTent(newMap)
-                lastRow = row -1
-                lastColumn = column - 1
-                nextRow = row + 1
-                nextColumn = column + 1
-                treeWithOneTentCount = 0
-                if lastRow >= 0:
-                    treeWithOneTentCount += (HasNTentAroundTree(newMap, lastRow, column, 0, [[row, column]]) == True)
-                if nextRow < rowCount:
-                    treeWithOneTentCount += (HasNTentAroundTree(newMap, nextRow, column, 0, [[row, column]]) == True)
-                if lastColumn >= 0:
-                    treeWithOneTentCount += (HasNTentAroundTree(newMap, row, lastColumn, 0, [[row, column]]) == True)
-                    if lastRow >= 0:
-                        treeWithOneTentCount += (HasNTentAroundTree(newMap, lastRow, lastColumn, 0, [[row, column]]) == True)
-                    if nextRow < rowCount:
-                        treeWithOneTentCount += (HasNTentAroundTree(newMap, nextRow, lastColumn, 0, [[row, column]]) == True)
-                if nextColumn < columnCount:
-                    treeWithOneTentCount += (HasNTentAroundTree(newMap, row, nextColumn, 0, [[row, column]]) == True)
-                    if lastRow >= 0:
-                        treeWithOneTentCount += (HasNTentAroundTree(newMap, lastRow, nextColumn, 0, [[row, column]]) == True)
-                    if nextRow < rowCount:
-                        treeWithOneTentCount += (HasNTentAroundTree(newMap, nextRow, nextColumn, 0, [[row, column]]) == True)
-                if treeWithOneTentCount > 1: # an impossible cell, must be grass
-                    tentMap[row][column].setType(CellType.grass)
-                    isChanged = True
+    treeMask = tentMap.treeMask()
+    tentMask = tentMap.tentMask()
+    notSetMask = tentMap.notSetMask()
+    neighbourTreeCount = sum(ShiftMask(treeMask, rowOffset, columnOffset).astype(np.int8)
+                             for rowOffset in (-1, 0, 1) for columnOffset in (-1, 0, 1) if rowOffset or columnOffset)
+    trees = treeMask.tolist()
+    tents = tentMask.tolist()
+    freeCells = (notSetMask & ~DilateMask(tentMask)).tolist() # notSet cells that stay notSet after SetGrassAroundTent
+    if region is not None:
+        region = DilateMask(DilateMask(DilateMask(region))) # the what-if reads the 7x7 area around a cell
+    for (row, column) in RegionCells(tentMap, tentMap.version, notSetMask & (neighbourTreeCount > 1), region):
+        if CountTreesLeftWithoutTent(row, column, trees, tents, freeCells, rowCount, columnCount) > 1: # an impossible cell, must be grass
+            tentMap.setType(row, column, CellType.grass)
+            freeCells[row][column] = False
+            isChanged = True
     return isChanged
-def HasNTentAroundTree(tentMap, row, column, n, excludedCoordates = []):
-    (rowCount, columnCount) = tentMap.shape
-    if tentMap[row][column].isTree:
-        lastRow = row - 1
-        lastColumn = column - 1
-        nextRow = row + 1
-        nextColumn = column + 1
-        tentCount = 0
-        if lastRow >= 0 and (not ContainCoordinate(excludedCoordates, lastRow, column)):
-            tentCount += (tentMap[lastRow][column].isTent or tentMap[lastRow][column].isNotSet)
-        if nextRow < rowCount and (not ContainCoordinate(excludedCoordates, nextRow, column)):
-            tentCount += (tentMap[nextRow][column].isTent or tentMap[nextRow][column].isNotSet)
-        if lastColumn >= 0 and (not ContainCoordinate(excludedCoordates, row, lastColumn)):
-            tentCount += (tentMap[row][lastColumn].isTent or tentMap[row][lastColumn].isNotSet)
-        if nextColumn < columnCount and (not ContainCoordinate(excludedCoordates, row, nextColumn)):
-            tentCount += (tentMap[row][nextColumn].isTent or tentMap[row][nextColumn].isNotSet)
-        return (tentCount == n)
-    return None
-def ContainCoordinate(coordinates, row, column):
-    for i in range(len(coordinates)):
-        if coordinates[i][0] == row and coordinates[i][1] == column:
-            return True
-    return False
 
-def solve(treeMap, topHints, leftHints):
+def CountTreesLeftWithoutTent(row, column, trees, tents, freeCells, rowCount, columnCount): # trees around (row, column) with no tent cell left if (row, column) were a tent
+    treeCount = 0
+    for treeRow in range(max(0, row - 1), min(rowCount, row + 2)):
+        for treeColumn in range(max(0, column - 1), min(columnCount, column + 2)):
+            if not trees[treeRow][treeColumn] or (treeRow == row and treeColumn == column):
+                continue
+            hasTentCell = False
+            for (cellRow, cellColumn) in ((treeRow - 1, treeColumn), (treeRow + 1, treeColumn), (treeRow, treeColumn - 1), (treeRow, treeColumn + 1)):
+                if cellRow < 0 or cellRow >= rowCount or cellColumn < 0 or cellColumn >= columnCount:
+                    continue
+                if cellRow == row and cellColumn == column:
+                    continue
+                if tents[cellRow][cellColumn] or (freeCells[cellRow][cellColumn] and (abs(cellRow - row) > 1 or abs(cellColumn - column) > 1)):
+                    hasTentCell = True
+                    break
+            treeCount += not hasTentCell
+    return treeCount
+
+def MatchTreesAndTents(tentMap):
+    # Every tree needs its own tent next to it and every tent its own tree, so a solution pairs the trees
+    # with tent or notSet cells. A notSet cell that no such pairing uses must be grass, and a notSet cell that
+    # every pairing uses must be a tent (Dulmage-Mendelsohn decomposition of the tree/cell graph).
+    pairing = PairTreesWithCells(tentMap)
+    if pairing is None: # no pairing at all, left to checkIsValid and the search
+        return False
+    (cells, cellsOfTrees, cellOfTree, treeOfCell) = pairing
+    (isGrass, isTent) = MatchedCellTypes(cellsOfTrees, cellOfTree, treeOfCell, tentMap.notSetMask().ravel()[cells].tolist())
+    grassMask = np.zeros(tentMap.shape, dtype=bool)
+    tentMask = np.zeros(tentMap.shape, dtype=bool)
+    grassMask.ravel()[cells[isGrass]] = True
+    tentMask.ravel()[cells[isTent]] = True
+    isChanged = tentMap.trySetMask(grassMask, CellType.grass)
+    isChanged |= tentMap.trySetMask(tentMask, CellType.tent)
+    return isChanged
 
-    print("Here Solve function")
+def MatchedCellTypes(cellsOfTrees, cellOfTree, treeOfCell, isNotSetCell):
+    # ([True for every cell no pairing uses], [True for every cell all pairings use]) of a pairing of the
+    # tree/cell graph given as in PairTreeGraph
+    treeCount = len(cellsOfTrees)
+    # directed graph of trees 0..treeCount-1 and cells treeCount..: a tree points to the cells it is not paired
+    # with, a paired cell points to its tree, so a path alternates between unpaired and paired edges
+    successors = [[treeCount + cell for cell in cellsOfTree if cell != cellOfTree[tree]] for (tree, cellsOfTree) in enumerate(cellsOfTrees)]
+    successors += [[tree] if tree >= 0 else [] for tree in treeOfCell]
+    predecessors = [[] for _ in successors]
+    for (node, nodeSuccessors) in enumerate(successors):
+        for successor in nodeSuccessors:
+            predecessors[successor].append(node)
+    # a paired cell can be given up if a path leads from it to an unpaired cell (tents are never unpaired)
+    canBeFreed = ReachableNodes(predecessors, [treeCount + cell for (cell, tree) in enumerate(treeOfCell) if tree < 0])
+    # a tree can take another cell if a path leads to it from a notSet cell that can be given up in exchange
+    canMove = ReachableNodes(successors, [treeCount + cell for (cell, tree) in enumerate(treeOfCell) if tree >= 0 and isNotSetCell[cell]])
+    components = StronglyConnectedComponents(successors)
+    isUsed = [tree >= 0 for tree in treeOfCell]
+    for (tree, cellsOfTree) in enumerate(cellsOfTrees):
+        for cell in cellsOfTree:
+            node = treeCount + cell
+            if components[tree] == components[node] or (canMove[tree] and canBeFreed[node]):
+                isUsed[cell] = True
+    isGrass = [not used for used in isUsed]
+    isTent = [treeOfCell[cell] >= 0 and not canBeFreed[treeCount + cell] for cell in range(len(treeOfCell))]
+    return (isGrass, isTent)
+
+def PairTreesWithCells(tentMap):
+    # Pair every tree with its own neighbouring tent or notSet cell, every tent being paired.
+    # Returns (cells, cellsOfTrees, cellOfTree, treeOfCell), with cells the flat indices of the cells next to a
+    # tree and the rest in indices of cells, or None if there is no such pairing.
+    tentMask = tentMap.tentMask()
+    (cells, cellsOfTrees) = TreeCellGraph(tentMap, tentMask | tentMap.notSetMask())
+    pairing = PairTreeGraph(cellsOfTrees, tentMask.ravel()[cells].tolist(), tentMap.rowTentCounts.sum())
+    return None if pairing is None else (cells, ) + pairing
+
+def PairTreeGraph(cellsOfTrees, isTentCell, tentCount):
+    # (cellsOfTrees, cellOfTree, treeOfCell) pairing every tree with one of its cells and every tent cell with a
+    # tree, or None if there is no such pairing
+    (cellOfTree, treeOfCell) = HopcroftKarp([[cell for cell in cellsOfTree if isTentCell[cell]] for cellsOfTree in cellsOfTrees], len(isTentCell))
+    if sum(tree >= 0 for tree in treeOfCell) < tentCount:
+        return None
+    # augmenting paths never unpair a cell, so every tent stays paired
+    (cellOfTree, treeOfCell) = HopcroftKarp(cellsOfTrees, len(isTentCell), treeOfCell)
+    if -1 in cellOfTree:
+        return None
+    return (cellsOfTrees, cellOfTree, treeOfCell)
+
+def TreeCellGraph(tentMap, cellMask): # (flat indices of the cells of cellMask next to a tree, indices into them of the cells next to every tree)
+    (rowCount, columnCount) = tentMap.shape
+    treeMask = tentMap.treeMask()
+    trees = np.flatnonzero(treeMask)
+    cells = np.flatnonzero(cellMask & OrthogonalMask(treeMask))
+    cellIndices = np.full(rowCount * columnCount, -1)
+    cellIndices[cells] = np.arange(len(cells))
+    (rows, columns) = np.divmod(trees, columnCount)
+    neighbours = []
+    for (rowOffset, columnOffset) in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        (neighbourRows, neighbourColumns) = (rows + rowOffset, columns + columnOffset)
+        isInside = (neighbourRows >= 0) & (neighbourRows < rowCount) & (neighbourColumns >= 0) & (neighbourColumns < columnCount)
+        neighbours.append(np.where(isInside, cellIndices[np.where(isInside, neighbourRows * columnCount + neighbourColumns, 0)], -1))
+    cellsOfTrees = [[cell for cell in treeNeighbours if cell >= 0] for treeNeighbours in np.stack(neighbours, axis=1).tolist()]
+    return (cells, cellsOfTrees)
+
+def HopcroftKarp(cellsOfTrees, cellCount, treeOfCell=None): # maximum matching grown from treeOfCell, returns (cellOfTree, treeOfCell) with -1 for unpaired
+    treeOfCell = [-1] * cellCount if treeOfCell is None else list(treeOfCell)
+    cellOfTree = [-1] * len(cellsOfTrees)
+    for (cell, tree) in enumerate(treeOfCell):
+        if tree >= 0:
+            cellOfTree[tree] = cell
+    while True:
+        # layer the trees by the length of the shortest alternating path from an unpaired tree
+        layers = [0 if cell < 0 else -1 for cell in cellOfTree]
+        queue = [tree for (tree, cell) in enumerate(cellOfTree) if cell < 0]
+        hasFreeCell = False
+        for tree in queue:
+            for cell in cellsOfTrees[tree]:
+                owner = treeOfCell[cell]
+                if owner < 0:
+                    hasFreeCell = True
+                elif layers[owner] < 0:
+                    layers[owner] = layers[tree] + 1
+                    queue.append(owner)
+        if not hasFreeCell:
+            return (cellOfTree, treeOfCell)
+        # augment along disjoint paths that go one layer deeper at every step
+        nextEdges = [0] * len(cellsOfTrees)
+        for root in range(len(cellsOfTrees)):
+            if cellOfTree[root] >= 0:
+                continue
+            pathTrees = [root]
+            pathCells = []
+            while pathTrees:
+                tree = pathTrees[-1]
+                if nextEdges[tree] == len(cellsOfTrees[tree]):
+                    layers[tree] = -1 # dead end, never visit again in this phase
+                    pathTrees.pop()
+                    if pathCells:
+                        pathCells.pop()
+                    continue
+                cell = cellsOfTrees[tree][nextEdges[tree]]
+                nextEdges[tree] += 1
+                owner = treeOfCell[cell]
+                if owner < 0:
+                    pathCells.append(cell)
+                    for (pathTree, pathCell) in zip(pathTrees, pathCells):
+                        cellOfTree[pathTree] = pathCell
+                        treeOfCell[pathCell] = pathTree
+                    break
+                if layers[owner] == layers[tree] + 1:
+                    pathTrees.append(owner)
+                    pathCells.append(cell)
+
+def ReachableNodes(successors, starts): # [True for every node reachable from starts]
+    isReached = [False] * len(successors)
+    stack = list(starts)
+    for node in stack:
+        isReached[node] = True
+    while stack:
+        for successor in successors[stack.pop()]:
+            if not isReached[successor]:
+                isReached[successor] = True
+                stack.append(successor)
+    return isReached
+
+def StronglyConnectedComponents(successors): # component number of every node, iterative Tarjan
+    nodeCount = len(successors)
+    indices = [-1] * nodeCount
+    lowLinks = [0] * nodeCount
+    components = [-1] * nodeCount
+    stack = []
+    index = 0
+    componentCount = 0
+    for root in range(nodeCount):
+        if indices[root] >= 0:
+            continue
+        work = [(root, 0)]
+        while work:
+            (node, edge) = work.pop()
+            if edge == 0:
+                indices[node] = lowLinks[node] = index
+                index += 1
+                stack.append(node)
+            nodeSuccessors = successors[node]
+            while edge < len(nodeSuccessors):
+                successor = nodeSuccessors[edge]
+                edge += 1
+                if indices[successor] < 0:
+                    work.append((node, edge))
+                    work.append((successor, 0))
+                    break
+                if components[successor] < 0: # still on the stack
+                    lowLinks[node] = min(lowLinks[node], indices[successor])
+            else:
+                if lowLinks[node] == indices[node]:
+                    while True:
+                        member = stack.pop()
+                        components[member] = componentCount
+                        if member == node:
+                            break
+                    componentCount += 1
+                if work:
+                    parent = work[-1][0]
+                    lowLinks[parent] = min(lowLinks[parent], lowLinks[node])
+    return components
+
+def checkIsConsistent(tentMap, topHints, leftHints): # False once the map can no longer lead to a solution
+    topHints = np.asarray(topHints)
+    leftHints = np.asarray(leftHints)
+    # checkIsValid expects the hints of a map without its tents, like the simplified map of solve()
+    (isValid, errorMessage) = checkIsValid(tentMap, topHints - tentMap.columnTentCounts, leftHints - tentMap.rowTentCounts)
+    if not isValid:
+        return False
+    treeMask = tentMap.treeMask()
+    tentMask = tentMap.tentMask()
+    if (tentMask & DilateMask(tentMask)).any(): # touching tents
+        return False
+    if (tentMask & ~OrthogonalMask(treeMask)).any(): # tent without a tree
+        return False
+    if (treeMask & ~OrthogonalMask(tentMask | tentMap.notSetMask())).any(): # tree without a cell for its tent
+        return False
+    if any(placements is None for (line, neighbours, placements) in SolvedLines(tentMap, topHints, leftHints)):
+        return False # no placement of the hint fits in a line
+    return int(leftHints.sum()) == int(treeMask.sum())
+
+def HasTreeTentMatching(tentMap): # True if every tent can have its own tree and every tree its own tent or notSet cell
+    return PairTreesWithCells(tentMap) is not None
+
+def PropagateSearchNode(tentMap, topHints, leftHints): # apply the deduction rules until nothing changes, False on a contradiction
+    rules = [
+        lambda: SetGrassAroundTent(tentMap),
+        lambda: excludeLand(tentMap),
+        lambda: ExcludeLineCells(tentMap, topHints, leftHints),
+        lambda: PlaceExplicitTents(tentMap, topHints, leftHints),
+        lambda: ExcludeDiagonallyJointCell(tentMap, topHints, leftHints),
+        lambda: ExcludeCornerCell(tentMap),
+        lambda: PlaceTentNextToIsolatedsTree(tentMap),
+        lambda: MatchTreesAndTents(tentMap),
+        lambda: ExcludeImpossibleCell(tentMap),
+    ]
+    try:
+        isChanged = True
+        while isChanged:
+            if not checkIsConsistent(tentMap, topHints, leftHints):
+                return False
+            isChanged = any(rule() for rule in rules) # restart from the cheapest rule after every change
+    except NameError: # a rule tried to change a set cell
+        return False
+    return HasTreeTentMatching(tentMap)
+
+def ChooseSearchBranches(tentMap, topHints, leftHints): # the most constrained choice, as alternative lists of (row, column, type)
+    # a notSet cell of the line with the least room to spare for its tents, grass first since most cells are grass
+    (rowCount, columnCount) = tentMap.shape
+    notSetMask = tentMap.notSetMask()
+    cells = tentMap.cells
+    rowSlacks = [LineTentRange(LinePattern(cells[row]))[1] - leftHints[row] if tentMap.rowNotSetCounts[row] > 0 else columnCount
+                 for row in range(rowCount)]
+    columnSlacks = [LineTentRange(LinePattern(cells[:, column]))[1] - topHints[column] if tentMap.columnNotSetCounts[column] > 0 else rowCount
+                    for column in range(columnCount)]
+    if min(rowSlacks) <= min(columnSlacks):
+        row = int(np.argmin(rowSlacks))
+        column = int(np.flatnonzero(notSetMask[row])[0])
+    else:
+        column = int(np.argmin(columnSlacks))
+        row = int(np.flatnonzero(notSetMask[:, column])[0])
+    return [[(row, column, CellType.grass)], [(row, column, CellType.tent)]]
+
+def SearchSolutions(tentMap, topHints, leftHints, maxSolutions=1, nodeLimit=100000, timeLimit=None):
+    # Depth-first search from the current map, propagating the rules at every node and undoing changes through
+    # the map trail instead of copying it. Returns (solutions, isExhausted, nodeCount): the cells of up to
+    # maxSolutions solutions, and whether the whole search tree was explored. The map is left unchanged.
+    deadline = None if timeLimit is None else time.perf_counter() + timeLimit
+    solutions = []
+    nodeCount = 0
+    isExhausted = True
+    tentMap.startTrail()
+    rootMark = tentMap.trailMark()
+    stack = [(rootMark, iter([[]]))]
+    while stack:
+        (mark, branches) = stack[-1]
+        tentMap.undo(mark)
+        branch = next(branches, None)
+        if branch is None:
+            stack.pop()
+            continue
+        if nodeCount >= nodeLimit or (deadline is not None and time.perf_counter() > deadline):
+            isExhausted = False
+            break
+        nodeCount += 1
+        if not all(tentMap.trySetType(row, column, type) for (row, column, type) in branch):
+            continue
+        if not PropagateSearchNode(tentMap, topHints, leftHints):
+            continue
+        if tentMap.rowNotSetCounts.sum() == 0: # consistent and fully paired, so solved
+            solutions.append(tentMap.cells.copy())
+            if len(solutions) >= maxSolutions:
+                isExhausted = False
+                break
+            continue
+        stack.append((tentMap.trailMark(), iter(ChooseSearchBranches(tentMap, topHints, leftHints))))
+    tentMap.undo(rootMark)
+    tentMap.stopTrail()
+    return (solutions, isExhausted, nodeCount)
+
+def SearchAndLogStatus(treeMap, tentMap, topHints, leftHints, prevState, result, stepCount, history, nodeLimit, timeLimit):
+    startTime = time.perf_counter()
+    (solutions, isExhausted, nodeCount) = SearchSolutions(tentMap, topHints, leftHints, 1, nodeLimit, timeLimit)
+    if not solutions and isExhausted:
+        # the rules of solve() do not hold on every map and can end in an invalid one, so search again from the trees alone
+        timeLeft = None if timeLimit is None else max(0, timeLimit - (time.perf_counter() - startTime))
+        (solutions, isExhausted, moreNodeCount) = SearchSolutions(TentMap.fromTreeMap(treeMap), topHints, leftHints, 1, nodeLimit - nodeCount, timeLeft)
+        nodeCount += moreNodeCount
+    if solutions:
+        tentMap.forceSetCells(solutions[0])
+        # not through logStatus: checkIsValid takes a line with more than half of its cells as tents for an invalid one
+        result.append(MapSnapshot(None, tentMap, False, checkIsSolved(tentMap, topHints, leftHints), "complete the map by backtracking search (" + str(nodeCount) + " nodes)", history))
+    elif isExhausted:
+        result.append(MapSnapshot(None, None, False, False, "backtracking search found no solution"))
+    else:
+        result.append(MapSnapshot(None, None, False, False, "backtracking search stopped after " + str(nodeCount) + " nodes"))
+
+def SolveWithSatAndLogStatus(tentMap, topHints, leftHints, result, history, timeLimit):
+    (status, tentMask) = SolveTents(tentMap.treeMask(), topHints, leftHints, timeLimit=timeLimit)
+    if status == "solved":
+        tentMap.trySetMask(tentMask, CellType.tent)
+        tentMap.trySetMask(tentMap.notSetMask(), CellType.grass)
+        result.append(MapSnapshot(None, tentMap, False, checkIsSolved(tentMap, topHints, leftHints), "solve with the SAT engine", history))
+    elif status == "unsolvable":
+        result.append(MapSnapshot(None, None, False, False, "the SAT engine found no solution"))
+    else:
+        result.append(MapSnapshot(None, None, False, False, "the SAT engine stopped at its time limit"))
+
+def solve(treeMap, topHints, leftHints, search=False, nodeLimit=100000, timeLimit=None, engine="rules", profile=None):
+    # With search=True, a map the rules cannot finish is completed by SearchSolutions, within nodeLimit
+    # search nodes and timeLimit seconds.
+    # With engine="sat", the map is encoded to CNF and solved by SatSolver in one step instead, within timeLimit seconds.
+    # With a profile (a RuleProfile or another object with its record method), every rule call is timed into it.
+    # With engine="bitboard", the rules run on the row bitsets of BitboardSolver instead, with the same steps.
+    if engine not in ("rules", "sat", "bitboard"):
+        raise ValueError("unknown engine: " + str(engine))
+    if engine == "bitboard":
+        import BitboardSolver # builds on the rules of this module, so it is imported when first used
+        return BitboardSolver.solve(treeMap, topHints, leftHints, search, nodeLimit, timeLimit, profile)
+
+    logger.debug("Here Solve function")
     (rowCount, columnCount) = treeMap.shape
     # print(rowCount, columnCount)
 
     result = []
-    tentMap = np.empty((rowCount, columnCount), dtype=object) 
-    
-    for row in range(rowCount):
-        for column in range(columnCount):
-            tentMap[row][column] = Cell(row, column)
-    for row in range(rowCount):
-        for column in range(columnCount):
-            if treeMap[row][column] and tentMap[row][column].isNotSet:
-                tentMap[row][column].setType(CellType.tree)
+    tentMap = TentMap.fromTreeMap(treeMap)
     (isValid, errorMessage) = checkIsValid(tentMap, topHints, leftHints)
 
     if not isValid:
         result.append("<br>: " + errorMessage)
         return result
 
-    result.append(MapSnapshot([], tentMap, isValid, False, "input"))
+    history = MapHistory()
+    result.append(MapSnapshot([], tentMap, isValid, False, "input", history))
+    if engine == "sat":
+        RunRule(profile, "SAT engine", tentMap, SolveWithSatAndLogStatus, tentMap, topHints, leftHints, result, history, timeLimit)
+        return result
     stepCount = 1
-    prevState = toHtml(tentMap)
+    prevState = tentMap.version
 
-    RemoveZeroColumnRow(tentMap, topHints, leftHints) #well done
-    (prevState, stepCount, canContinue, canReturn) = logStatus(tentMap, topHints, leftHints, prevState, result, stepCount, "ignore zero columns and rows")
+    RunRule(profile, "ignore zero columns and rows", tentMap, RemoveZeroColumnRow, tentMap, topHints, leftHints) #well done
+    (prevState, stepCount, canContinue, canReturn) = logStatus(tentMap, topHints, leftHints, prevState, result, stepCount, "ignore zero columns and rows", history)
 
-    print("----------ignore zero columns and rows------> ", stepCount)
+    logger.debug("----------ignore zero columns and rows------> %s", stepCount)
     seePresentState(tentMap)
 
     if canReturn:
@@ -897,141 +1197,60 @@ def solve(treeMap, topHints, leftHints):
 
     # circulation process
     # step:
-    # first RemoveAssociatedTrenAndTents
+    # first RemoveAssociatedTrenAndTents, then run the rules in order; the first one that changes the map is logged
+    # and the loop starts again. A rule only looks again where cells changed since it last ran (DirtyRegions).
+    rules = [
+        (lambda region: excludeLand(simplifiedMap), "exclude open land (no adjacent tree)", False),
+        (lambda region: PlaceExplicitTents(simplifiedMap, simplifiedTopHints, simplifiedLeftHints, region), "fill in tents based on hints", True),
+        (lambda region: MatchTreesAndTents(simplifiedMap), "pair trees with tents", True),
+        (lambda region: PlaceTentNextToIsolatedsTree(simplifiedMap, region), "fill in tents next to isolated trees", True),
+        (lambda region: ExcludeLineCells(simplifiedMap, simplifiedTopHints, simplifiedLeftHints, region), "exclude cells the hints leave no tent for", True),
+        (lambda region: ExcludeDiagonallyJointCell(simplifiedMap, simplifiedTopHints, simplifiedLeftHints, region), "exclude diagonally joint cells", True),
+        (lambda region: ExcludeCornerCell(simplifiedMap), "exclude corner cell", True),
+        (lambda region: ExcludeImpossibleCell(simplifiedMap, region), "exclude impossible cells", True),
+    ]
+    removeRule = len(rules)
+    dirtyRegions = DirtyRegions(simplifiedMap, len(rules) + 1)
     k = 0
     while isValid:
         k += 1
         CopySetCells(simplifiedMap, tentMap)
-        print("-----while start", k)
+        logger.debug("-----while start %s", k)
         seePresentState(tentMap)
         seePresentState(simplifiedMap)
-        isRemoved = RemoveAssociatedTreesAndTents(simplifiedMap, simplifiedTopHints, simplifiedLeftHints)
+        region = dirtyRegions.take(removeRule)
+        isRemoved = region is not None and RunRule(profile, "Remove associated trees and tents", simplifiedMap, RemoveAssociatedTreesAndTents, simplifiedMap, simplifiedTopHints, simplifiedLeftHints, region)
         if isRemoved:
 
-            print("--------RemoveAssociatedTreesAndTents -> ", isRemoved)
+            logger.debug("--------RemoveAssociatedTreesAndTents -> %s", isRemoved)
             # seePresentState(simplifiedMap)
 
             result.append(MapSnapshot(None, None, False, False, "Remove associated trees and tents"))
 
-        isChanged = excludeLand(simplifiedMap)
-        if isChanged:
-
-            CopySetCells(tentMap, simplifiedMap)
-            # SetGrassAroundTent(simplifiedMap)
-
-            (prevState, stepCount, canContinue, canReturn) = logStatus(tentMap, topHints, leftHints, prevState, result, stepCount, "exclude open land (no adjacent tree)")
-
-            print("-----exclude open land (no adjacent tree)---->")
-            seePresentState(tentMap)
-
-            if canReturn:
-                break
-            if canContinue:
-                continue
-
-        isChanged = PlaceExplicitTents(simplifiedMap, simplifiedTopHints, simplifiedLeftHints)
-        if isChanged:
-            CopySetCells(tentMap, simplifiedMap)
-            SetGrassAroundTent(tentMap)
-
-            (prevState, stepCount, canContinue, canReturn) = logStatus(tentMap, topHints, leftHints, prevState, result, stepCount, "fill in tents based on hints")
-
-            print("--------fill in tents based on hints")
-            seePresentState(tentMap)
-
-            if canReturn:
-                break
-            if canContinue:
-                continue
-
-        isChanged = PlaceTentNextToIsolatedsTree(simplifiedMap)
-        if isChanged:
-
-            CopySetCells(tentMap, simplifiedMap)
-            SetGrassAroundTent(tentMap)
-
-            print("---------PlaceTentNextToIsolatedTree")
-            seePresentState(tentMap)
-
-            (prevState, stepCount, canContinue, canReturn) = logStatus(tentMap, topHints, leftHints, prevState, result, stepCount, "fill in tents next to isolated trees")
-
-            if canReturn:
-                break
-            if canContinue:
-                continue
-
-        isChanged = PlaceDeducedTents(simplifiedMap, simplifiedTopHints, simplifiedLeftHints)
-        if isChanged:
-
-            CopySetCells(tentMap, simplifiedMap)
-            SetGrassAroundTent(tentMap)
-
-            print("-----fill in tents based on hints and deduction---->")
-            seePresentState(tentMap)
-
-            (prevState, stepCount, canContinue, canReturn) = logStatus(tentMap, topHints, leftHints, prevState, result, stepCount, "fill in tents based on hints and deduction")
-            if canReturn:
-                break
-            if canContinue:
+        canContinue = False
+        canReturn = False
+        for (ruleIndex, (rule, description, setGrassAroundTent)) in enumerate(rules):
+            region = dirtyRegions.take(ruleIndex)
+            if region is None or not RunRule(profile, description, simplifiedMap, rule, region):
                 continue
 
-        isChanged = ExcludeFullyFilledLine(simplifiedMap, simplifiedTopHints, simplifiedLeftHints)
-        if isChanged:
-
             CopySetCells(tentMap, simplifiedMap)
-            SetGrassAroundTent(tentMap)
+            if setGrassAroundTent:
+                RunRule(profile, "set grass around tents", tentMap, SetGrassAroundTent, tentMap)
 
-            print("-----exclude fully filled lines---->")
+            logger.debug("-----%s---->", description)
             seePresentState(tentMap)
 
-            (prevState, stepCount, canContinue, canReturn) = logStatus(tentMap, topHints, leftHints, prevState, result, stepCount, "exclude fully filled lines")
-            if canReturn:
+            (prevState, stepCount, canContinue, canReturn) = logStatus(tentMap, topHints, leftHints, prevState, result, stepCount, description, history)
+            if canReturn or canContinue:
                 break
-            if canContinue:
-                continue
-        isChanged = ExcludeDiagonallyJointCell(simplifiedMap, simplifiedTopHints, simplifiedLeftHints)
-        if isChanged:
-            CopySetCells(tentMap, simplifiedMap)
-            SetGrassAroundTent(tentMap)
-
-            print("-----exclude diagonally joint cells---->")
-            seePresentState(tentMap)
+        if not canContinue:
+            break
 
-            (prevState, stepCount, canContinue, canReturn) = logStatus(tentMap, topHints, leftHints, prevState, result, stepCount, "exclude diagonally joint cells")
-            if canReturn:
-                break
-            if canContinue:
-                continue
-        isChanged = ExcludeCornerCell(simplifiedMap)
-        if isChanged:
-            CopySetCells(tentMap, simplifiedMap)
-            SetGrassAroundTent(tentMap)
-
-            print("-----exclude corner cell---->")
-            seePresentState(tentMap)
-
-            (prevState, stepCount, canContinue, canReturn) = logStatus(tentMap, topHints, leftHints, prevState, result, stepCount, "exclude corner cell")
-            if canReturn:
-                break
-            if canContinue:
-                continue
-        isChanged = ExcludeImpossibleCell(simplifiedMap)
-        if isChanged:
-
-            CopySetCells(tentMap, simplifiedMap)
-            SetGrassAroundTent(tentMap)
-
-            print("exclude impossible cells>")
-            seePresentState(tentMap)
-
-            (prevState, stepCount, canContinue, canReturn) = logStatus(tentMap, topHints, leftHints, prevState, result, stepCount, "exclude impossible cells")
-            if canReturn:
-                break
-            if canContinue:
-                continue
-        break
+    if search and not result[-1].isSolved:
+        RunRule(profile, "backtracking search", tentMap, SearchAndLogStatus, treeMap, tentMap, topHints, leftHints, prevState, result, stepCount, history, nodeLimit, timeLimit)
 
-    print("--------last------->")
+    logger.debug("--------last------->")
     seePresentState(tentMap)
 
     return result
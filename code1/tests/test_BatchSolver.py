@@ -0,0 +1,38 @@
+import BatchSolver
+from BatchSolver import SolvePuzzle
+from Benchmark import RandomPuzzle
+from Generator import FormatPuzzle
+from SolveCache import PersistentSolveCache
+from Solver import solve
+
+
+def _stalledPuzzleFile(tmp_path):
+    # a planted board whose solution is not unique, so the rules stall and only the search can finish it
+    puzzle = RandomPuzzle(12, 0)
+    assert not solve(*puzzle)[-1].isSolved
+    fileName = tmp_path / "input0.txt"
+    fileName.write_text(FormatPuzzle(*puzzle))
+    return str(fileName)
+
+def test_search_stopped_by_its_time_limit_is_a_timeout(tmp_path, monkeypatch):
+    fileName = _stalledPuzzleFile(tmp_path)
+    monkeypatch.setattr(BatchSolver, "searchTimeShare", 0) # the search stops at once, long before the alarm
+    record = SolvePuzzle(fileName, timeout=60, search=True)
+    assert record["status"] == "timeout"
+    assert record["message"].startswith("backtracking search stopped after")
+
+def test_alarm_is_a_timeout(tmp_path):
+    fileName = _stalledPuzzleFile(tmp_path)
+    for _ in range(3):
+        record = SolvePuzzle(fileName, timeout=0.001, search=True)
+        assert record["status"] == "timeout"
+
+def test_timed_out_search_is_not_cached(tmp_path, monkeypatch):
+    fileName = _stalledPuzzleFile(tmp_path)
+    cacheFile = str(tmp_path / "cache.sqlite")
+    monkeypatch.setattr(BatchSolver, "searchTimeShare", 0)
+    assert SolvePuzzle(fileName, timeout=60, search=True, cacheFile=cacheFile)["status"] == "timeout"
+    BatchSolver.OpenSolveCache.cache_clear()
+    assert len(PersistentSolveCache(cacheFile)) == 0
+    monkeypatch.setattr(BatchSolver, "searchTimeShare", 0.9)
+    assert SolvePuzzle(fileName, timeout=60, search=True, cacheFile=cacheFile)["status"] == "solved"
@@ -0,0 +1,43 @@
+import time
+import numpy as np
+import pytest
+
+from Generator import GeneratePuzzle, GeneratePuzzleTexts
+from PuzzleParser import ParsePuzzles
+from Solver import TentMap, SearchSolutions, const_cellType_tent
+
+
+def _searchTwo(treeMap, topHints, leftHints): # (solutions, isExhausted, nodeCount) of the rules engine search
+    return SearchSolutions(TentMap.fromTreeMap(treeMap), topHints, leftHints, 2, 100000)
+
+def test_large_board_is_unique_and_quick():
+    startTime = time.perf_counter()
+    (treeMap, topHints, leftHints, tentMask) = GeneratePuzzle(30, 30, seed=1)
+    assert time.perf_counter() - startTime < 20
+    (solutions, isExhausted, nodeCount) = _searchTwo(treeMap, topHints, leftHints)
+    assert isExhausted and len(solutions) == 1
+    assert np.array_equal(solutions[0] == const_cellType_tent, tentMask)
+
+def test_same_seed_gives_same_puzzle():
+    first = GeneratePuzzle(12, 15, seed=[4, 2])
+    second = GeneratePuzzle(12, 15, seed=[4, 2])
+    assert all(np.array_equal(a, b) for (a, b) in zip(first, second))
+
+def test_easy_puzzles_need_no_search():
+    for text in GeneratePuzzleTexts(3, 10, 10, seed=2, difficulty="easy"):
+        for (treeMap, topHints, leftHints) in ParsePuzzles(text):
+            (solutions, isExhausted, nodeCount) = _searchTwo(treeMap, topHints, leftHints)
+            assert isExhausted and len(solutions) == 1 and nodeCount == 1
+
+def test_small_hard_puzzles_move_on_to_new_seeds():
+    # most 6x6 seeds have no hard puzzle; their retries must still give one per request
+    texts = list(GeneratePuzzleTexts(2, 6, 6, seed=0, difficulty="hard"))
+    assert len(texts) == 2
+    for text in texts:
+        (treeMap, topHints, leftHints) = next(ParsePuzzles(text))
+        (solutions, isExhausted, nodeCount) = _searchTwo(treeMap, topHints, leftHints)
+        assert isExhausted and len(solutions) == 1 and nodeCount > 1
+
+def test_hard_request_raises_once_its_seeds_are_used_up():
+    with pytest.raises(RuntimeError):
+        list(GeneratePuzzleTexts(1, 4, 4, difficulty="hard", maxSeeds=3))